@@ -1,2 +1,9 @@
 """Wrapper for the source code files"""
-from .main import *
+from .complete import get_completion_argument
+
+# Shell completion runs at each Tab key,
+# so the rest of the program is only loaded by it when the completions file is out of date:
+if get_completion_argument() is None:
+    from .main import *
+else:
+    from .complete import main
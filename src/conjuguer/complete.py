@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+""" conjuguer - conjugaison des verbes francais
+Shell completion from the completions file, without the imports and initializations of the program:
+    conjuguer --complete PREFIX
+License: 3-clause BSD (see https://opensource.org/licenses/BSD-3-Clause)
+Author: Hubert Tournier
+"""
+
+import bisect
+import json
+import os
+import sys
+import unicodedata
+
+# Shell completions file, in the cache directory,
+# made of a header line giving what it depends on, then of sorted "normalized\tlemma" lines:
+COMPLETIONS_HEADER = "#conjuguer-completions"
+COMPLETIONS_FILE = "conjuguer_completions"
+
+
+################################################################################
+def normalize_verb(verb):
+    """Return a verb in lower case and without accents"""
+    # Removing accents also covers the 1990 spelling reform (î and û becoming i and u):
+    decomposed_verb = unicodedata.normalize("NFD", unicodedata.normalize("NFC", verb).casefold())
+    return "".join([char for char in decomposed_verb if not unicodedata.combining(char)])
+
+
+################################################################################
+def get_default_cache_directory():
+    """Return the cache directory used when none is given"""
+    if "XDG_CACHE_HOME" in os.environ.keys():
+        return os.environ["XDG_CACHE_HOME"] + os.sep + "conjuguer"
+    if os.name == "nt" and "LOCALAPPDATA" in os.environ.keys():
+        return os.environ["LOCALAPPDATA"] + os.sep + "conjuguer"
+    if "HOME" in os.environ.keys():
+        return os.environ["HOME"] + os.sep + ".cache" + os.sep + "conjuguer"
+
+    return ""
+
+
+################################################################################
+def get_default_dictionary_directories():
+    """Return the existing directories where dictionaries are searched without DICTPATH"""
+    directories = []
+    if os.name == "posix":
+        if os.path.isdir("/usr/share/dict"):
+            directories.append("/usr/share/dict")
+        if os.path.isdir("/usr/local/share/dict"):
+            directories.append("/usr/local/share/dict")
+        if "HOME" in os.environ.keys():
+            home = os.environ["HOME"]
+            if os.path.isdir(home + os.sep + ".local/share/dict"):
+                directories.append(home + os.sep + ".local/share/dict")
+
+    elif os.name == "nt":
+        appdata_path = os.sep + "appdata" + os.sep + "roaming"
+        pnu_dictpath = os.sep + "python" + os.sep + "share" + os.sep + "dict"
+        if os.environ["APPDATA"]:
+            pnu_dictpath = os.environ["APPDATA"] + pnu_dictpath
+        elif os.environ["HOMEPATH"]:
+            pnu_dictpath = os.environ["HOMEPATH"] + appdata_path + pnu_dictpath
+        elif os.environ["USERPROFILE"]:
+            pnu_dictpath = os.environ["USERPROFILE"] + appdata_path + pnu_dictpath
+        if os.path.isdir(pnu_dictpath):
+            directories.append(pnu_dictpath)
+
+        pnu_dictpath2 = sys.base_prefix + os.sep + "share" + os.sep + "dict"
+        if os.path.isdir(pnu_dictpath2):
+            directories.append(pnu_dictpath2)
+
+    return directories
+
+
+################################################################################
+def get_completion_argument():
+    """Return the prefix of a "conjuguer --complete PREFIX" command line, or None"""
+    if len(sys.argv) == 3 and sys.argv[1] == "--complete":
+        return sys.argv[2]
+    if len(sys.argv) == 2 and sys.argv[1].startswith("--complete="):
+        return sys.argv[1][len("--complete="):]
+
+    return None
+
+
+################################################################################
+def get_completions_path(cache_directory):
+    """Return the pathname of the shell completions file, or None without a cache directory"""
+    if cache_directory:
+        return cache_directory + os.sep + COMPLETIONS_FILE
+    return None
+
+
+################################################################################
+def get_completions_key(pathnames):
+    """Return what the completions of some dictionaries depend on"""
+    # The default dictionaries are searched in these directories,
+    # whose modification time changes when a dictionary is added, removed or renamed:
+    if "DICTPATH" in os.environ.keys():
+        directories = os.environ["DICTPATH"].split(os.pathsep)
+    else:
+        directories = get_default_dictionary_directories()
+    key = [os.environ.get("CONJUGUER_DICT"), []]
+    for directory in directories:
+        try:
+            key[1].append([os.path.abspath(directory), os.stat(directory).st_mtime])
+        except OSError:
+            key[1].append([os.path.abspath(directory), None])
+    for pathname in pathnames:
+        status = os.stat(pathname)
+        key.append([os.path.abspath(pathname), status.st_size, status.st_mtime])
+
+    return key
+
+
+################################################################################
+def load_completions(pathname):
+    """Return the sorted lines of an up to date completions file, or None"""
+    if not pathname:
+        return None
+    try:
+        with open(pathname, "rb") as file:
+            header = file.readline()
+            completions = file.read()
+    except OSError:
+        return None
+    if not header.startswith(COMPLETIONS_HEADER.encode("utf-8") + b" "):
+        return None
+
+    # The dictionaries listed are just checked, without searching them in the DICTPATH:
+    try:
+        key = json.loads(header[len(COMPLETIONS_HEADER) + 1:].decode("utf-8"))
+        if key != get_completions_key([dictionary[0] for dictionary in key[2:]]):
+            return None
+    except (ValueError, TypeError, IndexError, OSError):
+        return None
+
+    return completions.splitlines()
+
+
+################################################################################
+def print_completions(prefix, completions):
+    """Print the lemmas starting with a prefix, from the sorted lines of a completions file,
+    or else those starting with it whatever its case and accents"""
+    normalized_prefix = normalize_verb(prefix).encode("utf-8", "surrogateescape")
+    lemmas = []
+    i = bisect.bisect_left(completions, normalized_prefix)
+    while i < len(completions) and completions[i].startswith(normalized_prefix):
+        lemmas.append(completions[i].split(b"\t", 1)[1])
+        i += 1
+
+    composed_prefix = unicodedata.normalize("NFC", prefix).encode("utf-8", "surrogateescape")
+    exact_lemmas = [lemma for lemma in lemmas if lemma.startswith(composed_prefix)]
+    output = b"".join([lemma + b"\n" for lemma in exact_lemmas or lemmas])
+    if hasattr(sys.stdout, "buffer"):
+        sys.stdout.buffer.write(output)
+    else:
+        sys.stdout.write(output.decode("utf-8"))
+
+
+################################################################################
+def print_cached_completions():
+    """Print the completions of a "conjuguer --complete PREFIX" command line
+    and return True if the completions file is up to date, or else return False"""
+    prefix = get_completion_argument()
+    if prefix is None:
+        return False
+
+    cache_directory = os.environ.get("CONJUGUER_CACHE") or get_default_cache_directory()
+    completions = load_completions(get_completions_path(cache_directory))
+    if completions is None:
+        return False
+
+    print_completions(prefix, completions)
+    return True
+
+
+################################################################################
+def main():
+    """The program's entry point for shell completion, loading the whole program if needed"""
+    if print_cached_completions():
+        sys.exit(0)
+
+    # The rest of the program is only imported here, as its imports and initializations
+    # would otherwise be paid at each Tab key:
+    from .main import main as conjuguer_main
+
+    conjuguer_main()
@@ -4,21 +4,54 @@ License: 3-clause BSD (see https://opensource.org/licenses/BSD-3-Clause)
 Author: Hubert Tournier
 """
 
+import array
+import bisect
+import builtins
+import bz2
 import collections
-import copy
+import contextlib
+import csv
 import getopt
 import gettext
+import gzip
+import hashlib
+import html
+import io
+import json
 import locale
 import logging
+import multiprocessing
 import os
+import pickle
 import re
 import sys
 import time
+import unicodedata
+import urllib.parse
+import zlib
+
+try:
+    import lzma
+except ImportError:
+    # Python can be built without the xz library:
+    lzma = None
 
 import colorama
 
+from .complete import (
+    COMPLETIONS_HEADER,
+    get_completion_argument,
+    get_completions_key,
+    get_completions_path,
+    get_default_cache_directory,
+    get_default_dictionary_directories,
+    normalize_verb,
+    print_cached_completions,
+    print_completions,
+)
 from .verbs import aux, etre_aux, both_aux, patterns
 from .blank import blank_verb
+from .models import models
 
 # Version string used by the what(1) and ident(1) commands:
 ID = "@(#) $Id: conjuguer - conjugaison des verbes Français v0.5.1 (October 10, 2021) by Hubert Tournier $"
@@ -31,7 +64,30 @@ parameters = {
     "Display columns": 4,
     "DELA output": False,
     "ABU output": False,
+    "Generated conjugations": False,
+    "Guessed conjugations": False,
+    "Lexicon path": "",
+    "Comparison path": "",
+    "Audit path": "",
+    "Query": "",
+    "Query tables": False,
+    "Statistics": False,
+    "Existence check": False,
+    "Cell mode": "",
+    "Cell tense": "",
+    "Cell person": "",
+    "Cell number": "",
+    "Merge dictionaries": False,
+    "Dictionaries": [],
+    "Cache directory": "",
+    "Parallel jobs": 1,
     "DictPath": [],
+    "Language": "",
+    "Site directory": "",
+    "Export path": "",
+    "Coprocess": False,
+    "Interactive": False,
+    "Completion prefix": None,
 }
 
 # Display constants:
@@ -45,11 +101,260 @@ EMPTY_CONJUGATION = "-"
 BLANK_LINES=True
 COLUMN_SPACES = "    "
 
+# Compound tenses are made of the auxiliary conjugated at the matching simple tense:
+COMPOUND_TENSES = [
+    ["Indicatif", "Présent", "Passé composé"],
+    ["Indicatif", "Imparfait", "Plus-que-parfait"],
+    ["Indicatif", "Passé simple", "Passé antérieur"],
+    ["Indicatif", "Futur simple", "Futur antérieur"],
+    ["Conditionnel", "Présent", "Passé"],
+    ["Subjonctif", "Présent", "Passé"],
+    ["Subjonctif", "Imparfait", "Plus-que-parfait"],
+    ["Impératif", "Présent", "Passé"],
+]
+
+# Simple tenses DELA inflection codes, as used in conjugation models:
+SIMPLE_TENSES = {
+    "P": ["Indicatif", "Présent"],
+    "I": ["Indicatif", "Imparfait"],
+    "J": ["Indicatif", "Passé simple"],
+    "F": ["Indicatif", "Futur simple"],
+    "C": ["Conditionnel", "Présent"],
+    "S": ["Subjonctif", "Présent"],
+    "T": ["Subjonctif", "Imparfait"],
+}
+
+# ABU tenses codes matching the DELA ones:
+ABU_TENSES = {
+    "P": "IPre",
+    "I": "IImp",
+    "J": "IPSim",
+    "F": "IFut",
+    "C": "CPre",
+    "S": "SPre",
+    "T": "SImp",
+}
+
+# Inflections are decoded once into packed integers, made of these bitfields:
+# tense (from bit 6), person (bits 4-5), number (bits 2-3) and gender (bits 0-1),
+# each one being an index in the following lists (0 standing for none):
+PACKED_TENSES = [
+    None,
+    ["Indicatif", "Présent"],
+    ["Indicatif", "Imparfait"],
+    ["Indicatif", "Passé simple"],
+    ["Indicatif", "Futur simple"],
+    ["Conditionnel", "Présent"],
+    ["Subjonctif", "Présent"],
+    ["Subjonctif", "Imparfait"],
+    ["Impératif", "Présent"],
+    ["Participe", "Présent"],
+    ["Participe", "Passé"],
+]
+PACKED_PERSONS = ["", "1", "2", "3"]
+PACKED_NUMBERS = ["", "s", "p"]
+PACKED_GENDERS = ["", "m", "f"]
+PACKED_PRESENT_PARTICIPLE = 9
+PACKED_PAST_PARTICIPLE = 10
+
+# DELA and ABU inflection codes matching the packed tenses:
+DELA_PACKED_TENSES = {
+    "P": 1, "I": 2, "J": 3, "F": 4, "C": 5, "S": 6, "T": 7, "Y": 8, "G": 9, "K": 10
+}
+ABU_PACKED_TENSES = {
+    "IPre": 1,
+    "IImp": 2,
+    "IPSim": 3,
+    "IFut": 4,
+    "CPre": 5,
+    "SPre": 6,
+    "SImp": 7,
+    "ImPre": 8,
+    "PPre": 9,
+    "PPas": 10,
+}
+
+# Lexicon files first line, followed by the type of dictionary lines they regenerate:
+LEXICON_HEADER = "#conjuguer-lexicon"
+LEXICON_INFINITIVES = {"DELA": "W", "ABU": "Inf"}
+
+# Dictionaries comparison report first line, followed by the compared dictionaries paths:
+COMPARISON_HEADER = "#conjuguer-comparison"
+
+# Model-conformance audit report first line, followed by the audited dictionary path:
+AUDIT_HEADER = "#conjuguer-audit"
+
+# Number of verbs of a same model audited together:
+AUDIT_BATCH_SIZE = 500
+
+# Suggestions for unknown verbs:
+SUGGESTIONS_MAX_DISTANCE = 2
+SUGGESTIONS_MAX_RESULTS = 5
+
 # Default dictionaries:
 AU_DELA = "dict-fr-AU-DELA"
 DELA = "dict-fr-DELA"
 ABU = "dict-fr-ABU-mots_communs"
 
+# Compressed dictionaries magic bytes, and the suffixes searched for default dictionaries:
+GZIP_MAGIC = b"\x1f\x8b"
+BZIP2_MAGIC = b"BZh"
+XZ_MAGIC = b"\xfd7zXZ\x00"
+COMPRESSED_SUFFIXES = ["", ".gz", ".xz", ".bz2"]
+
+# Size of the chunks read from compressed dictionaries:
+DECOMPRESSION_BUFFER_SIZE = 1024 * 1024
+
+# Number of parts of a dictionary indexed by each parallel process:
+PARALLEL_RANGES_PER_JOB = 4
+
+# Size of the line-aligned chunks searched for verbs lines,
+# and the regular expressions matching these lines, from the bytes present in each of them:
+FILTER_CHUNK_SIZE = 4 * 1024 * 1024
+VERB_LINE_REGEXES = {
+    "DELA": re.compile(rb"^[^\n]*\.V[^\n]*", re.MULTILINE),
+    "ABU": re.compile(rb"^[^\n]*\tVer:[^\n]*", re.MULTILINE),
+}
+
+# Cached verbs indexes are split in blocks of at least this size,
+# ending after a line whose CRC matches this mask, so that an edit only changes nearby blocks:
+INDEX_BLOCK_SIZE = 1024 * 1024
+INDEX_BLOCK_BOUNDARY_MASK = 0x3F
+INDEX_CACHE_VERSION = 3
+
+# Existence checks Bloom filter size per lemma and number of hash functions,
+# for a false positive rate of about 1%:
+BLOOM_FILTER_BITS_PER_LEMMA = 10
+BLOOM_FILTER_HASHES = 7
+
+# Maximum size of the rendered outputs kept in the cache directory:
+RENDER_CACHE_MAX_SIZE = 64 * 1024 * 1024
+
+# Static HTML site pages layout, in two halves (the 2 first and 2 last columns),
+# each one made of modes followed by their (simple tense, compound tense) pairs:
+SITE_LAYOUT = [
+    [
+        ["Indicatif", [
+            ["Présent", "Passé composé"],
+            ["Imparfait", "Plus-que-parfait"],
+            ["Passé simple", "Passé antérieur"],
+            ["Futur simple", "Futur antérieur"],
+        ]],
+        ["Conditionnel", [["Présent", "Passé"]]],
+    ],
+    [
+        ["Subjonctif", [["Présent", "Passé"], ["Imparfait", "Plus-que-parfait"]]],
+        ["Impératif", [["Présent", "Passé"]]],
+        ["Infinitif", [["Présent", "Passé"]]],
+        ["Participe", [["Présent", "Passé"]]],
+        ["Gérondif", [["Présent", "Passé"]]],
+    ],
+]
+SITE_STYLE = """body { font-family: sans-serif; }
+.conjugation { display: flex; flex-wrap: wrap; gap: 2em; }
+.conjugation th { text-align: left; padding-top: 1em; }
+.mode { text-transform: uppercase; color: green; }
+.tense { color: darkcyan; }
+.forms { font-family: monospace; white-space: pre; vertical-align: top; padding-right: 2em; }
+"""
+# File of a site directory giving the digest of the source of each page written:
+SITE_MANIFEST = ".conjuguer-site.pickle"
+
+# Paradigms export columns, and number of verbs exported at once:
+EXPORT_COLUMNS = [
+    "lemma", "auxiliary", "group", "model", "mode", "tense", "person", "number", "gender", "form"
+]
+EXPORT_BATCH_SIZE = 1024
+
+# Coprocess requests and interactive mode output formats,
+# with the ABU and DELA output parameters they set:
+OUTPUT_FORMATS = {
+    "text": (False, False),
+    "abu": (True, False),
+    "dela": (False, True),
+    "json": (False, False),
+}
+
+# Interactive mode prompt, and history file in the home directory:
+INTERACTIVE_PROMPT = "conjuguer> "
+INTERACTIVE_HISTORY = ".conjuguer_history"
+INTERACTIVE_HISTORY_LENGTH = 1000
+
+# Shell completion scripts:
+COMPLETION_OPTIONS = """--ABU --DELA --audit --cache --columns --compare --complete --completion \
+--coprocess --debug --dictionary --exists --export --generate --guess --help --interactive \
+--jobs --lexicon --locale --merge --mode --nocolor --number --person --site --stats --tables \
+--tense --version --where"""
+COMPLETION_SCRIPTS = {
+    "bash": """# conjuguer(1) completion for bash, to be sourced:
+_conjuguer()
+{
+    local cur=${COMP_WORDS[COMP_CWORD]}
+    local prev=${COMP_WORDS[COMP_CWORD-1]}
+    local IFS=$'\\n'
+
+    case "$prev" in
+    -d|--dictionary|--lexicon|--compare|--audit|--export)
+        COMPREPLY=($(compgen -f -- "$cur"))
+        return
+        ;;
+    --cache|--site)
+        COMPREPLY=($(compgen -d -- "$cur"))
+        return
+        ;;
+    -c|--columns|-j|--jobs|--locale|--where|--mode|--tense|--person|--number|--completion)
+        return
+        ;;
+    esac
+
+    if [[ $cur == -* ]]; then
+        IFS=$' \\n'
+        COMPREPLY=($(compgen -W "%s" -- "$cur"))
+    else
+        COMPREPLY=($(conjuguer --complete "$cur" 2>/dev/null))
+    fi
+}
+complete -F _conjuguer conjuguer
+""" % COMPLETION_OPTIONS.replace("\\\n", ""),
+    "zsh": """#compdef conjuguer
+# conjuguer(1) completion for zsh, to be saved as _conjuguer in a $fpath directory, or sourced:
+_conjuguer() {
+    local -a verbs
+
+    case $words[CURRENT-1] in
+    -d|--dictionary|--lexicon|--compare|--audit|--export)
+        _files
+        return
+        ;;
+    --cache|--site)
+        _files -/
+        return
+        ;;
+    -c|--columns|-j|--jobs|--locale|--where|--mode|--tense|--person|--number|--completion)
+        return
+        ;;
+    esac
+
+    if [[ $PREFIX == -* ]]; then
+        compadd -- %s
+    else
+        # The verbs may match the prefix whatever its case and accents:
+        verbs=(${(f)"$(conjuguer --complete "$PREFIX" 2>/dev/null)"})
+        compadd -U -- $verbs
+    fi
+}
+
+if [[ $funcstack[1] == _conjuguer ]]; then
+    _conjuguer "$@"
+else
+    compdef _conjuguer conjuguer
+fi
+""" % COMPLETION_OPTIONS.replace("\\\n", ""),
+}
+
+# Packed integers of the dictionaries inflections parts already decoded:
+packed_inflections = {"DELA": {}, "ABU": {}}
+
 
 ################################################################################
 def initialize_debugging(program_name):
@@ -60,8 +365,11 @@ def initialize_debugging(program_name):
 
 
 ################################################################################
-def initialize_internationalization(program_name, lang=locale.getdefaultlocale()[0][:2]):
+def initialize_internationalization(program_name, lang=None):
     """Internationalization set up"""
+    if lang is None:
+        lang = locale.getdefaultlocale()[0][:2]
+    parameters["Language"] = lang
     locale_dirs = []
 
     if os.name == "posix":
@@ -103,45 +411,203 @@ def initialize_internationalization(program_name, lang=locale.getdefaultlocale()
 ################################################################################
 def display_help():
     """Displays usage and help"""
-    print(_("usage: conjuguer [--debug] [--help|-?] [--locale LANG] [--version]"), file=sys.stderr)
     print(
-        "       "
-        + _("[-c|--columns NUMBER] [-n|--nocolor] [-A|--ABU] [-D|--DELA]"),
+        _("usage: conjuguer [-A|--ABU] [--audit PATH] [--cache DIR] [-c|--columns NUMBER]"),
+        file=sys.stderr
+    )
+    print(
+        "       " + _("[--compare PATH] [--complete PREFIX] [--completion SHELL] [--coprocess]"),
+        file=sys.stderr
+    )
+    print(
+        "       " + _("[--debug] [-D|--DELA] [-d|--dictionary PATH [-d|--dictionary PATH ...]]"),
+        file=sys.stderr
+    )
+    print(
+        "       " + _("[--exists] [--export PATH] [-g|--generate] [--guess] [--help|-?]"),
+        file=sys.stderr
+    )
+    print(
+        "       " + _("[-i|--interactive] [-j|--jobs NUM] [--lexicon PATH] [--locale LANG]"),
+        file=sys.stderr
+    )
+    print("       " + _("[-m|--merge] [--mode MODE] [-n|--nocolor] [--number NUMBER]"), file=sys.stderr)
+    print(
+        "       " + _("[--person PERSON] [--site DIR] [--stats] [--tense TENSE] [--version]"),
         file=sys.stderr
     )
-    print("       " + _("[-d|--dictionary PATH]"), file=sys.stderr)
+    print("       " + _("[--where QUERY [--tables]]"), file=sys.stderr)
     print("       " + _("[--] verb [...]"), file=sys.stderr)
     print(
         "  " + _("--------------------  -----------------------------------------------------"),
         file=sys.stderr
     )
+    print("  " + _("-A|--ABU              Enable ABU format output"), file=sys.stderr)
+    print(
+        "  " + _("--audit PATH          Report the dictionary verbs not following their model"),
+        file=sys.stderr
+    )
+    print(
+        "  " + _("--cache DIR           Keep the dictionaries verbs indexes in a directory"),
+        file=sys.stderr
+    )
     print(
         "  " + _("-c|--columns NUM      Choose number of columns to display between 1, 2 or 4"),
         file=sys.stderr
     )
-    print("  " + _("-d|--dictionary PATH  Select a specific dictionary"), file=sys.stderr)
-    print("  " + _("-n|--nocolor          Disable color output"), file=sys.stderr)
-    print("  " + _("-A|--ABU              Enable ABU format output"), file=sys.stderr)
-    print("  " + _("-D|--DELA             Enable DELA format output"), file=sys.stderr)
+    print(
+        "  " + _("--compare PATH        Report the differences between DELA and ABU dictionaries"),
+        file=sys.stderr
+    )
+    print(
+        "  " + _("--complete PREFIX     Print the dictionary verbs starting with a prefix"),
+        file=sys.stderr
+    )
+    print(
+        "  " + _("--completion SHELL    Print the bash or zsh completion script"),
+        file=sys.stderr
+    )
+    print(
+        "  " + _("--coprocess           Answer JSON requests read from standard input, one per line"),
+        file=sys.stderr
+    )
     print("  " + _("--debug               Enable debug mode"), file=sys.stderr)
+    print("  " + _("-D|--DELA             Enable DELA format output"), file=sys.stderr)
+    print("  " + _("-d|--dictionary PATH  Select a specific dictionary"), file=sys.stderr)
+    print(
+        "  " + _("--exists              Check if the verbs are in the dictionary, or those read"),
+        file=sys.stderr
+    )
+    print(
+        "  " + _("                      from standard input, printing 1 or 0 for each of them"),
+        file=sys.stderr
+    )
+    print(
+        "  " + _("--export PATH         Write all the dictionary verbs forms in a TSV or CSV file"),
+        file=sys.stderr
+    )
+    print(
+        "  " + _("-g|--generate         Generate conjugations from rules, without dictionary"),
+        file=sys.stderr
+    )
+    print(
+        "  " + _("--guess               Generate the conjugations of verbs missing from dictionaries"),
+        file=sys.stderr
+    )
     print(
         "  " + _("--help|-?             Print usage and this help message and exit"),
         file=sys.stderr
     )
+    print(
+        "  " + _("-i|--interactive      Conjugate the verbs typed, keeping the dictionaries loaded"),
+        file=sys.stderr
+    )
+    print(
+        "  " + _("-j|--jobs NUM         Index the dictionaries with parallel processes"),
+        file=sys.stderr
+    )
+    print(
+        "  " + _("--lexicon PATH        Build a model-compressed lexicon from the dictionary"),
+        file=sys.stderr
+    )
     print(
         "  " + _("--locale LANG         Override environment to select another language"),
         file=sys.stderr
     )
+    print(
+        "  " + _("-m|--merge            Load all the dictionaries at once"),
+        file=sys.stderr
+    )
+    print(
+        "  " + _("--mode MODE           Only print the forms of a mode, such as Subjonctif"),
+        file=sys.stderr
+    )
+    print("  " + _("-n|--nocolor          Disable color output"), file=sys.stderr)
+    print(
+        "  " + _("--number NUMBER       Only print the forms of a number (s or p)"),
+        file=sys.stderr
+    )
+    print(
+        "  " + _("--person PERSON       Only print the forms of a person (1, 2 or 3),"),
+        file=sys.stderr
+    )
+    print(
+        "  " + _("                      or of a gender for past participles (m or f)"),
+        file=sys.stderr
+    )
+    print(
+        "  " + _("--site DIR            Write or update a static HTML site of the dictionary verbs"),
+        file=sys.stderr
+    )
+    print("  " + _("--stats               Print the dictionary statistics"), file=sys.stderr)
+    print(
+        "  " + _("--tables              Print the conjugations of the verbs matching --where"),
+        file=sys.stderr
+    )
+    print(
+        "  " + _("--tense TENSE         Only print the forms of a tense, such as Présent"),
+        file=sys.stderr
+    )
     print("  " + _("--version             Print version and exit"), file=sys.stderr)
+    print(
+        "  " + _("--where QUERY         List the dictionary verbs matching a query"),
+        file=sys.stderr
+    )
     print("  " + _("--                    Options processing terminator"), file=sys.stderr)
     print(file=sys.stderr)
 
 
 ################################################################################
-def detect_dictionary_type():
+def get_dictionary_compression(pathname):
+    """Return the compression format of a dictionary, or an empty string"""
+    with open(pathname, "rb") as file:
+        magic = file.read(len(XZ_MAGIC))
+
+    if magic.startswith(GZIP_MAGIC):
+        return "gzip"
+    if magic.startswith(BZIP2_MAGIC):
+        return "bzip2"
+    if magic.startswith(XZ_MAGIC):
+        return "xz"
+    return ""
+
+
+################################################################################
+def open_dictionary_bytes(pathname):
+    """Return a binary file object reading a plain or compressed dictionary"""
+    compression = get_dictionary_compression(pathname)
+    if compression == "gzip":
+        compressed_file = gzip.GzipFile(pathname, "rb")
+    elif compression == "bzip2":
+        compressed_file = bz2.BZ2File(pathname, "rb")
+    elif compression == "xz":
+        if lzma is None:
+            logging.critical(_("This Python doesn't support xz compressed dictionaries"))
+            sys.exit(1)
+        compressed_file = lzma.LZMAFile(pathname, "rb")
+    else:
+        return open(pathname, "rb")
+
+    # Compressed dictionaries are decompressed in large chunks while being read:
+    return io.BufferedReader(compressed_file, DECOMPRESSION_BUFFER_SIZE)
+
+
+################################################################################
+def open_dictionary(pathname):
+    """Return a text file object reading a plain or compressed dictionary"""
+    return io.TextIOWrapper(open_dictionary_bytes(pathname), encoding="utf-8")
+
+
+################################################################################
+def detect_dictionary_type(pathname=None):
     """Return the type of dictionary or ?"""
-    with open(parameters["Dictionary path"], "r", encoding="utf-8") as file:
-        for line in file.readlines():
+    if pathname is None:
+        pathname = parameters["Dictionary path"]
+    with open_dictionary(pathname) as file:
+        for line in file:
+            if line.startswith(LEXICON_HEADER + " "):
+                return line[len(LEXICON_HEADER) + 1:].strip()
+
             line = line.strip()
             if line == "avoir,.V+z1:W":
                 return "DELA"
@@ -172,48 +638,26 @@ def process_environment_variables():
             logging.critical(_("None of the directories specified in DICTPATH found"))
             sys.exit(1)
     else:
-        if os.name == "posix":
-            if os.path.isdir("/usr/share/dict"):
-                parameters["DictPath"].append("/usr/share/dict")
-            if os.path.isdir("/usr/local/share/dict"):
-                parameters["DictPath"].append("/usr/local/share/dict")
-            if "HOME" in os.environ.keys():
-                home = os.environ["HOME"]
-                if os.path.isdir(home + os.sep + ".local/share/dict"):
-                    parameters["DictPath"].append(home + os.sep + ".local/share/dict")
-
-        elif os.name == "nt":
-            appdata_path = os.sep + "appdata" + os.sep + "roaming"
-            pnu_dictpath = os.sep + "python" + os.sep + "share" + os.sep + "dict"
-            if os.environ["APPDATA"]:
-                pnu_dictpath = os.environ["APPDATA"] + pnu_dictpath
-            elif os.environ["HOMEPATH"]:
-                pnu_dictpath = os.environ["HOMEPATH"] + appdata_path + pnu_dictpath
-            elif os.environ["USERPROFILE"]:
-                pnu_dictpath = os.environ["USERPROFILE"] + appdata_path + pnu_dictpath
-            if os.path.isdir(pnu_dictpath):
-                parameters["DictPath"].append(pnu_dictpath)
-
-            pnu_dictpath2 = sys.base_prefix + os.sep + "share" + os.sep + "dict"
-            if os.path.isdir(pnu_dictpath2):
-                parameters["DictPath"].append(pnu_dictpath2)
-
-    # Setting the default dictionary, if any:
-    # (the first one named words)
+        parameters["DictPath"] = get_default_dictionary_directories()
+
+    # Setting the default dictionaries stack, if any:
+    # (the preferred one first for each directory, the first one being the default dictionary)
     for directory in parameters["DictPath"]:
-        if os.path.isfile(directory + os.sep + AU_DELA):
-            parameters["Dictionary path"] = directory + os.sep + AU_DELA
-            break
-        if os.path.isfile(directory + os.sep + DELA):
-            parameters["Dictionary path"] = directory + os.sep + DELA
-            break
-        if os.path.isfile(directory + os.sep + ABU):
-            parameters["Dictionary path"] = directory + os.sep + ABU
-            break
+        for dictionary in (AU_DELA, DELA, ABU):
+            for suffix in COMPRESSED_SUFFIXES:
+                if os.path.isfile(directory + os.sep + dictionary + suffix):
+                    parameters["Dictionaries"].append(directory + os.sep + dictionary + suffix)
+                    break
+    if parameters["Dictionaries"]:
+        parameters["Dictionary path"] = parameters["Dictionaries"][0]
+
+    if "CONJUGUER_CACHE" in os.environ.keys():
+        parameters["Cache directory"] = os.environ["CONJUGUER_CACHE"]
 
     if "CONJUGUER_DICT" in os.environ.keys():
         if os.path.isfile(os.environ["CONJUGUER_DICT"]):
             parameters["Dictionary path"] = os.environ["CONJUGUER_DICT"]
+            parameters["Dictionaries"] = [parameters["Dictionary path"]]
         else:
             logging.critical(_("Dictionary pathname doesn't exist") + ": %s", os.environ["CONJUGUER_DICT"])
             sys.exit(1)
@@ -228,6 +672,28 @@ def process_environment_variables():
     logging.debug(parameters)
 
 
+################################################################################
+def get_cell_key(argument, keys):
+    """Return the verb data structure key matching an argument, whatever its case and accents"""
+    for key in keys:
+        if normalize_verb(argument) == normalize_verb(key):
+            return key
+
+    return ""
+
+
+################################################################################
+def get_tenses():
+    """Return the tenses names of all the modes, without duplicates"""
+    tenses = []
+    for mode in blank_verb.values():
+        for tense in mode.keys():
+            if tense not in tenses:
+                tenses.append(tense)
+
+    return tenses
+
+
 ################################################################################
 def process_command_line(program_name):
     """Process command line options"""
@@ -237,17 +703,39 @@ def process_command_line(program_name):
 
     # option letters followed by : expect an argument
     # same for option strings followed by =
-    character_options = "Ac:d:Dn?"
+    character_options = "Ac:d:Dgij:mn?"
     string_options = [
         "ABU",
+        "audit=",
+        "cache=",
         "columns=",
+        "compare=",
+        "complete=",
+        "completion=",
+        "coprocess",
         "debug",
         "DELA",
         "dictionary=",
+        "exists",
+        "export=",
+        "generate",
+        "guess",
         "help",
+        "interactive",
+        "jobs=",
+        "lexicon=",
         "locale=",
+        "merge",
+        "mode=",
         "nocolor",
+        "number=",
+        "person=",
+        "site=",
+        "stats",
+        "tables",
+        "tense=",
         "version",
+        "where=",
     ]
 
     try:
@@ -259,12 +747,19 @@ def process_command_line(program_name):
         display_help()
         sys.exit(1)
 
+    dictionaries = []
     for option, argument in options:
 
         if option in ("-A", "--ABU"):
             parameters["ABU output"] = True
             parameters["DELA output"] = False
 
+        elif option == "--audit":
+            parameters["Audit path"] = argument
+
+        elif option == "--cache":
+            parameters["Cache directory"] = argument
+
         elif option in ("-c", "--columns"):
             try:
                 parameters["Display columns"] = int(argument)
@@ -275,6 +770,22 @@ def process_command_line(program_name):
                 logging.critical(_("Option -c/--columns is expecting 1, 2 or 4 columns"))
                 sys.exit(1)
 
+        elif option == "--compare":
+            parameters["Comparison path"] = argument
+
+        elif option == "--complete":
+            parameters["Completion prefix"] = argument
+
+        elif option == "--completion":
+            if argument not in COMPLETION_SCRIPTS:
+                logging.critical(_("Option --completion is expecting bash or zsh"))
+                sys.exit(1)
+            print(COMPLETION_SCRIPTS[argument], end="")
+            sys.exit(0)
+
+        elif option == "--coprocess":
+            parameters["Coprocess"] = True
+
         elif option == "--debug":
             logging.disable(logging.NOTSET)
 
@@ -284,31 +795,106 @@ def process_command_line(program_name):
 
         elif option in ("-d", "--dictionary"):
             if os.path.isfile(argument):
-                parameters["Dictionary path"] = argument
-                parameters["Dictionary type"] = detect_dictionary_type()
-                if parameters["Dictionary type"] not in ("ABU", "DELA"):
-                    logging.critical(
-                        _("The selected dictionary doesn't seem to be of ABU or DELA type")
-                    )
-                    sys.exit(1)
+                # Additional dictionaries are searched for the verbs missing from the first one:
+                dictionaries.append(argument)
+                parameters["Dictionaries"] = dictionaries
+                if len(dictionaries) == 1:
+                    parameters["Dictionary path"] = argument
+                    parameters["Dictionary type"] = detect_dictionary_type()
+                    if parameters["Dictionary type"] not in ("ABU", "DELA"):
+                        logging.critical(
+                            _("The selected dictionary doesn't seem to be of ABU or DELA type")
+                        )
+                        sys.exit(1)
             else:
                 logging.critical(_("Option -d/--dictionary is expecting a valid pathname"))
                 sys.exit(1)
 
+        elif option == "--exists":
+            parameters["Existence check"] = True
+
+        elif option == "--export":
+            parameters["Export path"] = argument
+
+        elif option in ("-g", "--generate"):
+            parameters["Generated conjugations"] = True
+
+        elif option == "--guess":
+            parameters["Guessed conjugations"] = True
+
         elif option in ("--help", "-?"):
             display_help()
             sys.exit(0)
 
+        elif option in ("-i", "--interactive"):
+            parameters["Interactive"] = True
+
+        elif option in ("-j", "--jobs"):
+            try:
+                parameters["Parallel jobs"] = int(argument)
+            except ValueError:
+                logging.critical(_("Option -j/--jobs is expecting an integer argument"))
+                sys.exit(1)
+            if parameters["Parallel jobs"] < 1:
+                logging.critical(_("Option -j/--jobs is expecting at least 1 job"))
+                sys.exit(1)
+
+        elif option == "--lexicon":
+            parameters["Lexicon path"] = argument
+
         elif option == "--locale":
             initialize_internationalization(program_name, argument)
 
+        elif option in ("-m", "--merge"):
+            parameters["Merge dictionaries"] = True
+
+        elif option == "--mode":
+            parameters["Cell mode"] = get_cell_key(argument, blank_verb.keys())
+            if not parameters["Cell mode"]:
+                logging.critical(
+                    _("Option --mode is expecting one of") + ": %s", ", ".join(blank_verb.keys())
+                )
+                sys.exit(1)
+
         elif option in ("-n", "--nocolor"):
             parameters["Color display"] = False
 
+        elif option == "--number":
+            parameters["Cell number"] = get_cell_key(argument, ["s", "p"])
+            if not parameters["Cell number"]:
+                logging.critical(_("Option --number is expecting s or p"))
+                sys.exit(1)
+
+        elif option == "--person":
+            parameters["Cell person"] = get_cell_key(argument, ["1", "2", "3", "m", "f"])
+            if not parameters["Cell person"]:
+                logging.critical(_("Option --person is expecting 1, 2, 3, m or f"))
+                sys.exit(1)
+
+        elif option == "--site":
+            parameters["Site directory"] = argument
+
+        elif option == "--stats":
+            parameters["Statistics"] = True
+
+        elif option == "--tables":
+            parameters["Query tables"] = True
+
+        elif option == "--tense":
+            parameters["Cell tense"] = get_cell_key(argument, get_tenses())
+            if not parameters["Cell tense"]:
+                logging.critical(
+                    _("Option --tense is expecting one of") + ": %s", ", ".join(get_tenses())
+                )
+                sys.exit(1)
+
         elif option == "--version":
             print(ID.replace("@(" + "#)" + " $" + "Id" + ": ", "").replace(" $", ""))
             sys.exit(0)
 
+        elif option == "--where":
+            parameters["Query"] = argument
+
     logging.debug("process_command_line(): parameters:")
     logging.debug(parameters)
     logging.debug("process_command_line(): remaining_arguments:")
@@ -318,23 +904,258 @@ def process_command_line(program_name):
 
 
 ################################################################################
-def load_all_verbs_from_dictionary():
+def get_verb_line(line, dictionary_type):
+    """Return a dictionary line, ready to be used, if it's a verb one, or None"""
+    line = line.strip()
+    if dictionary_type == "DELA":
+        if ".V" in line:
+            # Unescape "-", "," and "." characters:
+            return line.replace("\\", "")
+    elif dictionary_type == "ABU":
+        if "	Ver:" in line:
+            return line
+
+    return None
+
+
+################################################################################
+def read_dictionary_chunks(file, size=FILTER_CHUNK_SIZE):
+    """Yield line-aligned chunks of a binary file"""
+    while True:
+        chunk = file.read(size)
+        if not chunk:
+            return
+        if not chunk.endswith(b"\n"):
+            chunk += file.readline()
+        yield chunk
+
+
+################################################################################
+def filter_verb_lines(chunk, dictionary_type):
+    """Return the verbs lines of a chunk of whole lines, only decoding those lines"""
+    # The other lines are skipped before decoding, then the verbs lines are decoded at once:
+    lines = VERB_LINE_REGEXES[dictionary_type].findall(chunk)
+    if not lines:
+        return []
+    text = b"\n".join(lines).decode("utf-8")
+    if dictionary_type == "DELA":
+        # Unescape "-", "," and "." characters:
+        text = text.replace("\\", "")
+
+    return [line.strip() for line in text.split("\n")]
+
+
+################################################################################
+class VerbLines:
+    """Dictionary verbs lines stored in a single string, with their offsets,
+    and a sorted table of their lemmas, and their normalized index, once indexed"""
+
+    # Number of lines split at once when iterating:
+    ITERATION_LINES = 65536
+
+    def __init__(self, dictionary_type, lines=None):
+        """Start an empty store, or a store of some lines"""
+        # Each line is preceded and followed by a newline,
+        # and self.offsets[i] is the offset of line i, followed by the end of the buffer:
+        self.dictionary_type = dictionary_type
+        self.buffer = "\n"
+        self.parts = []
+        self.offsets = array.array("I", [1])
+        self.lemmas = None
+        self.lemmas_offsets = None
+        self.lemmas_lines = None
+        self.normalized_index = None
+        if lines:
+            self.extend(lines)
+
+    def extend(self, lines):
+        """Add lines at the end of the store"""
+        if not lines:
+            return
+        self.parts.append("\n".join(lines) + "\n")
+        offset = self.offsets[-1]
+        for line in lines:
+            offset += len(line) + 1
+            self.offsets.append(offset)
+        self.lemmas = None
+        self.normalized_index = None
+
+    def get_buffer(self):
+        """Return the string holding all the lines"""
+        if self.parts:
+            self.buffer = "".join([self.buffer] + self.parts)
+            self.parts = []
+        return self.buffer
+
+    def __getstate__(self):
+        # Stores are pickled in cache files, or sent back by the processes of a pool:
+        self.get_buffer()
+        return self.__dict__
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("VerbLines index out of range")
+        return self.get_buffer()[self.offsets[i]:self.offsets[i + 1] - 1]
+
+    def __iter__(self):
+        buffer = self.get_buffer()
+        for first in range(0, len(self), self.ITERATION_LINES):
+            last = min(first + self.ITERATION_LINES, len(self))
+            for line in buffer[self.offsets[first]:self.offsets[last] - 1].split("\n"):
+                yield line
+
+    def find_lines(self, *texts):
+        """Return the lines containing any of some texts, in order"""
+        # A text starting with a newline only matches at the start of lines:
+        buffer = self.get_buffer()
+        lines = set()
+        for text in texts:
+            shift = 1 if text.startswith("\n") else 0
+            position = buffer.find(text)
+            while position != -1:
+                i = bisect.bisect_right(self.offsets, position + shift) - 1
+                if i < len(self):
+                    lines.add(i)
+                position = buffer.find(text, position + 1)
+
+        return [self[i] for i in sorted(lines)]
+
+    def index_lemmas(self):
+        """Build a sorted table of the interned lemmas, giving the numbers of their lines"""
+        lemmas_lines = {}
+        for i, line in enumerate(self):
+            lemma = parse_verb_line(line, self.dictionary_type)[1]
+            if lemma in lemmas_lines:
+                lemmas_lines[lemma].append(i)
+            else:
+                lemmas_lines[lemma] = [i]
+
+        self.set_lemmas_lines(lemmas_lines)
+
+    def set_lemmas_lines(self, lemmas_lines):
+        """Store the table of lemmas from a dictionary of their lines numbers"""
+        self.lemmas = [sys.intern(lemma) for lemma in sorted(lemmas_lines.keys())]
+        self.lemmas_offsets = array.array("I", [0])
+        self.lemmas_lines = array.array("I")
+        for lemma in self.lemmas:
+            self.lemmas_lines.extend(lemmas_lines[lemma])
+            self.lemmas_offsets.append(len(self.lemmas_lines))
+
+    def get_lemma_lines(self, lemma):
+        """Return the lines of a lemma, in order"""
+        if self.lemmas is None:
+            # Without the table of lemmas, only the lines including the lemma are examined:
+            if self.dictionary_type == "DELA":
+                lines = self.find_lines("\n" + lemma + ",.", "," + lemma + ".")
+            else:
+                lines = self.find_lines("	" + lemma + "	")
+            return [
+                line for line in lines
+                if parse_verb_line(line, self.dictionary_type)[1] == lemma
+            ]
+
+        i = bisect.bisect_left(self.lemmas, lemma)
+        if i == len(self.lemmas) or self.lemmas[i] != lemma:
+            return []
+        return [
+            self[line]
+            for line in self.lemmas_lines[self.lemmas_offsets[i]:self.lemmas_offsets[i + 1]]
+        ]
+
+
+################################################################################
+class Lexicon:
+    """Lexicon entries of a dictionary, regenerating the verbs lines of a lemma on demand,
+    with the same interface as VerbLines"""
+
+    def __init__(self, dictionary_type, entries):
+        """Start a store of lexicon entries, indexed by lemma"""
+        self.dictionary_type = dictionary_type
+        self.entries = entries
+        self.lemmas = [sys.intern(lemma) for lemma in sorted(entries.keys())]
+        self.normalized_index = None
+
+    def __len__(self):
+        return len(self.lemmas)
+
+    def __iter__(self):
+        for lemma in self.lemmas:
+            for line in self.get_lemma_lines(lemma):
+                yield line
+
+    def index_lemmas(self):
+        """Do nothing, as the lemmas of a lexicon are always indexed"""
+
+    def get_lemma_lines(self, lemma):
+        """Return the lines of a lemma, in order"""
+        if lemma not in self.entries:
+            return []
+        return expand_lexicon_entry(lemma, self.entries[lemma], self.dictionary_type)
+
+
+################################################################################
+def merge_verb_lines(parts, dictionary_type):
+    """Return the concatenation of the verbs lines of consecutive parts of a dictionary,
+    with their lemmas indexed"""
+    verbs = VerbLines(dictionary_type)
+    lemmas_lines = {}
+    for part in parts:
+        if part.lemmas is None:
+            part.index_lemmas()
+
+        # The part lines numbers and offsets are shifted after the lines already there:
+        first_line = len(verbs)
+        shift = verbs.offsets[-1] - 1
+        verbs.parts.append(part.get_buffer()[1:])
+        verbs.offsets.extend([offset + shift for offset in part.offsets[1:]])
+        for i, lemma in enumerate(part.lemmas):
+            lines = [
+                first_line + line
+                for line in part.lemmas_lines[part.lemmas_offsets[i]:part.lemmas_offsets[i + 1]]
+            ]
+            if lemma in lemmas_lines:
+                lemmas_lines[lemma].extend(lines)
+            else:
+                lemmas_lines[lemma] = lines
+
+    verbs.set_lemmas_lines(lemmas_lines)
+
+    return verbs
+
+
+################################################################################
+def load_all_verbs_from_dictionary(pathname=None, dictionary_type=None):
     """Load the verbs part of an inflected dictionary"""
     time_start = time.time()
-    verbs = []
-    with open(parameters["Dictionary path"], "r", encoding="utf-8") as file:
-        if parameters["Dictionary type"] == "DELA":
-            for line in file.readlines():
-                line = line.strip()
-                if ".V" in line:
-                    # Unescape "-", "," and "." characters:
-                    line = line.replace("\\", "")
-                    verbs.append(line)
-        elif parameters["Dictionary type"] == "ABU":
-            for line in file.readlines():
-                line = line.strip()
-                if "	Ver:" in line:
-                    verbs.append(line)
+    if pathname is None:
+        pathname = parameters["Dictionary path"]
+    if dictionary_type is None:
+        dictionary_type = parameters["Dictionary type"]
+    if is_lexicon(pathname):
+        # A lexicon only regenerates the lines of the verbs asked for:
+        verbs = Lexicon(dictionary_type, load_lexicon(pathname))
+        logging.debug(
+            "load_all_verbs_from_dictionary() " + _("time") + ": %f / " + _("lemmas") + ": %d",
+            time.time() - time_start, len(verbs)
+        )
+        return verbs
+
+    if parameters["Cache directory"]:
+        verbs = load_verbs_index(pathname, dictionary_type)
+    elif parameters["Parallel jobs"] > 1:
+        verbs = load_verbs_index_in_parallel(pathname, dictionary_type)
+    else:
+        # Dictionaries are searched for verbs lines in large chunks, before decoding them,
+        # and these lines are kept in a compact store:
+        verbs = VerbLines(dictionary_type)
+        with open_dictionary_bytes(pathname) as file:
+            for chunk in read_dictionary_chunks(file):
+                verbs.extend(filter_verb_lines(chunk, dictionary_type))
 
     time_stop = time.time()
     logging.debug(
@@ -350,11 +1171,16 @@ def load_all_verbs_from_dictionary():
 
 
 ################################################################################
-def select_verb_from_verbs(verb, verbs):
+def select_verb_from_verbs(verb, verbs, dictionary_type=None):
     """Return only the lines of the inflected dictionary matching the chosen verb"""
     time_start = time.time()
+    if dictionary_type is None:
+        dictionary_type = parameters["Dictionary type"]
     conjugations = []
-    if parameters["Dictionary type"] == "DELA":
+    # Only the lines of the verb need to be examined:
+    verbs = verbs.get_lemma_lines(verb)
+
+    if dictionary_type == "DELA":
         # I don't know if there may be several keys for a same verb
         # let's do like this for the time being...
         verb_keys = []
@@ -378,7 +1204,7 @@ def select_verb_from_verbs(verb, verbs):
                 logging.debug(_("Line") + ": %s", line)
                 conjugations.append(line)
 
-    elif parameters["Dictionary type"] == "ABU":
+    elif dictionary_type == "ABU":
         for line in verbs:
             if "	" + verb + "	" in line:
                 logging.debug(_("Line") + ": %s", line)
@@ -398,216 +1224,642 @@ def select_verb_from_verbs(verb, verbs):
 
 
 ################################################################################
-def fill_verb_from_dela_dictionary_data(verb, conjugations, auxiliary):
-    """Fill a verb data structure rom dictionary data"""
-    time_start = time.time()
-    conjugated_verb = copy.deepcopy(blank_verb)
+def read_dictionary_blocks(file):
+    """Yield line-aligned blocks of a binary file, whose boundaries depend on their content"""
+    while True:
+        parts = [file.read(INDEX_BLOCK_SIZE)]
+        if not parts[0]:
+            return
+        if not parts[0].endswith(b"\n"):
+            parts.append(file.readline())
 
-    # Conjugation lines have this format:
-    # conjugated_verb,unconjugated_verb.V+optional_subclass:inflection1:Inflection2:inflectionN
+        # A block ends after a line selected by its content, rather than at a fixed offset,
+        # so that the following blocks are the same when some bytes are inserted or deleted:
+        while True:
+            line = file.readline()
+            if not line:
+                break
+            parts.append(line)
+            if zlib.crc32(line) & INDEX_BLOCK_BOUNDARY_MASK == 0:
+                break
 
-    conjugated_verb["Infinitif"]["Présent"] = verb
+        yield b"".join(parts)
 
-    # We first need to find the "Participe passé" tense for this verb:
-    suffix_s = ""
-    suffix_p = ""
-    for line in conjugations:
-        for inflection in line.split(":")[1:]:
-            if inflection == "Kms":
-                suffix_s = " " + line.split(",")[0]
-            if inflection == "Kmp":
-                suffix_p = " " + line.split(",")[0]
-    if not suffix_s:
-        logging.warning(_("Infinitif passé not found for") + " %s", verb)
-    else:
-        conjugated_verb["Infinitif"]["Passé"] = auxiliary + suffix_s
-    if not suffix_p:
-        suffix_p = suffix_s
 
-    for line in conjugations:
-        conjugation = line.split(",")[0]
-        for inflection in line.split(":")[1:]:
-            part = list(inflection)
-            suffix = suffix_s
-            if auxiliary == "être" and len(part) == 3 and part[2] == "p":
-                suffix = suffix_p
+################################################################################
+def index_dictionary_block(block, dictionary_type):
+    """Return the verbs lines of a dictionary block, with their lemmas indexed"""
+    verbs = VerbLines(dictionary_type, filter_verb_lines(block, dictionary_type))
+    verbs.index_lemmas()
 
-            if part[0] == "P":
-                conjugated_verb["Indicatif"]["Présent"][part[2]][part[1]] = conjugation
-                if suffix:
-                    conjugated_verb["Indicatif"]["Passé composé"][part[2]][part[1]] = \
-                        aux[auxiliary]["Indicatif"]["Présent"][part[2]][part[1]] + suffix
-            elif part[0] == "I":
-                conjugated_verb["Indicatif"]["Imparfait"][part[2]][part[1]] = conjugation
-                if suffix:
-                    conjugated_verb["Indicatif"]["Plus-que-parfait"][part[2]][part[1]] = \
-                        aux[auxiliary]["Indicatif"]["Imparfait"][part[2]][part[1]] + suffix
-            elif part[0] == "J":
-                conjugated_verb["Indicatif"]["Passé simple"][part[2]][part[1]] = conjugation
-                if suffix:
-                    conjugated_verb["Indicatif"]["Passé antérieur"][part[2]][part[1]] = \
-                        aux[auxiliary]["Indicatif"]["Passé simple"][part[2]][part[1]] + suffix
-            elif part[0] == "F":
-                conjugated_verb["Indicatif"]["Futur simple"][part[2]][part[1]] = conjugation
-                if suffix:
-                    conjugated_verb["Indicatif"]["Futur antérieur"][part[2]][part[1]] = \
-                        aux[auxiliary]["Indicatif"]["Futur simple"][part[2]][part[1]] + suffix
-            elif part[0] == "C":
-                conjugated_verb["Conditionnel"]["Présent"][part[2]][part[1]] = conjugation
-                if suffix:
-                    conjugated_verb["Conditionnel"]["Passé"][part[2]][part[1]] = \
-                        aux[auxiliary]["Conditionnel"]["Présent"][part[2]][part[1]] + suffix
-            elif part[0] == "S":
-                conjugated_verb["Subjonctif"]["Présent"][part[2]][part[1]] = conjugation
-                if suffix:
-                    conjugated_verb["Subjonctif"]["Passé"][part[2]][part[1]] = \
-                        aux[auxiliary]["Subjonctif"]["Présent"][part[2]][part[1]] + suffix
-            elif part[0] == "T":
-                conjugated_verb["Subjonctif"]["Imparfait"][part[2]][part[1]] = conjugation
-                if suffix:
-                    conjugated_verb["Subjonctif"]["Plus-que-parfait"][part[2]][part[1]] = \
-                        aux[auxiliary]["Subjonctif"]["Imparfait"][part[2]][part[1]] + suffix
-            elif part[0] == "Y":
-                conjugated_verb["Impératif"]["Présent"][part[2]][part[1]] = conjugation
-                if suffix:
-                    conjugated_verb["Impératif"]["Passé"][part[2]][part[1]] = \
-                        aux[auxiliary]["Impératif"]["Présent"][part[2]][part[1]] + suffix
-            elif part[0] == "G":
-                conjugated_verb["Participe"]["Présent"] = conjugation
-                conjugated_verb["Gérondif"]["Présent"] = conjugation
-                if suffix:
-                    conjugated_verb["Participe"]["Passé"]["a"] = \
-                        aux[auxiliary]["Participe"]["Présent"] + suffix
-                    conjugated_verb["Gérondif"]["Passé"] = \
-                        conjugated_verb["Participe"]["Passé"]["a"]
-            elif part[0] == "K":
-                conjugated_verb["Participe"]["Passé"][part[2]][part[1]] = conjugation
+    return verbs
 
-    time_stop = time.time()
-    logging.debug(
-        "fill_verb_from_dela_dictionary_data() "
-        + _("time")
-        + ": %f / "
-        + _("conjugations")
-        + ": %d",
-        time_stop - time_start, len(conjugations)
-    )
 
-    return conjugated_verb
+################################################################################
+def index_dictionary_range(pathname, start, end, dictionary_type):
+    """Return the verbs lines of the lines starting in a byte range of a dictionary,
+    with their lemmas indexed"""
+    with open(pathname, "rb") as file:
+        # A line belongs to the range where it starts:
+        if start > 0:
+            file.seek(start - 1)
+            if file.read(1) != b"\n":
+                file.readline()
+        chunk = b""
+        if file.tell() < end:
+            chunk = file.read(end - file.tell())
+            if not chunk.endswith(b"\n"):
+                chunk += file.readline()
+
+    return index_dictionary_block(chunk, dictionary_type)
 
 
 ################################################################################
-def fill_verb_from_abu_dictionary_data(verb, conjugations, auxiliary):
-    """Fill a verb data structure rom dictionary data"""
+def load_verbs_index_in_parallel(pathname, dictionary_type):
+    """Return the verbs lines of a dictionary, whose parts are indexed by parallel processes"""
     time_start = time.time()
-    conjugated_verb = copy.deepcopy(blank_verb)
-
-    # Conjugation lines have this format:
-    # conjugated_verb	unconjugated_verb	Ver:inflection1:Inflection2:inflectionN
+    jobs = parameters["Parallel jobs"]
+    with multiprocessing.Pool(jobs, initialize_worker, (parameters,)) as pool:
+        if get_dictionary_compression(pathname):
+            # Compressed dictionaries can't be read from any offset,
+            # so their chunks are decompressed here and indexed in the processes:
+            with open_dictionary_bytes(pathname) as file:
+                parts = pool.starmap(
+                    index_dictionary_block,
+                    [(chunk, dictionary_type) for chunk in read_dictionary_chunks(file)]
+                )
+        else:
+            # Plain dictionaries are split in byte ranges read by the processes:
+            size = os.path.getsize(pathname)
+            ranges = jobs * PARALLEL_RANGES_PER_JOB
+            parts = pool.starmap(
+                index_dictionary_range,
+                [
+                    (pathname, size * i // ranges, size * (i + 1) // ranges, dictionary_type)
+                    for i in range(ranges)
+                ]
+            )
 
-    conjugated_verb["Infinitif"]["Présent"] = verb
+    # The parts are merged in order, to keep the verbs lines in the dictionary order:
+    verbs = merge_verb_lines(parts, dictionary_type)
 
-    # We first need to find the "Participe passé" tense for this verb:
-    suffix_s = ""
-    suffix_p = ""
-    for line in conjugations:
-        for inflection in line.split(":")[1:]:
-            if inflection == "PPas+Mas+SG":
-                suffix_s = " " + line.split("	")[0]
-            if inflection == "PPas+Mas+PL":
-                suffix_p = " " + line.split("	")[0]
-    if not suffix_s:
-        logging.warning(_("Infinitif passé not found for") + " %s", verb)
-    else:
-        conjugated_verb["Infinitif"]["Passé"] = auxiliary + suffix_s
-    if not suffix_p:
-        suffix_p = suffix_s
+    time_stop = time.time()
+    logging.debug(
+        "load_verbs_index_in_parallel() " + _("time") + ": %f / " + _("lemmas") + ": %d",
+        time_stop - time_start, len(verbs.lemmas)
+    )
+
+    return verbs
+
+
+################################################################################
+def get_cache_directory():
+    """Return the cache directory, or the default one for the small indexes always kept"""
+    if parameters["Cache directory"]:
+        return parameters["Cache directory"]
+
+    return get_default_cache_directory()
+
+
+################################################################################
+def get_index_cache_path(pathname, kind="index"):
+    """Return the pathname of a cached index of a dictionary"""
+    digest = hashlib.sha1(os.path.abspath(pathname).encode("utf-8")).hexdigest()
+    return get_cache_directory() + os.sep + kind + "-" + digest[:16] + ".pickle"
+
+
+################################################################################
+def load_index_cache(pathname, dictionary_type, kind="index"):
+    """Return a cached index of a dictionary, or None"""
+    cache_path = get_index_cache_path(pathname, kind)
+    try:
+        with open(cache_path, "rb") as file:
+            cache = pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        return None
+
+    if not isinstance(cache, dict) \
+    or cache.get("Version") != INDEX_CACHE_VERSION \
+    or cache.get("Path") != os.path.abspath(pathname) \
+    or cache.get("Type") != dictionary_type:
+        return None
+
+    return cache
+
+
+################################################################################
+def save_index_cache(cache, kind="index"):
+    """Write an index cache file, atomically"""
+    cache_path = get_index_cache_path(cache["Path"], kind)
+    try:
+        os.makedirs(get_cache_directory(), exist_ok=True)
+        with open(cache_path + ".tmp", "wb") as file:
+            pickle.dump(cache, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(cache_path + ".tmp", cache_path)
+    except OSError as error:
+        logging.warning(_("Cannot write the verbs index cache") + ": %s", error)
+
+
+################################################################################
+def load_verbs_index(pathname, dictionary_type):
+    """Return the verbs lines of a dictionary, only reparsing the blocks changed since cached"""
+    time_start = time.time()
+    status = os.stat(pathname)
+    cache = load_index_cache(pathname, dictionary_type)
+    if cache is None:
+        # Everything will be rebuilt:
+        cache = {
+            "Version": INDEX_CACHE_VERSION,
+            "Path": os.path.abspath(pathname),
+            "Type": dictionary_type,
+            "Size": -1,
+            "Modification time": -1,
+            "Blocks": [],
+            "Normalized index": None,
+        }
+
+    cached_blocks = {}
+    for digest, block_verbs in cache["Blocks"]:
+        cached_blocks[digest] = block_verbs
+
+    if cache["Size"] != status.st_size or cache["Modification time"] != status.st_mtime:
+        blocks = []
+        new_blocks = []
+        with open_dictionary_bytes(pathname) as file:
+            for block in read_dictionary_blocks(file):
+                digest = hashlib.sha1(block).hexdigest()
+                if digest in cached_blocks:
+                    blocks.append((digest, cached_blocks[digest]))
+                else:
+                    blocks.append((digest, None))
+                    new_blocks.append(block)
+        parsed_blocks = len(new_blocks)
+
+        # The new blocks are indexed in parallel if possible:
+        if parameters["Parallel jobs"] > 1 and len(new_blocks) > 1:
+            with multiprocessing.Pool(
+                parameters["Parallel jobs"], initialize_worker, (parameters,)
+            ) as pool:
+                new_blocks_verbs = pool.starmap(
+                    index_dictionary_block, [(block, dictionary_type) for block in new_blocks]
+                )
+        else:
+            new_blocks_verbs = [
+                index_dictionary_block(block, dictionary_type) for block in new_blocks
+            ]
+        new_blocks_verbs.reverse()
+        for i, (digest, block_verbs) in enumerate(blocks):
+            if block_verbs is None:
+                blocks[i] = (digest, new_blocks_verbs.pop())
+        logging.debug(
+            "load_verbs_index() " + _("parsed blocks") + ": %d/%d", parsed_blocks, len(blocks)
+        )
+
+        cache["Size"] = status.st_size
+        cache["Modification time"] = status.st_mtime
+        cache["Blocks"] = blocks
+        cache["Normalized index"] = None
+
+    # The blocks are merged in order, to keep the verbs lines in the dictionary order:
+    verbs = merge_verb_lines(
+        [block_verbs for _digest, block_verbs in cache["Blocks"]], dictionary_type
+    )
+
+    # The normalized index of the lemmas is only built again with the blocks:
+    if cache["Normalized index"] is None:
+        cache["Normalized index"] = make_normalized_index(verbs.lemmas)
+        save_index_cache(cache)
+    verbs.normalized_index = cache["Normalized index"]
+
+    time_stop = time.time()
+    logging.debug(
+        "load_verbs_index() " + _("time") + ": %f / " + _("lemmas") + ": %d",
+        time_stop - time_start, len(verbs.lemmas)
+    )
+
+    return verbs
+
+
+################################################################################
+def initialize_worker(worker_parameters):
+    """Set up a process pool worker, for platforms where processes are not forked"""
+    parameters.update(worker_parameters)
+    if not hasattr(builtins, "_"):
+        gettext.install("conjuguer")
+
+
+################################################################################
+def load_dictionary_layer(pathname):
+    """Return the type and verbs lines of a dictionary, with their lemmas indexed,
+    or an unknown type"""
+    dictionary_type = detect_dictionary_type(pathname)
+    if dictionary_type not in ("ABU", "DELA"):
+        return dictionary_type, VerbLines(dictionary_type)
+
+    verbs = get_verbs_index(load_all_verbs_from_dictionary(pathname, dictionary_type))
+
+    return dictionary_type, verbs
+
+
+################################################################################
+def check_dictionary_layer(layer):
+    """Warn about an additional dictionary of unknown type, which will be skipped"""
+    if layer["Type"] not in ("ABU", "DELA"):
+        logging.warning(
+            _("The selected dictionary doesn't seem to be of ABU or DELA type") + ": %s",
+            layer["Path"]
+        )
+
+
+################################################################################
+def get_dictionary_layers(verbs=None):
+    """Return the stack of dictionaries to search, with the first one loaded if not given"""
+    layers = [{
+        "Path": parameters["Dictionary path"],
+        "Type": parameters["Dictionary type"],
+        "Verbs": verbs,
+    }]
+    for pathname in parameters["Dictionaries"]:
+        if pathname != parameters["Dictionary path"]:
+            layers.append({"Path": pathname, "Type": "", "Verbs": None})
+
+    if parameters["Merge dictionaries"] and len(layers) > 1:
+        # The additional dictionaries are loaded by parallel processes,
+        # while the first one is loaded here if it's not already:
+        with multiprocessing.Pool(
+            len(layers) - 1, initialize_worker, (parameters,)
+        ) as pool:
+            results = pool.map_async(
+                load_dictionary_layer, [layer["Path"] for layer in layers[1:]]
+            )
+            if layers[0]["Verbs"] is None:
+                layers[0]["Verbs"] = load_all_verbs_from_dictionary()
+            for layer, (dictionary_type, layer_verbs) in zip(layers[1:], results.get()):
+                layer["Type"] = dictionary_type
+                layer["Verbs"] = layer_verbs
+        for layer in layers[1:]:
+            check_dictionary_layer(layer)
+    elif layers[0]["Verbs"] is None:
+        layers[0]["Verbs"] = load_all_verbs_from_dictionary()
+
+    return layers
+
+
+################################################################################
+def select_verb_from_layers(verb, layers):
+    """Return the lines of the first dictionary having the chosen verb, and this dictionary"""
+    for layer in layers:
+        if layer["Verbs"] is None:
+            # The additional dictionaries are only loaded when needed:
+            layer["Type"], layer["Verbs"] = load_dictionary_layer(layer["Path"])
+            check_dictionary_layer(layer)
+        if layer["Type"] not in ("ABU", "DELA"):
+            continue
+
+        conjugations = select_verb_from_verbs(verb, layer["Verbs"], layer["Type"])
+        if conjugations:
+            logging.debug("%s " + _("found in") + " %s", verb, layer["Path"])
+            return conjugations, layer
+
+    return [], None
+
+
+################################################################################
+def index_dictionary_layers(layers):
+    """Load all the dictionaries of the stack for long running processes,
+    and return the indexes of their lemmas used to resolve and suggest verbs"""
+    for layer in layers:
+        if layer["Verbs"] is None:
+            layer["Type"], layer["Verbs"] = load_dictionary_layer(layer["Path"])
+            check_dictionary_layer(layer)
+        else:
+            # Lemmas are searched in a sorted table rather than in the lines themselves:
+            get_verbs_index(layer["Verbs"])
+
+    return get_layers_normalized_index(layers), make_lemmas_trie(get_layers_lemmas(layers))
+
+
+################################################################################
+def get_lemmas(verbs, dictionary_type):
+    """Return the set of lemmas of a dictionary verbs lines or lexicon"""
+    if verbs.lemmas is not None:
+        return set(verbs.lemmas)
+
+    # Only the infinitive lines need to be parsed:
+    infinitive = ":" + LEXICON_INFINITIVES[dictionary_type]
+    lemmas = set()
+    for line in verbs:
+        if infinitive in line:
+            _form, lemma, _key, inflections = parse_verb_line(line, dictionary_type)
+            if LEXICON_INFINITIVES[dictionary_type] in inflections:
+                lemmas.add(lemma)
+
+    return lemmas
+
+
+################################################################################
+def get_layers_lemmas(layers):
+    """Return the set of lemmas of the loaded dictionaries of the stack"""
+    lemmas = set()
+    for layer in layers:
+        if layer["Verbs"] is not None and layer["Type"] in ("ABU", "DELA"):
+            lemmas |= get_lemmas(layer["Verbs"], layer["Type"])
+
+    return lemmas
+
+
+################################################################################
+def get_verbs_normalized_index(verbs):
+    """Return the normalized index of the lemmas of a dictionary verbs lines or lexicon,
+    built once"""
+    if verbs.normalized_index is None:
+        verbs.normalized_index = make_normalized_index(get_lemmas(verbs, verbs.dictionary_type))
+
+    return verbs.normalized_index
+
+
+################################################################################
+def get_layers_normalized_index(layers):
+    """Return the normalized index of the lemmas of the loaded dictionaries of the stack"""
+    normalized_index = {}
+    for layer in layers:
+        if layer["Verbs"] is not None and layer["Type"] in ("ABU", "DELA"):
+            for key, lemmas in get_verbs_normalized_index(layer["Verbs"]).items():
+                if key in normalized_index:
+                    normalized_index[key] = sorted(set(normalized_index[key]) | set(lemmas))
+                else:
+                    normalized_index[key] = lemmas
+
+    return normalized_index
+
+
+################################################################################
+def make_normalized_index(lemmas):
+    """Return the lemmas indexed by their normalized form"""
+    index = {}
+    for lemma in sorted(lemmas):
+        key = normalize_verb(lemma)
+        if key in index:
+            index[key].append(lemma)
+        else:
+            index[key] = [lemma]
+
+    return index
+
+
+################################################################################
+def resolve_verb(verb, normalized_index):
+    """Return the lemmas matching a verb regardless of case, accents and Unicode normalization"""
+    candidates = normalized_index.get(normalize_verb(verb), [])
+
+    # An exact match, once in Unicode composed form, is preferred:
+    composed_verb = unicodedata.normalize("NFC", verb)
+    if composed_verb in candidates:
+        return [composed_verb]
+
+    return list(candidates)
+
+
+################################################################################
+def make_lemmas_trie(lemmas):
+    """Return a trie of the normalized lemmas, with the lemmas at the end of their branch"""
+    time_start = time.time()
+    trie = {}
+    for lemma in lemmas:
+        node = trie
+        for char in normalize_verb(lemma):
+            if char not in node:
+                node[char] = {}
+            node = node[char]
+        # Characters are never empty, so the empty key holds the lemmas ending there:
+        if "" in node:
+            node[""].append(lemma)
+        else:
+            node[""] = [lemma]
+
+    time_stop = time.time()
+    logging.debug(
+        "make_lemmas_trie() " + _("time") + ": %f / " + _("lemmas") + ": %d",
+        time_stop - time_start, len(lemmas)
+    )
+
+    return trie
+
+
+################################################################################
+def suggest_verbs(
+    verb,
+    lemmas,
+    max_distance=SUGGESTIONS_MAX_DISTANCE,
+    max_results=SUGGESTIONS_MAX_RESULTS
+):
+    """Return the lemmas nearest to a verb, ignoring case and accents, from a trie or iterable"""
+    if not isinstance(lemmas, dict):
+        lemmas = make_lemmas_trie(lemmas)
+    normalized_verb = normalize_verb(verb)
+    suggestions = []
+
+    # Levenshtein distances are computed a row per trie level,
+    # and branches are abandoned when the whole row exceeds the maximum distance:
+    def search(node, char, previous_row):
+        row = [previous_row[0] + 1]
+        for column in range(1, len(normalized_verb) + 1):
+            row.append(min(
+                row[column - 1] + 1,
+                previous_row[column] + 1,
+                previous_row[column - 1] + (normalized_verb[column - 1] != char)
+            ))
+        if "" in node and row[-1] <= max_distance:
+            for lemma in node[""]:
+                suggestions.append((row[-1], lemma))
+        if min(row) <= max_distance:
+            for next_char, next_node in node.items():
+                if next_char:
+                    search(next_node, next_char, row)
+
+    first_row = list(range(len(normalized_verb) + 1))
+    for char, node in lemmas.items():
+        if char:
+            search(node, char, first_row)
+
+    return [lemma for _distance, lemma in sorted(suggestions) if lemma != verb][:max_results]
+
+
+################################################################################
+def pack_inflection(tense, person="", number="", gender=""):
+    """Return the packed integer of an inflection, from its packed tense and cell"""
+    return (
+        tense << 6
+        | PACKED_PERSONS.index(person) << 4
+        | PACKED_NUMBERS.index(number) << 2
+        | PACKED_GENDERS.index(gender)
+    )
 
-    for line in conjugations:
-        conjugation = line.split("	")[0]
-        for inflection in line.split(":")[1:]:
-            part = inflection.split("+")
-
-            number = ""
-            person = ""
-            gender = ""
-            if len(part) == 1:
-                number = "s"
-                gender = "m"
-            if len(part) >= 2:
-                if part[1] == "SG":
-                    number = "s"
-                elif part[1] == "PL":
-                    number = "p"
-                elif part[1] == "Mas":
-                    gender = "m"
-                elif part[1] == "Fem":
-                    gender = "f"
-            if len(part) >= 3:
-                if part[2] == "SG":
-                    number = "s"
-                elif part[2] == "PL":
-                    number = "p"
-                elif part[2] == "P1":
-                    person = "1"
-                elif part[2] == "P2":
-                    person = "2"
-                elif part[2] == "P3":
-                    person = "3"
-            suffix = suffix_s
-            if auxiliary == "être" and number == "p":
-                suffix = suffix_p
 
-            if part[0] == "IPre":
-                conjugated_verb["Indicatif"]["Présent"][number][person] = conjugation
-                if suffix:
-                    conjugated_verb["Indicatif"]["Passé composé"][number][person] = \
-                        aux[auxiliary]["Indicatif"]["Présent"][number][person] + suffix
-            elif part[0] == "IImp":
-                conjugated_verb["Indicatif"]["Imparfait"][number][person] = conjugation
-                if suffix:
-                    conjugated_verb["Indicatif"]["Plus-que-parfait"][number][person] = \
-                        aux[auxiliary]["Indicatif"]["Imparfait"][number][person] + suffix
-            elif part[0] == "IPSim":
-                conjugated_verb["Indicatif"]["Passé simple"][number][person] = conjugation
-                if suffix:
-                    conjugated_verb["Indicatif"]["Passé antérieur"][number][person] = \
-                        aux[auxiliary]["Indicatif"]["Passé simple"][number][person] + suffix
-            elif part[0] == "IFut":
-                conjugated_verb["Indicatif"]["Futur simple"][number][person] = conjugation
-                if suffix:
-                    conjugated_verb["Indicatif"]["Futur antérieur"][number][person] = \
-                        aux[auxiliary]["Indicatif"]["Futur simple"][number][person] + suffix
-            elif part[0] == "CPre":
-                conjugated_verb["Conditionnel"]["Présent"][number][person] = conjugation
-                if suffix:
-                    conjugated_verb["Conditionnel"]["Passé"][number][person] = \
-                        aux[auxiliary]["Conditionnel"]["Présent"][number][person] + suffix
-            elif part[0] == "SPre":
-                conjugated_verb["Subjonctif"]["Présent"][number][person] = conjugation
-                if suffix:
-                    conjugated_verb["Subjonctif"]["Passé"][number][person] = \
-                        aux[auxiliary]["Subjonctif"]["Présent"][number][person] + suffix
-            elif part[0] == "SImp":
-                conjugated_verb["Subjonctif"]["Imparfait"][number][person] = conjugation
-                if suffix:
-                    conjugated_verb["Subjonctif"]["Plus-que-parfait"][number][person] = \
-                        aux[auxiliary]["Subjonctif"]["Imparfait"][number][person] + suffix
-            elif part[0] == "ImPre":
-                conjugated_verb["Impératif"]["Présent"][number][person] = conjugation
-                if suffix:
-                    conjugated_verb["Impératif"]["Passé"][number][person] = \
-                        aux[auxiliary]["Impératif"]["Présent"][number][person] + suffix
-            elif part[0] == "PPre":
+################################################################################
+def unpack_inflection(inflection):
+    """Return the mode, tense, person, number and gender of a packed inflection"""
+    mode, tense = PACKED_TENSES[inflection >> 6]
+    return (
+        mode,
+        tense,
+        PACKED_PERSONS[(inflection >> 4) & 3],
+        PACKED_NUMBERS[(inflection >> 2) & 3],
+        PACKED_GENDERS[inflection & 3],
+    )
+
+
+################################################################################
+def pack_dela_inflection(inflection):
+    """Return the packed integer of a DELA inflection, or 0 if it's not a conjugation"""
+    tense = DELA_PACKED_TENSES.get(inflection[:1], 0)
+    if tense == 0 or tense == PACKED_PRESENT_PARTICIPLE:
+        return tense << 6
+    if tense == PACKED_PAST_PARTICIPLE:
+        # Kms: gender, then number
+        return pack_inflection(tense, "", inflection[2:3], inflection[1:2])
+
+    # P1s: person, then number
+    return pack_inflection(tense, inflection[1:2], inflection[2:3])
+
+
+################################################################################
+def pack_abu_inflection(inflection):
+    """Return the packed integer of an ABU inflection, or 0 if it's not a conjugation"""
+    part = inflection.split("+")
+    tense = ABU_PACKED_TENSES.get(part[0], 0)
+    if tense == 0 or tense == PACKED_PRESENT_PARTICIPLE:
+        # All the present participle forms go in the same cell:
+        return tense << 6
+
+    number = ""
+    person = ""
+    gender = ""
+    if len(part) == 1:
+        number = "s"
+        gender = "m"
+    if len(part) >= 2:
+        if part[1] == "SG":
+            number = "s"
+        elif part[1] == "PL":
+            number = "p"
+        elif part[1] == "Mas":
+            gender = "m"
+        elif part[1] == "Fem":
+            gender = "f"
+    if len(part) >= 3:
+        if part[2] == "SG":
+            number = "s"
+        elif part[2] == "PL":
+            number = "p"
+        elif part[2] in ("P1", "P2", "P3"):
+            person = part[2][1]
+
+    return pack_inflection(tense, person, number, gender)
+
+
+################################################################################
+def pack_inflections(inflections, dictionary_type):
+    """Return the tuple of packed integers of the inflections part of a dictionary line"""
+    # There are only a hundred or so different inflections parts, each decoded only once:
+    decoded = packed_inflections[dictionary_type]
+    if inflections not in decoded:
+        if dictionary_type == "DELA":
+            pack = pack_dela_inflection
+        else:
+            pack = pack_abu_inflection
+        decoded[inflections] = tuple(
+            packed
+            for packed in [pack(inflection) for inflection in inflections.split(":")]
+            if packed
+        )
+
+    return decoded[inflections]
+
+
+################################################################################
+def pack_verb_lines(lines, dictionary_type):
+    """Return the (form, packed inflections) pairs of dictionary verb lines"""
+    separator = ","
+    if dictionary_type == "ABU":
+        separator = "	"
+    packed_lines = []
+    for line in lines:
+        position = line.find(":")
+        if position == -1:
+            continue
+        packed_lines.append((
+            line[:line.find(separator)],
+            pack_inflections(line[position + 1:], dictionary_type)
+        ))
+
+    return packed_lines
+
+
+################################################################################
+def copy_verb_structure(structure):
+    """Return a copy of a verb data structure, only made of dicts and strings"""
+    # This is much faster than copy.deepcopy(), which has to handle any kind of object:
+    return {
+        key: copy_verb_structure(value) if isinstance(value, dict) else value
+        for key, value in structure.items()
+    }
+
+
+################################################################################
+def fill_verb_from_packed_data(verb, packed_conjugations):
+    """Fill a verb data structure simple tenses from packed dictionary data"""
+    conjugated_verb = copy_verb_structure(blank_verb)
+    conjugated_verb["Infinitif"]["Présent"] = verb
+
+    for conjugation, inflections in packed_conjugations:
+        for inflection in inflections:
+            tense = inflection >> 6
+            number = PACKED_NUMBERS[(inflection >> 2) & 3]
+            if tense == PACKED_PRESENT_PARTICIPLE:
                 conjugated_verb["Participe"]["Présent"] = conjugation
                 conjugated_verb["Gérondif"]["Présent"] = conjugation
-                if suffix:
-                    conjugated_verb["Participe"]["Passé"]["a"] = \
-                        aux[auxiliary]["Participe"]["Présent"] + suffix
-                    conjugated_verb["Gérondif"]["Passé"] = \
-                        conjugated_verb["Participe"]["Passé"]["a"]
-            elif part[0] == "PPas":
-                conjugated_verb["Participe"]["Passé"][number][gender] = conjugation
+            elif tense == PACKED_PAST_PARTICIPLE:
+                conjugated_verb["Participe"]["Passé"][number][PACKED_GENDERS[inflection & 3]] = \
+                    conjugation
+            else:
+                mode, tense = PACKED_TENSES[tense]
+                conjugated_verb[mode][tense][number][PACKED_PERSONS[(inflection >> 4) & 3]] = \
+                    conjugation
+
+    return conjugated_verb
+
+
+################################################################################
+def fill_verb_from_dela_dictionary_data(verb, conjugations):
+    """Fill a verb data structure simple tenses from dictionary data"""
+    time_start = time.time()
+
+    # Conjugation lines have this format:
+    # conjugated_verb,unconjugated_verb.V+optional_subclass:inflection1:Inflection2:inflectionN
+    conjugated_verb = fill_verb_from_packed_data(verb, pack_verb_lines(conjugations, "DELA"))
+
+    time_stop = time.time()
+    logging.debug(
+        "fill_verb_from_dela_dictionary_data() "
+        + _("time")
+        + ": %f / "
+        + _("conjugations")
+        + ": %d",
+        time_stop - time_start, len(conjugations)
+    )
+
+    return conjugated_verb
+
+
+################################################################################
+def fill_verb_from_abu_dictionary_data(verb, conjugations):
+    """Fill a verb data structure simple tenses from dictionary data"""
+    time_start = time.time()
+
+    # Conjugation lines have this format:
+    # conjugated_verb	unconjugated_verb	Ver:inflection1:Inflection2:inflectionN
+    conjugated_verb = fill_verb_from_packed_data(verb, pack_verb_lines(conjugations, "ABU"))
 
     time_stop = time.time()
     logging.debug(
@@ -623,41 +1875,1359 @@ def fill_verb_from_abu_dictionary_data(verb, conjugations, auxiliary):
 
 
 ################################################################################
-# conjuguer = conjugate in French
-def conjuguer(verb, conjugations, auxiliary):
-    """Conjugation wrapper to do the (future) dirty work..."""
-    if parameters["Dictionary type"] == "DELA":
-        conjugated_verb = fill_verb_from_dela_dictionary_data(verb, conjugations, auxiliary)
-    elif parameters["Dictionary type"] == "ABU":
-        conjugated_verb = fill_verb_from_abu_dictionary_data(verb, conjugations, auxiliary)
-    return conjugated_verb
+def fill_verb_from_dictionary_data(verb, conjugations, dictionary_type=None):
+    """Return a verb data structure with only its simple tenses, whatever the auxiliary"""
+    if dictionary_type is None:
+        dictionary_type = parameters["Dictionary type"]
+    conjugated_verb = None
+    if dictionary_type == "DELA":
+        conjugated_verb = fill_verb_from_dela_dictionary_data(verb, conjugations)
+    elif dictionary_type == "ABU":
+        conjugated_verb = fill_verb_from_abu_dictionary_data(verb, conjugations)
+
+    if conjugated_verb is not None and not conjugated_verb["Participe"]["Passé"]["s"]["m"]:
+        logging.warning(_("Infinitif passé not found for") + " %s", verb)
+
+    return conjugated_verb
+
+
+################################################################################
+def add_compound_tenses(simple_verb, auxiliary):
+    """Return a new verb data structure adding the compound tenses for an auxiliary
+    The simple tenses are shared with (not copied from) the simple_verb structure"""
+    time_start = time.time()
+
+    # We first need the "Participe passé" tense for this verb:
+    suffix_s = ""
+    suffix_p = ""
+    if simple_verb["Participe"]["Passé"]["s"]["m"]:
+        suffix_s = " " + simple_verb["Participe"]["Passé"]["s"]["m"]
+    if simple_verb["Participe"]["Passé"]["p"]["m"]:
+        suffix_p = " " + simple_verb["Participe"]["Passé"]["p"]["m"]
+    if not suffix_p:
+        suffix_p = suffix_s
+
+    conjugated_verb = {}
+    for mode in simple_verb.keys():
+        conjugated_verb[mode] = dict(simple_verb[mode])
+
+    if suffix_s:
+        conjugated_verb["Infinitif"]["Passé"] = auxiliary + suffix_s
+
+    for mode, simple_tense, compound_tense in COMPOUND_TENSES:
+        tense = {}
+        for number in simple_verb[mode][simple_tense].keys():
+            tense[number] = {}
+            suffix = suffix_s
+            if auxiliary == "être" and number == "p":
+                suffix = suffix_p
+            for person in simple_verb[mode][simple_tense][number].keys():
+                tense[number][person] = ""
+                if suffix and simple_verb[mode][simple_tense][number][person]:
+                    tense[number][person] = \
+                        aux[auxiliary][mode][simple_tense][number][person] + suffix
+        conjugated_verb[mode][compound_tense] = tense
+
+    conjugated_verb["Participe"]["Passé"] = dict(simple_verb["Participe"]["Passé"])
+    if suffix_s and simple_verb["Participe"]["Présent"]:
+        conjugated_verb["Participe"]["Passé"]["a"] = \
+            aux[auxiliary]["Participe"]["Présent"] + suffix_s
+        conjugated_verb["Gérondif"]["Passé"] = conjugated_verb["Participe"]["Passé"]["a"]
+
+    time_stop = time.time()
+    logging.debug("add_compound_tenses() " + _("time") + ": %f", time_stop - time_start)
+
+    return conjugated_verb
+
+
+################################################################################
+# conjuguer = conjugate in French
+def conjuguer(verb, conjugations, auxiliary):
+    """Conjugation wrapper to do the (future) dirty work..."""
+    return add_compound_tenses(fill_verb_from_dictionary_data(verb, conjugations), auxiliary)
+
+
+################################################################################
+def get_auxiliary(verb):
+    """Return the auxiliary of a verb, the first one for those using both"""
+    if verb in etre_aux or verb in both_aux:
+        return "être"
+    return "avoir"
+
+
+################################################################################
+def get_conjugated_verbs(verb, conjugations, dictionary_type=None):
+    """Return the conjugations of a verb with the auxiliary (or auxiliaries) it uses"""
+    # The simple tenses are the same whatever the auxiliary:
+    simple_verb = fill_verb_from_dictionary_data(verb, conjugations, dictionary_type)
+    conjugated_verbs = [add_compound_tenses(simple_verb, get_auxiliary(verb))]
+    if verb in both_aux:
+        conjugated_verbs.append(add_compound_tenses(simple_verb, "avoir"))
+
+    return conjugated_verbs
+
+
+################################################################################
+def conjugate_verb(verb, layers):
+    """Return the conjugations of a verb with the auxiliary (or auxiliaries) it uses,
+    and the dictionary where it was found, or an empty list and None"""
+    conjugations, layer = select_verb_from_layers(verb, layers)
+    if not conjugations:
+        return [], None
+
+    return get_conjugated_verbs(verb, conjugations, layer["Type"]), layer
+
+
+################################################################################
+def get_cells(mode="", tense="", person="", number=""):
+    """Return the keys paths in a verb data structure of the cells matching a point query
+    The person is the gender for the past participles"""
+    cells = []
+    for cell_mode, tenses in blank_verb.items():
+        if mode and cell_mode != mode:
+            continue
+        for cell_tense, numbers in tenses.items():
+            if tense and cell_tense != tense:
+                continue
+            if isinstance(numbers, str):
+                if not person and not number:
+                    cells.append((cell_mode, cell_tense))
+                continue
+            for cell_number, persons in numbers.items():
+                if isinstance(persons, str):
+                    # The compound past participle, "ayant aimé":
+                    if not person and not number:
+                        cells.append((cell_mode, cell_tense, cell_number))
+                    continue
+                if number and cell_number != number:
+                    continue
+                for cell_person in persons.keys():
+                    if not person or cell_person == person:
+                        cells.append((cell_mode, cell_tense, cell_number, cell_person))
+
+    return cells
+
+
+################################################################################
+def get_cell_inflection(cell):
+    """Return the packed inflection of a simple tense cell, or 0 for the other cells"""
+    mode, tense = cell[0], cell[1]
+    if mode == "Gérondif" and tense == "Présent":
+        return pack_inflection(PACKED_PRESENT_PARTICIPLE)
+    if [mode, tense] not in PACKED_TENSES or len(cell) == 3:
+        return 0
+
+    packed_tense = PACKED_TENSES.index([mode, tense])
+    if len(cell) == 2:
+        return pack_inflection(packed_tense)
+    if mode == "Participe":
+        return pack_inflection(packed_tense, "", cell[2], cell[3])
+    return pack_inflection(packed_tense, cell[3], cell[2])
+
+
+################################################################################
+def get_compound_packed_tenses(cells):
+    """Return the packed tenses needed to build compound tense cells"""
+    simple_tenses = {}
+    for mode, simple_tense, compound_tense in COMPOUND_TENSES:
+        simple_tenses[(mode, compound_tense)] = PACKED_TENSES.index([mode, simple_tense])
+
+    # All of them need the past participle:
+    packed_tenses = set([PACKED_PAST_PARTICIPLE])
+    for cell in cells:
+        mode, tense = cell[0], cell[1]
+        if (mode, tense) in simple_tenses:
+            packed_tenses.add(simple_tenses[(mode, tense)])
+        elif mode != "Infinitif":
+            # Participe passé composé and Gérondif passé:
+            packed_tenses.add(PACKED_PRESENT_PARTICIPLE)
+
+    return packed_tenses
+
+
+################################################################################
+def get_verb_cells(conjugated_verb, cells):
+    """Return the forms of cells of a verb data structure"""
+    forms = []
+    for cell in cells:
+        form = conjugated_verb
+        for key in cell:
+            form = form[key]
+        forms.append(form)
+
+    return forms
+
+
+################################################################################
+def get_cells_forms(verb, conjugations, cells, dictionary_type=None, auxiliary=None):
+    """Return the forms of cells from the dictionary lines of a verb, only filling these cells"""
+    time_start = time.time()
+    if dictionary_type is None:
+        dictionary_type = parameters["Dictionary type"]
+    packed_conjugations = pack_verb_lines(conjugations, dictionary_type)
+
+    # The simple tenses cells are directly read from their packed inflections:
+    packed_forms = {}
+    for form, inflections in packed_conjugations:
+        for inflection in inflections:
+            packed_forms[inflection] = form
+    forms = []
+    compound_cells = []
+    for cell in cells:
+        if cell == ("Infinitif", "Présent"):
+            forms.append(verb)
+        else:
+            inflection = get_cell_inflection(cell)
+            if not inflection:
+                compound_cells.append(cell)
+            forms.append(packed_forms.get(inflection, ""))
+
+    # The compound tenses are only built when asked for, from the tenses they need:
+    if compound_cells:
+        if auxiliary is None:
+            auxiliary = get_auxiliary(verb)
+        packed_tenses = get_compound_packed_tenses(compound_cells)
+        needed_conjugations = []
+        for form, inflections in packed_conjugations:
+            inflections = [
+                inflection for inflection in inflections if inflection >> 6 in packed_tenses
+            ]
+            if inflections:
+                needed_conjugations.append((form, inflections))
+        conjugated_verb = add_compound_tenses(
+            fill_verb_from_packed_data(verb, needed_conjugations), auxiliary
+        )
+        compound_forms = dict(zip(compound_cells, get_verb_cells(conjugated_verb, compound_cells)))
+        for i, cell in enumerate(cells):
+            if cell in compound_forms:
+                forms[i] = compound_forms[cell]
+
+    time_stop = time.time()
+    logging.debug(
+        "get_cells_forms() " + _("time") + ": %f / " + _("conjugations") + ": %d",
+        time_stop - time_start, len(conjugations)
+    )
+
+    return forms
+
+
+################################################################################
+def conjugate_cell(
+    verb, mode, tense, person="", number="", verbs=None, dictionary_type=None, auxiliary=None
+):
+    """Return the forms of a verb in a single cell (the first one matching), with the auxiliary
+    (or auxiliaries) it uses, from the verbs given or else from the dictionaries stack"""
+    cells = get_cells(mode, tense, person, number)
+    if not cells:
+        return []
+    if verbs is None:
+        # The dictionaries are loaded through their verbs indexes, when cached:
+        conjugations, layer = select_verb_from_layers(verb, get_dictionary_layers())
+        if layer is not None:
+            dictionary_type = layer["Type"]
+    else:
+        conjugations = select_verb_from_verbs(verb, verbs, dictionary_type)
+    if not conjugations:
+        return []
+
+    if auxiliary is not None:
+        auxiliaries = [auxiliary]
+    else:
+        auxiliaries = [get_auxiliary(verb)]
+        if verb in both_aux:
+            auxiliaries.append("avoir")
+
+    return [
+        get_cells_forms(verb, conjugations, cells[:1], dictionary_type, verb_auxiliary)[0]
+        for verb_auxiliary in auxiliaries
+    ]
+
+
+################################################################################
+def analyze_verb(verb):
+    """Return a verb pattern (empty if none matches), group and conjugation model"""
+    pattern = ""
+    group = None
+    group_text = ""
+    model = ""
+
+    for key in patterns.keys():
+        if verb.endswith(key):
+            pattern = key
+            group = patterns[key][0]
+            model = patterns[key][1]
+            break
+
+    if group == 0:
+        group_text = _("auxiliary")
+    elif group == 1:
+        group_text = _("1st group")
+    elif group == 2:
+        group_text = _("2nd group")
+    elif group == 3:
+        group_text = _("3rd group")
+    else:
+        group_text = _("unknown group")
+
+    return pattern, group_text, model
+
+
+################################################################################
+def split_verb_from_template(verb, template):
+    """Return the stem and varying consonants of a verb matching a model template, or None"""
+    if "?" not in template:
+        if verb.endswith(template):
+            return verb[:len(verb) - len(template)], ""
+        return None
+
+    # The varying consonants are searched from the shortest to the longest:
+    before, after = template.split("?")
+    if verb.endswith(after):
+        for length in range(1, 4):
+            position = len(verb) - len(after) - length - len(before)
+            if position < 0:
+                break
+            if verb[position:position + len(before)] == before:
+                return verb[:position], verb[position + len(before):len(verb) - len(after)]
+
+    return None
+
+
+################################################################################
+def generate_verb_from_model(verb, model=None):
+    """Return a verb data structure with its simple tenses generated from its model, or None"""
+    time_start = time.time()
+    if model is None:
+        model = analyze_verb(verb)[2]
+    if model not in models:
+        return None
+    split = split_verb_from_template(verb, models[model]["Template"])
+    if split is None:
+        return None
+    stem, consonants = split
+
+    def inflect(ending):
+        if ending is None:
+            return ""
+        return stem + ending.replace("?", consonants)
+
+    conjugated_verb = copy_verb_structure(blank_verb)
+    conjugated_verb["Infinitif"]["Présent"] = verb
+    for inflection, (mode, tense) in SIMPLE_TENSES.items():
+        endings = models[model][inflection]
+        for i, person in enumerate(["1", "2", "3"]):
+            conjugated_verb[mode][tense]["s"][person] = inflect(endings[i])
+            conjugated_verb[mode][tense]["p"][person] = inflect(endings[i + 3])
+    for i, (number, person) in enumerate([["s", "2"], ["p", "1"], ["p", "2"]]):
+        conjugated_verb["Impératif"]["Présent"][number][person] = \
+            inflect(models[model]["Y"][i])
+    conjugated_verb["Participe"]["Présent"] = inflect(models[model]["G"][0])
+    conjugated_verb["Gérondif"]["Présent"] = conjugated_verb["Participe"]["Présent"]
+    for i, (number, gender) in enumerate([["s", "m"], ["s", "f"], ["p", "m"], ["p", "f"]]):
+        conjugated_verb["Participe"]["Passé"][number][gender] = inflect(models[model]["K"][i])
+
+    time_stop = time.time()
+    logging.debug("generate_verb_from_model() " + _("time") + ": %f", time_stop - time_start)
+
+    return conjugated_verb
+
+
+################################################################################
+def parse_verb_line(line, dictionary_type):
+    """Return the form, lemma, key and inflections of a dictionary verb line"""
+    if dictionary_type == "DELA":
+        # form,lemma.V+optional_subclass:inflection1:inflectionN
+        # (the lemma is omitted when it's the same as the form)
+        form, rest = line.split(",", 1)
+        position = rest.find(".V")
+        lemma = rest[:position]
+        if not lemma:
+            lemma = form
+        parts = rest[position:].split(":")
+    else:
+        # form	lemma	Ver:inflection1:inflectionN
+        form, lemma, rest = line.split("	", 2)
+        parts = rest.split(":")
+
+    return form, lemma, parts[0], parts[1:]
+
+
+################################################################################
+def get_verb_inflections(simple_verb, dictionary_type):
+    """Return the (form, inflection) pairs of a verb data structure simple tenses"""
+    inflections = []
+
+    def add(form, dela_inflection, abu_inflection):
+        if form:
+            if dictionary_type == "DELA":
+                inflections.append((form, dela_inflection))
+            else:
+                inflections.append((form, abu_inflection))
+
+    add(simple_verb["Infinitif"]["Présent"], "W", "Inf")
+    for inflection, (mode, tense) in SIMPLE_TENSES.items():
+        for number, abu_number in [["s", "SG"], ["p", "PL"]]:
+            for person in ["1", "2", "3"]:
+                add(
+                    simple_verb[mode][tense][number][person],
+                    inflection + person + number,
+                    ABU_TENSES[inflection] + "+" + abu_number + "+P" + person
+                )
+    for number, abu_number, person in [["s", "SG", "2"], ["p", "PL", "1"], ["p", "PL", "2"]]:
+        add(
+            simple_verb["Impératif"]["Présent"][number][person],
+            "Y" + person + number,
+            "ImPre+" + abu_number + "+P" + person
+        )
+    add(simple_verb["Participe"]["Présent"], "G", "PPre")
+    for number, abu_number in [["s", "SG"], ["p", "PL"]]:
+        for gender, abu_gender in [["m", "Mas"], ["f", "Fem"]]:
+            add(
+                simple_verb["Participe"]["Passé"][number][gender],
+                "K" + gender + number,
+                "PPas+" + abu_gender + "+" + abu_number
+            )
+
+    return inflections
+
+
+################################################################################
+def get_lemmas_inflections(verbs, dictionary_type):
+    """Return the (form, key, inflection) triples of each lemma in dictionary lines order"""
+    lemmas = {}
+    for line in verbs:
+        form, lemma, key, inflections = parse_verb_line(line, dictionary_type)
+        if lemma not in lemmas:
+            lemmas[lemma] = collections.OrderedDict()
+        for inflection in inflections:
+            lemmas[lemma][(form, key, inflection)] = True
+
+    return lemmas
+
+
+################################################################################
+def get_model_inflections(verb, model, key, dictionary_type):
+    """Return the list of (form, key, inflection) triples of a verb conjugated like a model"""
+    simple_verb = generate_verb_from_model(verb, model)
+    if simple_verb is None:
+        return [(verb, key, LEXICON_INFINITIVES[dictionary_type])]
+
+    return [
+        (form, key, inflection)
+        for form, inflection in get_verb_inflections(simple_verb, dictionary_type)
+    ]
+
+
+################################################################################
+def build_lexicon_entry(lemma, ordered_triples, dictionary_type):
+    """Return a lexicon entry: conjugation model, key and exceptions to the model"""
+    triples = set(ordered_triples)
+    keys = collections.Counter([triple[1] for triple in triples])
+    key = keys.most_common(1)[0][0]
+
+    # The model given by the verb pattern is used, unless another one fits better:
+    best_model = analyze_verb(lemma)[2]
+    best_inflections = get_model_inflections(lemma, best_model, key, dictionary_type)
+    best_exceptions = triples.symmetric_difference(best_inflections)
+    if best_exceptions:
+        for model in models.keys():
+            if model != best_model \
+            and split_verb_from_template(lemma, models[model]["Template"]) is not None:
+                inflections = get_model_inflections(lemma, model, key, dictionary_type)
+                exceptions = triples.symmetric_difference(inflections)
+                if len(exceptions) < len(best_exceptions):
+                    best_model = model
+                    best_inflections = inflections
+                    best_exceptions = exceptions
+
+    # The generated inflections missing from the dictionary are given as a bit mask:
+    mask = 0
+    for i, triple in enumerate(best_inflections):
+        if triple not in triples:
+            mask |= 1 << i
+
+    # The dictionary lines order is kept, as the last form of an inflection is the one displayed.
+    # The exceptions coming before a generated form of the same inflection are marked with "<":
+    positions = {}
+    for i, triple in enumerate(ordered_triples):
+        positions[triple] = i
+    generated_positions = {}
+    for triple in best_inflections:
+        if triple in positions:
+            generated_positions[triple[2]] = positions[triple]
+
+    fields = [best_model, key, "%x" % mask if mask else ""]
+    generated = set(best_inflections)
+    for form, exception_key, inflection in ordered_triples:
+        if (form, exception_key, inflection) in generated:
+            continue
+        exception = form + ":" + inflection
+        if exception_key != key:
+            exception += ":" + exception_key
+        if positions[(form, exception_key, inflection)] < generated_positions.get(inflection, -1):
+            exception = "<" + exception
+        fields.append(exception)
+
+    return "	".join(fields).rstrip("	")
+
+
+################################################################################
+def build_lexicon(verbs):
+    """Return a model-compressed lexicon of the verbs lines of the dictionary"""
+    time_start = time.time()
+    lexicon = {}
+    lemmas = get_lemmas_inflections(verbs, parameters["Dictionary type"])
+    for lemma in sorted(lemmas.keys()):
+        lexicon[lemma] = build_lexicon_entry(lemma, lemmas[lemma], parameters["Dictionary type"])
+
+    time_stop = time.time()
+    logging.debug(
+        "build_lexicon() " + _("time") + ": %f / " + _("lemmas") + ": %d",
+        time_stop - time_start, len(lexicon)
+    )
+
+    return lexicon
+
+
+################################################################################
+def expand_lexicon_entry(lemma, entry, dictionary_type):
+    """Return the dictionary lines regenerated from a lexicon entry"""
+    fields = entry.split("	")
+    model = fields[0]
+    key = fields[1]
+    mask = 0
+    if len(fields) > 2 and fields[2]:
+        mask = int(fields[2], 16)
+
+    first_triples = []
+    generated_triples = []
+    last_triples = []
+    for i, triple in enumerate(get_model_inflections(lemma, model, key, dictionary_type)):
+        if not mask & (1 << i):
+            generated_triples.append(triple)
+    for exception in fields[3:]:
+        parts = exception.lstrip("<").split(":")
+        if len(parts) == 2:
+            parts.append(key)
+        if exception.startswith("<"):
+            first_triples.append((parts[0], parts[2], parts[1]))
+        else:
+            last_triples.append((parts[0], parts[2], parts[1]))
+
+    # The inflections of a form are grouped on a same line,
+    # without moving the exceptions before or after the generated forms:
+    lines = collections.OrderedDict()
+    for part, triples in enumerate([first_triples, generated_triples, last_triples]):
+        for form, line_key, inflection in triples:
+            if (part, form, line_key) in lines:
+                lines[(part, form, line_key)].append(inflection)
+            else:
+                lines[(part, form, line_key)] = [inflection]
+
+    expanded_lines = []
+    for (part, form, line_key), inflections in lines.items():
+        if dictionary_type == "DELA":
+            if form == lemma:
+                expanded_lines.append(form + "," + line_key + ":" + ":".join(inflections))
+            else:
+                expanded_lines.append(
+                    form + "," + lemma + line_key + ":" + ":".join(inflections)
+                )
+        else:
+            expanded_lines.append(form + "	" + lemma + "	" + line_key + ":" + ":".join(inflections))
+
+    return expanded_lines
+
+
+################################################################################
+def check_lexicon(lexicon, verbs):
+    """Return the lemmas whose lexicon entry doesn't regenerate the dictionary lines"""
+    errors = []
+    lemmas = get_lemmas_inflections(verbs, parameters["Dictionary type"])
+    for lemma in sorted(set(lemmas.keys()) | set(lexicon.keys())):
+        if lemma not in lemmas or lemma not in lexicon:
+            errors.append(lemma)
+            continue
+        expanded_lines = expand_lexicon_entry(lemma, lexicon[lemma], parameters["Dictionary type"])
+        expanded_lemmas = get_lemmas_inflections(expanded_lines, parameters["Dictionary type"])
+        if lemma not in expanded_lemmas \
+        or set(expanded_lemmas[lemma].keys()) != set(lemmas[lemma].keys()):
+            errors.append(lemma)
+
+    return errors
+
+
+################################################################################
+def save_lexicon(lexicon, pathname):
+    """Write a lexicon file"""
+    with open(pathname, "w", encoding="utf-8") as file:
+        file.write(LEXICON_HEADER + " " + parameters["Dictionary type"] + "\n")
+        for lemma, entry in lexicon.items():
+            file.write(lemma + "	" + entry + "\n")
+
+
+################################################################################
+def is_lexicon(pathname):
+    """Return True if a file is a lexicon"""
+    with open_dictionary(pathname) as file:
+        return file.readline().startswith(LEXICON_HEADER + " ")
+
+
+################################################################################
+def load_lexicon(pathname):
+    """Return the lexicon stored in a file"""
+    lexicon = {}
+    with open_dictionary(pathname) as file:
+        for line in file:
+            if not line.startswith(LEXICON_HEADER):
+                lemma, entry = line.rstrip("\n").split("	", 1)
+                lexicon[lemma] = entry
+
+    return lexicon
+
+
+################################################################################
+def make_lexicon(pathname, verbs):
+    """Build a lexicon file from the dictionary, and check it regenerates the dictionary"""
+    if is_lexicon(parameters["Dictionary path"]):
+        logging.critical(_("The selected dictionary is already a lexicon"))
+        return False
+
+    lexicon = build_lexicon(verbs)
+    save_lexicon(lexicon, pathname)
+
+    errors = check_lexicon(load_lexicon(pathname), verbs)
+    for lemma in errors:
+        logging.error(_("Lexicon doesn't regenerate the dictionary lines for") + " %s", lemma)
+
+    dictionary_size = 0
+    for line in verbs:
+        dictionary_size += len(line.encode("utf-8")) + 1
+    exceptions = 0
+    for entry in lexicon.values():
+        exceptions += max(entry.count("	") - 2, 0)
+    print(_("Lemmas") + ": %d" % len(lexicon))
+    print(_("Exceptions to the models") + ": %d" % exceptions)
+    print(_("Dictionary verbs lines size") + ": %d" % dictionary_size)
+    print(_("Lexicon size") + ": %d" % os.path.getsize(pathname))
+
+    return len(errors) == 0
+
+
+################################################################################
+def get_cells_order():
+    """Return the DELA inflection codes of all the verb cells, in display order"""
+    cells = ["W"]
+    for inflection in SIMPLE_TENSES:
+        for number in ["s", "p"]:
+            for person in ["1", "2", "3"]:
+                cells.append(inflection + person + number)
+    cells += ["Y2s", "Y1p", "Y2p", "G", "Kms", "Kfs", "Kmp", "Kfp"]
+
+    return cells
+
+
+################################################################################
+def get_dela_inflection(abu_inflection):
+    """Return the DELA inflection code matching an ABU one, or None"""
+    part = abu_inflection.split("+")
+    numbers = {"SG": "s", "PL": "p"}
+    genders = {"Mas": "m", "Fem": "f"}
+    if part[0] == "Inf":
+        return "W"
+    if part[0] == "PPre":
+        # Present participles used as adjectives also have inflected forms:
+        if len(part) == 1 or part[1:3] == ["Mas", "SG"]:
+            return "G"
+        return None
+    if part[0] == "PPas":
+        if len(part) == 1:
+            return "Kms"
+        if len(part) >= 3 and part[1] in genders and part[2] in numbers:
+            return "K" + genders[part[1]] + numbers[part[2]]
+        return None
+    if len(part) < 3 or part[1] not in numbers or part[2][1:2] not in ("1", "2", "3"):
+        return None
+    if part[0] in ("ImPre", "Imp"):
+        return "Y" + part[2][1] + numbers[part[1]]
+    for inflection, abu_tense in ABU_TENSES.items():
+        if part[0] == abu_tense:
+            return inflection + part[2][1] + numbers[part[1]]
+
+    return None
+
+
+################################################################################
+def get_lemma_cells(lines, dictionary_type):
+    """Return the forms of each cell of a lemma, indexed by DELA inflection code"""
+    cells = {}
+    for line in lines:
+        form, _lemma, _key, inflections = parse_verb_line(line, dictionary_type)
+        for inflection in inflections:
+            if dictionary_type == "ABU":
+                inflection = get_dela_inflection(inflection)
+                if inflection is None:
+                    continue
+            if inflection not in cells:
+                cells[inflection] = []
+            if form not in cells[inflection]:
+                cells[inflection].append(form)
+
+    return cells
+
+
+################################################################################
+def compare_lemma_conjugations(arguments):
+    """Return the report lines of the cells differing between the DELA and ABU lines of a lemma"""
+    lemma, dela_lines, abu_lines = arguments
+    dela_cells = get_lemma_cells(dela_lines, "DELA")
+    abu_cells = get_lemma_cells(abu_lines, "ABU")
+    cells_order = get_cells_order()
+    other_cells = sorted((set(dela_cells.keys()) | set(abu_cells.keys())) - set(cells_order))
+
+    report = []
+    for cell in cells_order + other_cells:
+        if cell in dela_cells and cell in abu_cells:
+            if sorted(dela_cells[cell]) != sorted(abu_cells[cell]):
+                status = "DIFFERENT"
+            else:
+                continue
+        elif cell in dela_cells:
+            status = "MISSING_IN_ABU"
+        elif cell in abu_cells:
+            status = "MISSING_IN_DELA"
+        else:
+            continue
+        report.append([
+            status,
+            lemma,
+            cell,
+            ",".join(dela_cells.get(cell, [])),
+            ",".join(abu_cells.get(cell, [])),
+        ])
+
+    return report
+
+
+################################################################################
+def get_verbs_index(verbs):
+    """Return the verbs lines of a dictionary, or a lexicon, with their lemmas indexed"""
+    if verbs.lemmas is None:
+        verbs.index_lemmas()
+
+    return verbs
+
+
+################################################################################
+def get_typed_layer(layers, dictionary_type):
+    """Return the first dictionary of the given type in the stack, or None"""
+    for layer in layers:
+        if layer["Verbs"] is None:
+            layer["Type"], layer["Verbs"] = load_dictionary_layer(layer["Path"])
+            check_dictionary_layer(layer)
+        if layer["Type"] == dictionary_type:
+            return layer
+
+    return None
+
+
+################################################################################
+def compare_dictionaries(pathname, layers):
+    """Write a report of the differences between the first DELA and ABU dictionaries"""
+    time_start = time.time()
+    dela_layer = get_typed_layer(layers, "DELA")
+    abu_layer = get_typed_layer(layers, "ABU")
+    if dela_layer is None or abu_layer is None:
+        logging.critical(_("Comparing dictionaries needs both a DELA and an ABU dictionary"))
+        return False
+    dela_verbs = get_verbs_index(dela_layer["Verbs"])
+    abu_verbs = get_verbs_index(abu_layer["Verbs"])
+
+    shared_lemmas = sorted(set(dela_verbs.lemmas) & set(abu_verbs.lemmas))
+    dela_lemmas = sorted(set(dela_verbs.lemmas) - set(abu_verbs.lemmas))
+    abu_lemmas = sorted(set(abu_verbs.lemmas) - set(dela_verbs.lemmas))
+
+    statistics = collections.Counter()
+    with open(pathname, "w", encoding="utf-8") as file:
+        file.write(
+            COMPARISON_HEADER + "	" + dela_layer["Path"] + "	" + abu_layer["Path"] + "\n"
+        )
+
+        # The shared lemmas are compared in parallel:
+        with multiprocessing.Pool(initializer=initialize_worker, initargs=(parameters,)) as pool:
+            for report in pool.imap(
+                compare_lemma_conjugations,
+                [
+                    (lemma, dela_verbs.get_lemma_lines(lemma), abu_verbs.get_lemma_lines(lemma))
+                    for lemma in shared_lemmas
+                ],
+                64
+            ):
+                for line in report:
+                    statistics[line[0]] += 1
+                    file.write("	".join(line) + "\n")
+
+        for lemma in dela_lemmas:
+            file.write("ONLY_IN_DELA	" + lemma + "			\n")
+        for lemma in abu_lemmas:
+            file.write("ONLY_IN_ABU	" + lemma + "			\n")
+
+    print(_("Shared lemmas") + ": %d" % len(shared_lemmas))
+    print(_("Lemmas only in DELA") + ": %d" % len(dela_lemmas))
+    print(_("Lemmas only in ABU") + ": %d" % len(abu_lemmas))
+    print(_("Different cells") + ": %d" % statistics["DIFFERENT"])
+    print(_("Cells missing in ABU") + ": %d" % statistics["MISSING_IN_ABU"])
+    print(_("Cells missing in DELA") + ": %d" % statistics["MISSING_IN_DELA"])
+
+    time_stop = time.time()
+    logging.debug(
+        "compare_dictionaries() " + _("time") + ": %f / " + _("lemmas") + ": %d",
+        time_stop - time_start, len(shared_lemmas)
+    )
+
+    return True
+
+
+################################################################################
+def get_model_endings(model):
+    """Return the (DELA inflection code, ending) pairs of the existing forms of a model"""
+    endings = [("W", models[model]["Template"])]
+    for inflection in SIMPLE_TENSES:
+        for i, person_number in enumerate(["1s", "2s", "3s", "1p", "2p", "3p"]):
+            endings.append((inflection + person_number, models[model][inflection][i]))
+    for i, cell in enumerate(["Y2s", "Y1p", "Y2p"]):
+        endings.append((cell, models[model]["Y"][i]))
+    endings.append(("G", models[model]["G"][0]))
+    for i, cell in enumerate(["Kms", "Kfs", "Kmp", "Kfp"]):
+        endings.append((cell, models[model]["K"][i]))
+
+    return [(cell, ending) for cell, ending in endings if ending is not None]
+
+
+################################################################################
+def audit_model_verbs(arguments):
+    """Return the conformance statistics and deviating cells of a batch of verbs of a same model"""
+    model, lemmas, dictionary_type = arguments
+    conforming = 0
+    report = []
+    if model not in models:
+        for lemma, _lines in lemmas:
+            report.append(["UNMATCHED", model, lemma, "", "", ""])
+        return model, len(lemmas), conforming, report
+
+    # The model endings are computed once for all the verbs of the batch:
+    template = models[model]["Template"]
+    endings = get_model_endings(model)
+    defective_cells = set(get_cells_order()) - set([cell for cell, _ending in endings])
+
+    for lemma, lines in lemmas:
+        split = split_verb_from_template(lemma, template)
+        if split is None:
+            report.append(["UNMATCHED", model, lemma, "", "", ""])
+            continue
+        stem, consonants = split
+        cells = get_lemma_cells(lines, dictionary_type)
+
+        deviations = 0
+        for cell, ending in endings:
+            expected = stem + ending.replace("?", consonants)
+            if cell not in cells:
+                # Missing forms are reported, but don't count as deviations:
+                report.append(["MISSING", model, lemma, cell, expected, ""])
+            elif expected not in cells[cell]:
+                report.append(["DIFFERENT", model, lemma, cell, expected, ",".join(cells[cell])])
+                deviations += 1
+        for cell in get_cells_order():
+            if cell in defective_cells and cell in cells:
+                report.append(["UNEXPECTED", model, lemma, cell, "", ",".join(cells[cell])])
+                deviations += 1
+        if not deviations:
+            conforming += 1
+
+    return model, len(lemmas), conforming, report
+
+
+################################################################################
+def audit_dictionary(pathname, verbs):
+    """Write a report of the dictionary verbs not conjugated like their model"""
+    time_start = time.time()
+    verbs = get_verbs_index(verbs)
+
+    # Verbs are grouped by model, then audited in parallel batches:
+    model_lemmas = {}
+    for lemma in verbs.lemmas:
+        model = analyze_verb(lemma)[2]
+        if model not in model_lemmas:
+            model_lemmas[model] = []
+        model_lemmas[model].append((lemma, verbs.get_lemma_lines(lemma)))
+    batches = []
+    for model in sorted(model_lemmas.keys()):
+        for i in range(0, len(model_lemmas[model]), AUDIT_BATCH_SIZE):
+            batches.append(
+                (model, model_lemmas[model][i:i + AUDIT_BATCH_SIZE], parameters["Dictionary type"])
+            )
+
+    statistics = collections.OrderedDict()
+    with open(pathname, "w", encoding="utf-8") as file:
+        file.write(AUDIT_HEADER + "	" + parameters["Dictionary path"] + "\n")
+        with multiprocessing.Pool(initializer=initialize_worker, initargs=(parameters,)) as pool:
+            for model, lemmas, conforming, report in pool.imap(audit_model_verbs, batches):
+                if model not in statistics:
+                    statistics[model] = [0, 0]
+                statistics[model][0] += lemmas
+                statistics[model][1] += conforming
+                for line in report:
+                    file.write("	".join(line) + "\n")
+
+        for model, (lemmas, conforming) in statistics.items():
+            file.write(
+                "MODEL	" + model + "	%d	%d	%.1f\n" % (lemmas, conforming, 100 * conforming / lemmas)
+            )
+
+    total_lemmas = 0
+    total_conforming = 0
+    for model, (lemmas, conforming) in statistics.items():
+        print(
+            "%-20s %5d/%-5d %5.1f%%"
+            % (model or EMPTY_CONJUGATION, conforming, lemmas, 100 * conforming / lemmas)
+        )
+        total_lemmas += lemmas
+        total_conforming += conforming
+    if total_lemmas:
+        print(
+            _("Verbs following their model")
+            + ": %d/%d %.1f%%" % (total_conforming, total_lemmas, 100 * total_conforming / total_lemmas)
+        )
+
+    time_stop = time.time()
+    logging.debug(
+        "audit_dictionary() " + _("time") + ": %f / " + _("lemmas") + ": %d",
+        time_stop - time_start, total_lemmas
+    )
+
+    return True
+
+
+################################################################################
+def get_verb_attributes(lemma, cells):
+    """Return the queryable attributes of a verb"""
+    pattern, _group, model = analyze_verb(lemma)
+    attributes = []
+    if pattern:
+        attributes.append("group=%d" % patterns[pattern][0])
+        attributes.append("model=" + model)
+    if lemma in etre_aux or lemma in both_aux:
+        attributes.append("auxiliary=être")
+    if lemma not in etre_aux or lemma in both_aux:
+        attributes.append("auxiliary=avoir")
+    for cell in cells:
+        attributes.append("cell=" + cell)
+        if "tense=" + cell[0] not in attributes:
+            attributes.append("tense=" + cell[0])
+
+    return attributes
+
+
+################################################################################
+def build_attributes_index(verbs, dictionary_type):
+    """Return the sorted lemmas of a dictionary, and a compressed bitmap of them per attribute"""
+    time_start = time.time()
+    lemmas = get_verbs_index(verbs).lemmas
+
+    # Bit i of a bitmap is set when the lemma i has the attribute:
+    bitmaps = {}
+    for i, lemma in enumerate(lemmas):
+        lines = verbs.get_lemma_lines(lemma)
+        for attribute in get_verb_attributes(lemma, get_lemma_cells(lines, dictionary_type)):
+            if attribute not in bitmaps:
+                bitmaps[attribute] = bytearray((len(lemmas) + 7) // 8)
+            bitmaps[attribute][i // 8] |= 1 << (i % 8)
+    for attribute, bitmap in bitmaps.items():
+        bitmaps[attribute] = zlib.compress(bytes(bitmap))
+
+    time_stop = time.time()
+    logging.debug(
+        "build_attributes_index() " + _("time") + ": %f / " + _("attributes") + ": %d",
+        time_stop - time_start, len(bitmaps)
+    )
+
+    return {"Lemmas": lemmas, "Bitmaps": bitmaps}
+
+
+################################################################################
+def load_attributes_index(verbs):
+    """Return the attributes index of the dictionary, cached if possible"""
+    pathname = parameters["Dictionary path"]
+    dictionary_type = parameters["Dictionary type"]
+    # The bitmaps are small, so they're kept in the default cache directory without --cache:
+    if not get_cache_directory():
+        return build_attributes_index(verbs, dictionary_type)
+
+    status = os.stat(pathname)
+    cache = load_index_cache(pathname, dictionary_type, "attributes")
+    if cache is None \
+    or cache["Size"] != status.st_size \
+    or cache["Modification time"] != status.st_mtime:
+        cache = build_attributes_index(verbs, dictionary_type)
+        cache["Version"] = INDEX_CACHE_VERSION
+        cache["Path"] = os.path.abspath(pathname)
+        cache["Type"] = dictionary_type
+        cache["Size"] = status.st_size
+        cache["Modification time"] = status.st_mtime
+        save_index_cache(cache, "attributes")
+
+    return cache
+
+
+################################################################################
+def get_attribute_bitmap(attributes_index, attribute):
+    """Return the bitmap of the lemmas having an attribute, as an integer"""
+    if attribute not in attributes_index["Bitmaps"]:
+        return 0
+    return int.from_bytes(zlib.decompress(attributes_index["Bitmaps"][attribute]), "little")
+
+
+################################################################################
+def evaluate_query(query, attributes_index):
+    """Return the bitmap of the lemmas matching a query, or None if it's invalid"""
+    # Queries are attribute=value terms, combined with parentheses and the not, and, or operators,
+    # in decreasing priority order:
+    tokens = re.findall(r"\(|\)|[^\s()]+", query)
+    all_lemmas = (1 << len(attributes_index["Lemmas"])) - 1
+    position = 0
+
+    def parse_or():
+        nonlocal position
+        bitmap = parse_and()
+        while bitmap is not None and position < len(tokens) and tokens[position] == "or":
+            position += 1
+            other_bitmap = parse_and()
+            if other_bitmap is None:
+                return None
+            bitmap |= other_bitmap
+        return bitmap
+
+    def parse_and():
+        nonlocal position
+        bitmap = parse_not()
+        while bitmap is not None and position < len(tokens) and tokens[position] == "and":
+            position += 1
+            other_bitmap = parse_not()
+            if other_bitmap is None:
+                return None
+            bitmap &= other_bitmap
+        return bitmap
+
+    def parse_not():
+        nonlocal position
+        if position < len(tokens) and tokens[position] == "not":
+            position += 1
+            bitmap = parse_not()
+            if bitmap is None:
+                return None
+            return all_lemmas & ~bitmap
+        return parse_term()
+
+    def parse_term():
+        nonlocal position
+        if position >= len(tokens):
+            return None
+        token = tokens[position]
+        position += 1
+        if token == "(":
+            bitmap = parse_or()
+            if position >= len(tokens) or tokens[position] != ")":
+                return None
+            position += 1
+            return bitmap
+        if token.split("=")[0] not in ("group", "model", "auxiliary", "cell", "tense") \
+        or token.count("=") != 1:
+            return None
+        return get_attribute_bitmap(attributes_index, token)
+
+    bitmap = parse_or()
+    if position != len(tokens):
+        return None
+
+    return bitmap
+
+
+################################################################################
+def get_bitmap_lemmas(bitmap, lemmas):
+    """Yield the lemmas whose bit is set in a bitmap"""
+    while bitmap:
+        lowest_bit = bitmap & -bitmap
+        yield lemmas[lowest_bit.bit_length() - 1]
+        bitmap ^= lowest_bit
+
+
+################################################################################
+def print_query_results(query, verbs):
+    """Print the dictionary verbs matching a query, or their conjugations"""
+    time_start = time.time()
+    attributes_index = load_attributes_index(verbs)
+    bitmap = evaluate_query(query, attributes_index)
+    if bitmap is None:
+        logging.critical(_("Invalid query") + ": %s", query)
+        return False
+    time_stop = time.time()
+    logging.debug(
+        "print_query_results() " + _("time") + ": %f / " + _("lemmas") + ": %d",
+        time_stop - time_start, bin(bitmap).count("1")
+    )
+
+    for lemma in get_bitmap_lemmas(bitmap, attributes_index["Lemmas"]):
+        if parameters["Query tables"]:
+            # The lines are selected by key, as when conjugating the verb:
+            print_verb_conjugations(
+                fill_verb_from_dictionary_data(lemma, select_verb_from_verbs(lemma, verbs))
+            )
+        else:
+            print(lemma)
+
+    return True
+
+
+################################################################################
+def read_verb_lines(pathname, dictionary_type):
+    """Yield the verbs lines of a dictionary, or regenerated from a lexicon, in a single pass"""
+    if is_lexicon(pathname):
+        for lemma, entry in load_lexicon(pathname).items():
+            for line in expand_lexicon_entry(lemma, entry, dictionary_type):
+                yield line
+    else:
+        with open_dictionary_bytes(pathname) as file:
+            for chunk in read_dictionary_chunks(file):
+                for line in filter_verb_lines(chunk, dictionary_type):
+                    yield line
+
+
+################################################################################
+def print_counter(title, counter):
+    """Print a counter title and its items, by decreasing count"""
+    print(title + ":")
+    width = max([len(item) for item in counter.keys()] + [0])
+    for item, count in counter.most_common():
+        print("    " + item.ljust(width) + " %7d" % count)
+
+
+################################################################################
+def print_dictionary_statistics():
+    """Print statistics about the verbs of the dictionary, read in a single pass"""
+    time_start = time.time()
+    dictionary_type = parameters["Dictionary type"]
+    # Only the lemma and key part, and the inflections part, of the lines are counted while reading,
+    # as they take few different values, the other statistics being derived from them:
+    heads_counter = {}
+    tails_counter = {}
+    for line in read_verb_lines(parameters["Dictionary path"], dictionary_type):
+        if dictionary_type == "DELA":
+            # form,lemma.V+optional_subclass:inflections, the lemma being omitted if it's the form:
+            comma = line.find(",")
+            colon = line.find(":", comma)
+            if line[comma + 1] == ".":
+                head = line[:comma] + line[comma + 1:colon]
+            else:
+                head = line[comma + 1:colon]
+        else:
+            # form	lemma	Ver:inflections
+            colon = line.find(":")
+            head = line[line.find("	") + 1:colon]
+        heads_counter[head] = heads_counter.get(head, 0) + 1
+        tail = line[colon + 1:]
+        tails_counter[tail] = tails_counter.get(tail, 0) + 1
+
+    lemmas_forms = collections.Counter()
+    lemmas_keys = collections.defaultdict(collections.Counter)
+    keys_counter = collections.Counter()
+    for head, count in heads_counter.items():
+        if dictionary_type == "DELA":
+            position = head.find(".V")
+            lemma, key = head[:position], head[position:]
+        else:
+            lemma, key = head.split("	", 1)
+        lemmas_forms[lemma] += count
+        lemmas_keys[lemma][key] += count
+        keys_counter[key] += count
+    inflections_counter = collections.Counter()
+    for tail, count in tails_counter.items():
+        for inflection in tail.split(":"):
+            inflections_counter[inflection] += count
+
+    groups_counter = collections.Counter()
+    models_counter = collections.Counter()
+    auxiliaries_counter = collections.Counter()
+    for lemma in lemmas_forms:
+        _pattern, group, model = analyze_verb(lemma)
+        groups_counter[group] += 1
+        models_counter[model or EMPTY_CONJUGATION] += 1
+        if lemma in both_aux:
+            auxiliaries_counter["avoir, être"] += 1
+        elif lemma in etre_aux:
+            auxiliaries_counter["être"] += 1
+        else:
+            auxiliaries_counter["avoir"] += 1
+
+    forms = sorted(lemmas_forms.values())
+    print(_("Lemmas") + ": %d" % len(forms))
+    print(_("Forms") + ": %d" % sum(forms))
+    if forms:
+        print(
+            _("Forms per lemma")
+            + ": "
+            + _("minimum")
+            + " %d / " % forms[0]
+            + _("median")
+            + " %d / " % forms[len(forms) // 2]
+            + _("average")
+            + " %.1f / " % (sum(forms) / len(forms))
+            + _("maximum")
+            + " %d" % forms[-1]
+        )
+    print_counter(_("Lemmas per group"), groups_counter)
+    print_counter(_("Lemmas per model"), models_counter)
+    print_counter(_("Lemmas per auxiliary"), auxiliaries_counter)
+    print_counter(_("Inflections"), inflections_counter)
+    print_counter(_("Keys"), keys_counter)
+
+    # Lemmas having lines with another key than their most common one:
+    print(_("Lemmas with keys differing from their majority") + ":")
+    for lemma in sorted(lemmas_keys.keys()):
+        if len(lemmas_keys[lemma]) > 1:
+            print("    " + lemma + " " + ", ".join(
+                ["%s (%d)" % (key, count) for key, count in lemmas_keys[lemma].most_common()]
+            ))
+
+    time_stop = time.time()
+    logging.debug(
+        "print_dictionary_statistics() " + _("time") + ": %f / " + _("lemmas") + ": %d",
+        time_stop - time_start, len(forms)
+    )
+
+
+################################################################################
+def build_bloom_filter(lemmas):
+    """Return the bits of a Bloom filter of the lemmas of a dictionary"""
+    size = max(len(lemmas) * BLOOM_FILTER_BITS_PER_LEMMA, 8)
+    bits = bytearray((size + 7) // 8)
+    size = len(bits) * 8
+    for lemma in lemmas:
+        data = lemma.encode("utf-8")
+        hash1 = zlib.crc32(data)
+        hash2 = zlib.adler32(data) | 1
+        for i in range(BLOOM_FILTER_HASHES):
+            position = (hash1 + i * hash2) % size
+            bits[position >> 3] |= 1 << (position & 7)
+
+    return bytes(bits)
+
+
+################################################################################
+def bloom_filter_contains(bloom_filter, verb):
+    """Return False if a verb is certainly not in a Bloom filter, True if it probably is"""
+    data = verb.encode("utf-8")
+    bits = bloom_filter["Bits"]
+    size = len(bits) * 8
+    hash1 = zlib.crc32(data)
+    hash2 = zlib.adler32(data) | 1
+    for i in range(BLOOM_FILTER_HASHES):
+        position = (hash1 + i * hash2) % size
+        if not bits[position >> 3] & (1 << (position & 7)):
+            return False
+
+    return True
+
+
+################################################################################
+def load_bloom_filter(pathname=None, dictionary_type=None):
+    """Return the Bloom filter of a dictionary lemmas, cached if possible"""
+    time_start = time.time()
+    if pathname is None:
+        pathname = parameters["Dictionary path"]
+    if dictionary_type is None:
+        dictionary_type = parameters["Dictionary type"]
+
+    # The Bloom filter is small, so it's kept in the default cache directory without --cache:
+    bloom_filter = None
+    status = os.stat(pathname)
+    if get_cache_directory():
+        bloom_filter = load_index_cache(pathname, dictionary_type, "bloom")
+        if bloom_filter is not None \
+        and (bloom_filter["Size"] != status.st_size \
+        or bloom_filter["Modification time"] != status.st_mtime):
+            bloom_filter = None
+
+    if bloom_filter is None:
+        verbs = load_all_verbs_from_dictionary(pathname, dictionary_type)
+        lemmas = get_lemmas(verbs, dictionary_type)
+        bloom_filter = {
+            "Version": INDEX_CACHE_VERSION,
+            "Path": os.path.abspath(pathname),
+            "Type": dictionary_type,
+            "Size": status.st_size,
+            "Modification time": status.st_mtime,
+            "Bits": build_bloom_filter(lemmas),
+        }
+        if get_cache_directory():
+            save_index_cache(bloom_filter, "bloom")
+            # The lemmas used to confirm the probable hits are kept aside,
+            # so that they're only loaded when needed:
+            lemmas_cache = dict(bloom_filter)
+            del lemmas_cache["Bits"]
+            lemmas_cache["Lemmas"] = lemmas
+            save_index_cache(lemmas_cache, "lemmas")
+
+        # The lemmas are already there for the probable hits:
+        bloom_filter["Lemmas"] = lemmas
+
+    time_stop = time.time()
+    logging.debug(
+        "load_bloom_filter() " + _("time") + ": %f / " + _("bits") + ": %d",
+        time_stop - time_start, len(bloom_filter["Bits"]) * 8
+    )
+
+    return bloom_filter
 
 
 ################################################################################
-def analyze_verb(verb):
-    """Return a verb pattern, group and conjugation model"""
-    group = None
-    group_text = ""
-    model = ""
+def verb_exists(verb, bloom_filter):
+    """Return True if a verb is in the dictionary of a Bloom filter"""
+    if not bloom_filter_contains(bloom_filter, verb):
+        return False
+
+    # Only the probable hits are checked against the dictionary lemmas, loaded once,
+    # from the cache saved with the Bloom filter if possible:
+    if bloom_filter.get("Lemmas") is None:
+        lemmas_cache = load_index_cache(bloom_filter["Path"], bloom_filter["Type"], "lemmas")
+        if lemmas_cache is not None \
+        and lemmas_cache["Size"] == bloom_filter["Size"] \
+        and lemmas_cache["Modification time"] == bloom_filter["Modification time"]:
+            bloom_filter["Lemmas"] = lemmas_cache["Lemmas"]
+        else:
+            verbs = load_all_verbs_from_dictionary(bloom_filter["Path"], bloom_filter["Type"])
+            bloom_filter["Lemmas"] = get_lemmas(verbs, bloom_filter["Type"])
 
-    for key in patterns.keys():
-        if verb.endswith(key):
-            group = patterns[key][0]
-            model = patterns[key][1]
-            break
+    return verb in bloom_filter["Lemmas"]
 
-    if group == 0:
-        group_text = _("auxiliary")
-    elif group == 1:
-        group_text = _("1st group")
-    elif group == 2:
-        group_text = _("2nd group")
-    elif group == 3:
-        group_text = _("3rd group")
-    else:
-        group_text = _("unknown group")
 
-    return key, group_text, model
+################################################################################
+def check_verbs_existence(arguments):
+    """Tell if all the verbs are in the dictionary, or print 1 or 0 for each verb read"""
+    bloom_filter = load_bloom_filter()
+    if arguments:
+        for argument in arguments:
+            if not verb_exists(argument, bloom_filter):
+                return False
+        return True
+
+    # Without arguments, the verbs are read from standard input, one per line:
+    for line in sys.stdin:
+        if verb_exists(line.strip(), bloom_filter):
+            sys.stdout.write("1\n")
+        else:
+            sys.stdout.write("0\n")
+
+    return True
 
 
 ################################################################################
@@ -792,6 +3362,17 @@ def get_max_width(lines):
 def get_tense_conjugation(mode, tense, conjugation):
     """Return the conjugation of a verb for a specific mode and tense"""
     column = print_tense(tense)
+    column += get_tense_forms(mode, tense, conjugation)
+    if BLANK_LINES:
+        column.append("")
+
+    return column
+
+
+################################################################################
+def get_tense_forms(mode, tense, conjugation):
+    """Return the forms of a verb for a specific mode and tense, with their pronouns"""
+    column = []
     if mode == "Infinitif" \
     or (mode == "Participe" and tense == "Présent"):
         if conjugation[mode][tense]:
@@ -832,8 +3413,6 @@ def get_tense_conjugation(mode, tense, conjugation):
                     )
                 else:
                     column.append(EMPTY_CONJUGATION)
-    if BLANK_LINES:
-        column.append("")
 
     return column
 
@@ -1075,51 +3654,1059 @@ def print_verb_conjugation(verb):
         print_verb_conjugation_even_columns(verb)
 
 
+################################################################################
+def print_verb_conjugations(simple_verb):
+    """Print a verb conjugations with the auxiliary (or auxiliaries) it uses"""
+    verb = simple_verb["Infinitif"]["Présent"]
+    print_verb_conjugation(add_compound_tenses(simple_verb, get_auxiliary(verb)))
+
+    if verb in both_aux \
+    and not parameters["ABU output"] \
+    and not parameters["DELA output"]:
+        print_verb_conjugation(add_compound_tenses(simple_verb, "avoir"))
+
+
+################################################################################
+def get_lemma_rows(arguments):
+    """Return the export rows of a verb forms, in a process pool"""
+    lemma, conjugations, dictionary_type = arguments
+    simple_verb = fill_verb_from_packed_data(lemma, pack_verb_lines(conjugations, dictionary_type))
+    pattern, _group, model = analyze_verb(lemma)
+    group = ""
+    if pattern:
+        group = str(patterns[pattern][0])
+
+    # The simple tenses are only given with the first auxiliary:
+    auxiliaries = [get_auxiliary(lemma)]
+    if lemma in both_aux:
+        auxiliaries.append("avoir")
+    cells = get_cells()
+    rows = []
+    for auxiliary in auxiliaries:
+        conjugated_verb = add_compound_tenses(simple_verb, auxiliary)
+        for cell, form in zip(cells, get_verb_cells(conjugated_verb, cells)):
+            if not form:
+                continue
+            if auxiliary != auxiliaries[0] \
+            and (get_cell_inflection(cell) or cell == ("Infinitif", "Présent")):
+                continue
+            person = number = gender = ""
+            if len(cell) == 4 and cell[0] == "Participe":
+                number, gender = cell[2], cell[3]
+            elif len(cell) == 4:
+                number, person = cell[2], cell[3]
+            rows.append(
+                [lemma, auxiliary, group, model, cell[0], cell[1], person, number, gender, form]
+            )
+
+    return rows
+
+
+################################################################################
+def export_paradigms(pathname, verbs):
+    """Write a table of all the dictionary verbs forms, one per row, in TSV or CSV format"""
+    time_start = time.time()
+    dictionary_type = parameters["Dictionary type"]
+    verbs = get_verbs_index(verbs)
+
+    # The format is given by the pathname suffixes, such as .csv or .tsv.gz:
+    basename = pathname
+    if basename.endswith(".gz"):
+        basename = basename[:-3]
+    delimiter = "\t"
+    if basename.endswith(".csv"):
+        delimiter = ","
+
+    rows = 0
+    try:
+        if pathname.endswith(".gz"):
+            file = gzip.open(pathname, "wt", encoding="utf-8", newline="")
+        else:
+            file = open(pathname, "w", encoding="utf-8", newline="")
+        with file:
+            writer = csv.writer(file, delimiter=delimiter, lineterminator="\n")
+            writer.writerow(EXPORT_COLUMNS)
+
+            # The rows are built in parallel, and written as soon as each verb is done,
+            # a batch of verbs at a time so that they don't pile up in memory:
+            lemmas = verbs.lemmas
+            with multiprocessing.Pool(initializer=initialize_worker, initargs=(parameters,)) as pool:
+                for i in range(0, len(lemmas), EXPORT_BATCH_SIZE):
+                    for lemma_rows in pool.imap(
+                        get_lemma_rows,
+                        [
+                            (lemma, verbs.get_lemma_lines(lemma), dictionary_type)
+                            for lemma in lemmas[i:i + EXPORT_BATCH_SIZE]
+                        ],
+                        64
+                    ):
+                        writer.writerows(lemma_rows)
+                        rows += len(lemma_rows)
+    except OSError as error:
+        logging.critical(_("Cannot write the export file") + ": %s", error)
+        return False
+
+    print(_("Rows written") + ": %d" % rows)
+
+    time_stop = time.time()
+    logging.debug(
+        "export_paradigms() " + _("time") + ": %f / " + _("lemmas") + ": %d",
+        time_stop - time_start, len(verbs.lemmas)
+    )
+
+    return True
+
+
+################################################################################
+def get_site_filename(name):
+    """Return the filename of a site page"""
+    return name.replace("/", "_") + ".html"
+
+
+################################################################################
+def get_site_verb_name(lemma):
+    """Return the name of the site page of a verb"""
+    # The prefix keeps verbs pages apart from the index, letter-* and model-* pages:
+    return "verb-" + lemma
+
+
+################################################################################
+def get_site_link(name, text=None):
+    """Return an HTML link to a site page"""
+    if text is None:
+        text = name
+    return (
+        '<a href="' + urllib.parse.quote(get_site_filename(name)) + '">' + html.escape(text) + "</a>"
+    )
+
+
+################################################################################
+def get_site_page(title, body):
+    """Return an HTML page of the site"""
+    return """<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8">
+<title>""" + html.escape(title) + """</title>
+<link rel="stylesheet" href="conjuguer.css">
+</head>
+<body>
+<p>""" + get_site_link("index", _("Index")) + """</p>
+<h1>""" + html.escape(title) + """</h1>
+""" + body + """</body>
+</html>
+"""
+
+
+################################################################################
+def get_conjugation_html(conjugation):
+    """Return an HTML rendering of a verb conjugation in 4 columns"""
+    text = '<div class="conjugation">\n'
+    for half in SITE_LAYOUT:
+        text += "<table>\n"
+        for mode, tenses in half:
+            text += '<tr><th class="mode" colspan="2">' + html.escape(mode) + "</th></tr>\n"
+            for simple_tense, compound_tense in tenses:
+                text += "<tr>"
+                for tense in (simple_tense, compound_tense):
+                    text += '<th class="tense">' + html.escape(tense) + "</th>"
+                text += "</tr>\n<tr>"
+                for tense in (simple_tense, compound_tense):
+                    text += (
+                        '<td class="forms">'
+                        + html.escape("\n".join(get_tense_forms(mode, tense, conjugation)))
+                        + "</td>"
+                    )
+                text += "</tr>\n"
+        text += "</table>\n"
+    text += "</div>\n"
+
+    return text
+
+
+################################################################################
+def render_verb_page(arguments):
+    """Write the site page of a verb, in a process pool"""
+    lemma, conjugations, dictionary_type, directory = arguments
+    simple_verb = fill_verb_from_packed_data(lemma, pack_verb_lines(conjugations, dictionary_type))
+
+    # The model pages list the verbs conjugated like each model:
+    pattern, group, model = analyze_verb(lemma)
+    if lemma == model:
+        body = (
+            "<p>"
+            + html.escape(group + ", " + _("model for verbs like") + " *" + pattern + " ")
+            + "("
+            + get_site_link("model-" + model, _("Verbs conjugated like") + " " + model)
+            + ")</p>\n"
+        )
+    elif model:
+        body = (
+            "<p>"
+            + html.escape(group + ", " + _("conjugated like") + " ")
+            + get_site_link("model-" + model, model)
+            + "</p>\n"
+        )
+    else:
+        body = "<p>" + html.escape(group) + "</p>\n"
+
+    auxiliaries = [get_auxiliary(lemma)]
+    if lemma in both_aux:
+        auxiliaries.append("avoir")
+    for auxiliary in auxiliaries:
+        if len(auxiliaries) > 1:
+            body += "<h2>" + html.escape(_("With the auxiliary") + " " + auxiliary) + "</h2>\n"
+        body += get_conjugation_html(add_compound_tenses(simple_verb, auxiliary))
+
+    filename = get_site_filename(get_site_verb_name(lemma))
+    with open(directory + os.sep + filename, "w", encoding="utf-8") as file:
+        file.write(get_site_page(_("Conjugation tables for") + " " + lemma, body))
+
+    return lemma
+
+
+################################################################################
+def get_site_list(lemmas):
+    """Return an HTML list of links to verbs site pages"""
+    text = "<ul>\n"
+    for lemma in lemmas:
+        text += "<li>" + get_site_link(get_site_verb_name(lemma), lemma) + "</li>\n"
+    text += "</ul>\n"
+
+    return text
+
+
+################################################################################
+def get_site_index_pages(lemmas):
+    """Return the site index pages, by first letter and by model, and the main index page"""
+    letters = collections.OrderedDict()
+    model_verbs = collections.OrderedDict()
+    for lemma in sorted(lemmas, key=lambda lemma: (normalize_verb(lemma), lemma)):
+        letter = normalize_verb(lemma)[:1]
+        if letter not in letters:
+            letters[letter] = []
+        letters[letter].append(lemma)
+        model = analyze_verb(lemma)[2]
+        if model:
+            if model not in model_verbs:
+                model_verbs[model] = []
+            model_verbs[model].append(lemma)
+
+    pages = {}
+    body = "<h2>" + html.escape(_("Verbs by first letter")) + "</h2>\n<p>\n"
+    for letter, letter_lemmas in letters.items():
+        body += get_site_link("letter-" + letter, letter) + "\n"
+        pages["letter-" + letter] = get_site_page(
+            _("Verbs starting with") + " " + letter, get_site_list(letter_lemmas)
+        )
+    body += "</p>\n<h2>" + html.escape(_("Verbs by model")) + "</h2>\n<ul>\n"
+    for model in sorted(model_verbs.keys(), key=normalize_verb):
+        body += (
+            "<li>"
+            + get_site_link("model-" + model, model)
+            + " (%d)</li>\n" % len(model_verbs[model])
+        )
+        pages["model-" + model] = get_site_page(
+            _("Verbs conjugated like") + " " + model, get_site_list(model_verbs[model])
+        )
+    body += "</ul>\n"
+    pages["index"] = get_site_page(_("Conjugation of French verbs"), body)
+
+    return pages
+
+
+################################################################################
+def make_site(directory, verbs):
+    """Write or update a static HTML site with a page per verb of the dictionary"""
+    time_start = time.time()
+    dictionary_type = parameters["Dictionary type"]
+    verbs = get_verbs_index(verbs)
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError as error:
+        logging.critical(_("Cannot create the site directory") + ": %s", error)
+        return False
+
+    manifest_path = directory + os.sep + SITE_MANIFEST
+    try:
+        with open(manifest_path, "rb") as file:
+            manifest = pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        manifest = {}
+    if not isinstance(manifest, dict):
+        manifest = {}
+
+    # A page is only written again when its source changed, or the program or language did:
+    pages = {}
+    renderings = []
+    for lemma in verbs.lemmas:
+        lines = verbs.get_lemma_lines(lemma)
+        source = repr([ID, parameters["Language"], dictionary_type, lemma, lines])
+        filename = get_site_filename(get_site_verb_name(lemma))
+        pages[filename] = hashlib.sha1(source.encode("utf-8")).hexdigest()
+        if manifest.get(filename) != pages[filename] \
+        or not os.path.isfile(directory + os.sep + filename):
+            renderings.append((lemma, lines, dictionary_type, directory))
+
+    try:
+        if renderings:
+            with multiprocessing.Pool(initializer=initialize_worker, initargs=(parameters,)) as pool:
+                for _lemma in pool.imap_unordered(render_verb_page, renderings, 64):
+                    pass
+
+        # The index pages are cheap to build, but only written when changed:
+        index_pages = get_site_index_pages(verbs.lemmas)
+        index_pages["conjuguer.css"] = SITE_STYLE
+        written_pages = len(renderings)
+        for name, content in index_pages.items():
+            filename = name if name.endswith(".css") else get_site_filename(name)
+            pages[filename] = hashlib.sha1(content.encode("utf-8")).hexdigest()
+            if manifest.get(filename) != pages[filename] \
+            or not os.path.isfile(directory + os.sep + filename):
+                with open(directory + os.sep + filename, "w", encoding="utf-8") as file:
+                    file.write(content)
+                written_pages += 1
+
+        # The pages of the verbs, letters or models which disappeared are removed:
+        for filename in manifest.keys():
+            if filename not in pages and os.path.isfile(directory + os.sep + filename):
+                os.remove(directory + os.sep + filename)
+
+        with open(manifest_path + ".tmp", "wb") as file:
+            pickle.dump(pages, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(manifest_path + ".tmp", manifest_path)
+    except OSError as error:
+        logging.critical(_("Cannot write the site") + ": %s", error)
+        return False
+
+    print(_("Pages written") + ": %d/%d" % (written_pages, len(pages)))
+
+    time_stop = time.time()
+    logging.debug(
+        "make_site() " + _("time") + ": %f / " + _("lemmas") + ": %d",
+        time_stop - time_start, len(verbs.lemmas)
+    )
+
+    return True
+
+
+################################################################################
+def print_dictionary_verb(verb, conjugations, layer, fallback, cells=None):
+    """Print a verb found in a dictionary, with the cells asked for or all its conjugations"""
+    if cells:
+        # Only the cells asked for are conjugated:
+        print_verb_cells(verb, cells, get_cells_forms(verb, conjugations, cells, layer["Type"]))
+        return
+
+    if fallback \
+    and not parameters["ABU output"] \
+    and not parameters["DELA output"]:
+        print(_("Found in") + " " + layer["Path"])
+
+    # The simple tenses are the same whatever the auxiliary:
+    print_verb_conjugations(fill_verb_from_dictionary_data(verb, conjugations, layer["Type"]))
+
+
+################################################################################
+def render_output(function, *arguments):
+    """Return what a printing function writes on standard output"""
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        function(*arguments)
+
+    return output.getvalue()
+
+
+################################################################################
+class WarningsCounter(logging.Handler):
+    """Logging handler counting the warnings and errors logged"""
+
+    def __init__(self):
+        """Start counting from zero"""
+        logging.Handler.__init__(self, logging.WARNING)
+        self.count = 0
+
+    def emit(self, record):
+        self.count += 1
+
+
+################################################################################
+def get_render_cache_path(verb):
+    """Return the pathname of the cached rendered output of a verb, for the current options"""
+    # The output depends on the dictionaries, the display options and the locale:
+    key = [ID, verb, sys.stdout.encoding]
+    for pathname in parameters["Dictionaries"] or [parameters["Dictionary path"]]:
+        status = os.stat(pathname)
+        key.append([os.path.abspath(pathname), status.st_size, status.st_mtime])
+    for parameter in [
+        "Display columns",
+        "Color display",
+        "ABU output",
+        "DELA output",
+        "Cell mode",
+        "Cell tense",
+        "Cell person",
+        "Cell number",
+        "Language",
+    ]:
+        key.append(parameters[parameter])
+    digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+
+    return parameters["Cache directory"] + os.sep + "render" + os.sep + digest + ".txt"
+
+
+################################################################################
+def load_rendered_output(verb):
+    """Return the cached rendered output of a verb, or None"""
+    cache_path = get_render_cache_path(verb)
+    try:
+        with open(cache_path, "rb") as file:
+            output = file.read()
+        # Marking it as recently used, for the cache eviction:
+        os.utime(cache_path)
+    except OSError:
+        return None
+
+    return output
+
+
+################################################################################
+def evict_rendered_outputs():
+    """Remove the least recently used rendered outputs when the cache is too large"""
+    directory = parameters["Cache directory"] + os.sep + "render"
+    entries = []
+    total_size = 0
+    for entry in os.listdir(directory):
+        status = os.stat(directory + os.sep + entry)
+        entries.append((status.st_mtime, status.st_size, entry))
+        total_size += status.st_size
+
+    entries.sort()
+    for _mtime, size, entry in entries:
+        if total_size <= RENDER_CACHE_MAX_SIZE:
+            break
+        os.remove(directory + os.sep + entry)
+        total_size -= size
+
+
+################################################################################
+def save_rendered_output(verb, output):
+    """Write the rendered output of a verb in the cache directory, atomically"""
+    cache_path = get_render_cache_path(verb)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path + ".tmp", "wb") as file:
+            file.write(output)
+        os.replace(cache_path + ".tmp", cache_path)
+        evict_rendered_outputs()
+    except OSError as error:
+        logging.warning(_("Cannot write the rendered output cache") + ": %s", error)
+
+
+################################################################################
+def write_rendered_output(output):
+    """Write an encoded rendered output on standard output"""
+    if hasattr(sys.stdout, "buffer"):
+        sys.stdout.flush()
+        sys.stdout.buffer.write(output)
+    else:
+        sys.stdout.write(output.decode(sys.stdout.encoding or "utf-8"))
+
+
+################################################################################
+def print_verb_cells(verb, cells, forms):
+    """Print a verb forms in the cells of a point query, one per line"""
+    for cell, form in zip(cells, forms):
+        if not form:
+            form = EMPTY_CONJUGATION
+        # The cell is written like a DELA inflection, person or gender first:
+        print("\t".join([verb, cell[0], cell[1], "".join(reversed(cell[2:])), form]))
+
+
+################################################################################
+def get_request_cells(request):
+    """Return the cells of a coprocess request point query, None for full conjugation tables,
+    or an empty list if nothing matches"""
+    if not any(key in request for key in ("mode", "tense", "person", "number")):
+        return None
+
+    cell_keys = {}
+    for key, choices in (
+        ("mode", blank_verb.keys()),
+        ("tense", get_tenses()),
+        ("person", ["1", "2", "3", "m", "f"]),
+        ("number", ["s", "p"]),
+    ):
+        cell_keys[key] = ""
+        if key in request:
+            cell_keys[key] = get_cell_key(str(request[key]), choices)
+            if not cell_keys[key]:
+                return []
+
+    return get_cells(cell_keys["mode"], cell_keys["tense"], cell_keys["person"], cell_keys["number"])
+
+
+################################################################################
+def get_coprocess_response(request, layers, normalized_index, lemmas_trie):
+    """Return the response to a coprocess request, as a dictionary"""
+    if not isinstance(request, dict):
+        return {"error": _("Requests must be JSON objects")}
+    response = {}
+    if "id" in request:
+        # Callers pipelining their requests can match the responses with their own identifiers:
+        response["id"] = request["id"]
+
+    verb = request.get("verb", "")
+    if not isinstance(verb, str) or not verb.strip():
+        response["error"] = _("No verb given")
+        return response
+    verb = verb.strip()
+    output_format = str(request.get("format", "text")).lower()
+    if output_format not in OUTPUT_FORMATS:
+        response["error"] = _("Format is expecting one of") + ": " + ", ".join(OUTPUT_FORMATS)
+        return response
+    # JSON booleans are integers for Python, and true would be taken as 1 column:
+    if "columns" in request \
+    and (type(request["columns"]) is not int or request["columns"] not in (1, 2, 4)):
+        response["error"] = _("Columns is expecting 1, 2 or 4 columns")
+        return response
+    cells = get_request_cells(request)
+    if cells == []:
+        response["error"] = _("No conjugation matches the mode, tense, person and number requested")
+        return response
+
+    conjugations, layer = select_verb_from_layers(verb, layers)
+    if not conjugations:
+        candidates = resolve_verb(verb, normalized_index)
+        if len(candidates) == 1:
+            verb = candidates[0]
+            conjugations, layer = select_verb_from_layers(verb, layers)
+        elif len(candidates) > 1:
+            response["verb"] = verb
+            response["error"] = verb + " " + _("is ambiguous between") + " " + ", ".join(candidates)
+            response["candidates"] = candidates
+            return response
+    response["verb"] = verb
+    if not conjugations:
+        response["error"] = verb + " " + _("is not in the dictionary used")
+        response["suggestions"] = suggest_verbs(verb, lemmas_trie)
+        return response
+    response["dictionary"] = layer["Path"]
+
+    if output_format == "json" and cells:
+        response["cells"] = [
+            {"mode": cell[0], "tense": cell[1], "cell": "".join(reversed(cell[2:])), "form": form}
+            for cell, form in zip(cells, get_cells_forms(verb, conjugations, cells, layer["Type"]))
+        ]
+    elif output_format == "json":
+        auxiliaries = [get_auxiliary(verb), "avoir"]
+        conjugated_verbs = get_conjugated_verbs(verb, conjugations, layer["Type"])
+        response["conjugations"] = [
+            {"auxiliary": auxiliary, "tenses": conjugated_verb}
+            for auxiliary, conjugated_verb in zip(auxiliaries, conjugated_verbs)
+        ]
+    else:
+        # The display parameters are only changed for this request:
+        saved_parameters = {
+            key: parameters[key]
+            for key in ("ABU output", "DELA output", "Display columns", "Color display")
+        }
+        parameters["ABU output"], parameters["DELA output"] = OUTPUT_FORMATS[output_format]
+        if "columns" in request:
+            parameters["Display columns"] = request["columns"]
+        # The output is read by another program, so it's only colored on request:
+        parameters["Color display"] = bool(request.get("color", False))
+        try:
+            response["output"] = render_output(
+                print_dictionary_verb, verb, conjugations, layer, layer is not layers[0], cells
+            )
+        finally:
+            parameters.update(saved_parameters)
+
+    return response
+
+
+################################################################################
+def run_coprocess(layers):
+    """Answer the JSON requests read from standard input, one per line,
+    with a JSON response line for each of them"""
+    normalized_index, lemmas_trie = index_dictionary_layers(layers)
+
+    # Requests and responses are exchanged in UTF-8, whatever the locale:
+    stdin = sys.stdin.buffer if hasattr(sys.stdin, "buffer") else sys.stdin
+    stdout = sys.stdout.buffer if hasattr(sys.stdout, "buffer") else sys.stdout
+    for line in stdin:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", "replace")
+        if not line.strip():
+            continue
+
+        try:
+            request = json.loads(line)
+        except ValueError as error:
+            response = {"error": _("Invalid JSON request") + ": " + str(error)}
+        else:
+            response = get_coprocess_response(request, layers, normalized_index, lemmas_trie)
+
+        # Each response is flushed at once, as the caller may be waiting for it:
+        output = json.dumps(response, ensure_ascii=False) + "\n"
+        if stdout is sys.stdout:
+            stdout.write(output)
+        else:
+            stdout.write(output.encode("utf-8"))
+        stdout.flush()
+
+
+################################################################################
+def make_completions(layers, pathname=None):
+    """Return the sorted lines of a completions file for a stack of dictionaries,
+    and save them in a completions file if a pathname is given"""
+    for layer in layers:
+        if layer["Verbs"] is None:
+            layer["Type"], layer["Verbs"] = load_dictionary_layer(layer["Path"])
+            check_dictionary_layer(layer)
+
+    # Lemmas are sorted by their normalized form, followed by themselves,
+    # so that a prefix search also matches them whatever their case and accents:
+    completions = sorted([
+        (normalize_verb(lemma) + "\t" + lemma).encode("utf-8")
+        for lemma in get_layers_lemmas(layers)
+    ])
+
+    if pathname:
+        header = COMPLETIONS_HEADER + " " + json.dumps(
+            get_completions_key([layer["Path"] for layer in layers]), ensure_ascii=False
+        )
+        try:
+            if os.path.dirname(pathname):
+                os.makedirs(os.path.dirname(pathname), exist_ok=True)
+            with open(pathname + ".tmp", "wb") as file:
+                file.write(header.encode("utf-8") + b"\n")
+                file.write(b"\n".join(completions) + b"\n")
+            os.replace(pathname + ".tmp", pathname)
+        except OSError as error:
+            logging.warning(_("Cannot write the completions file") + ": %s", error)
+
+    return completions
+
+
+################################################################################
+def get_completions(prefix, lemmas, normalized_keys=None, normalized_index=None):
+    """Return the lemmas starting with a prefix, from a sorted list of lemmas,
+    or else those starting with it whatever its case and accents"""
+    completions = []
+    i = bisect.bisect_left(lemmas, prefix)
+    while i < len(lemmas) and lemmas[i].startswith(prefix):
+        completions.append(lemmas[i])
+        i += 1
+
+    if not completions and normalized_keys is not None:
+        normalized_prefix = normalize_verb(prefix)
+        i = bisect.bisect_left(normalized_keys, normalized_prefix)
+        while i < len(normalized_keys) and normalized_keys[i].startswith(normalized_prefix):
+            completions.extend(normalized_index[normalized_keys[i]])
+            i += 1
+
+    return completions
+
+
+################################################################################
+def print_interactive_verb(verb, layers, normalized_index, lemmas_trie, output_format):
+    """Print a verb typed in interactive mode, or suggestions if it's unknown"""
+    time_start = time.time()
+    conjugations, layer = select_verb_from_layers(verb, layers)
+    if not conjugations:
+        candidates = resolve_verb(verb, normalized_index)
+        if len(candidates) == 1:
+            verb = candidates[0]
+            conjugations, layer = select_verb_from_layers(verb, layers)
+        elif len(candidates) > 1:
+            logging.error("%s " + _("is ambiguous between") + " %s", verb, ", ".join(candidates))
+            return
+
+    if not conjugations:
+        logging.error("%s " + _("is not in the dictionary used"), verb)
+        suggestions = suggest_verbs(verb, lemmas_trie)
+        if suggestions:
+            print(_("Did you mean") + " " + ", ".join(suggestions) + " ?")
+    elif output_format == "json":
+        auxiliaries = [get_auxiliary(verb), "avoir"]
+        conjugated_verbs = get_conjugated_verbs(verb, conjugations, layer["Type"])
+        print(json.dumps(
+            [
+                {"auxiliary": auxiliary, "tenses": conjugated_verb}
+                for auxiliary, conjugated_verb in zip(auxiliaries, conjugated_verbs)
+            ],
+            ensure_ascii=False,
+            indent=2
+        ))
+    else:
+        print_dictionary_verb(verb, conjugations, layer, layer is not layers[0])
+
+    time_stop = time.time()
+    logging.debug("print_interactive_verb() " + _("time") + ": %f", time_stop - time_start)
+
+
+################################################################################
+def print_interactive_help():
+    """Print the interactive mode commands"""
+    print(_("Type a verb to conjugate it, or one of these commands:"))
+    print("  " + _(":columns NUM          Choose number of columns to display between 1, 2 or 4"))
+    print("  " + _(":color [on|off]       Enable, disable or toggle color output"))
+    print("  " + _(":format FORMAT        Choose text, abu, dela or json output format"))
+    print("  " + _(":dictionary [PATH...] Show or select the dictionaries searched"))
+    print("  " + _(":help                 Print this help"))
+    print("  " + _(":quit                 Quit (or end of file)"))
+
+
+################################################################################
+def select_interactive_dictionaries(pathnames, loaded_layers):
+    """Return a stack of dictionaries, reusing those already loaded, or None"""
+    layers = []
+    for pathname in pathnames:
+        if pathname not in loaded_layers:
+            if not os.path.isfile(pathname):
+                logging.error(_("Dictionary pathname doesn't exist") + ": %s", pathname)
+                return None
+            layer = {"Path": pathname, "Type": "", "Verbs": None}
+            layer["Type"], layer["Verbs"] = load_dictionary_layer(pathname)
+            if layer["Type"] not in ("ABU", "DELA"):
+                logging.error(
+                    _("The selected dictionary doesn't seem to be of ABU or DELA type") + ": %s",
+                    pathname
+                )
+                return None
+            loaded_layers[pathname] = layer
+        layers.append(loaded_layers[pathname])
+
+    return layers
+
+
+################################################################################
+def run_interactive(layers):
+    """Conjugate the verbs typed on a prompt, keeping the dictionaries loaded"""
+    normalized_index, lemmas_trie = index_dictionary_layers(layers)
+    loaded_layers = {layer["Path"]: layer for layer in layers}
+    lemmas = sorted(get_layers_lemmas(layers))
+    normalized_keys = sorted(normalized_index.keys())
+    commands = [":columns", ":color", ":format", ":dictionary", ":help", ":quit"]
+    output_format = "text"
+    if parameters["ABU output"]:
+        output_format = "abu"
+    elif parameters["DELA output"]:
+        output_format = "dela"
+
+    # The readline library is not available on all platforms,
+    # and is only imported here as it can write to the terminal when loaded:
+    try:
+        import readline
+    except ImportError:
+        readline = None
+
+    history_path = os.path.join(os.path.expanduser("~"), INTERACTIVE_HISTORY)
+    if readline is not None:
+        completions = []
+
+        # Lemmas can include spaces, hyphens and apostrophes, so the whole line is completed:
+        def complete(_text, state):
+            if state == 0:
+                line = readline.get_line_buffer()
+                if line.startswith(":"):
+                    completions[:] = [command for command in commands if command.startswith(line)]
+                else:
+                    completions[:] = get_completions(
+                        line, lemmas, normalized_keys, normalized_index
+                    )
+            if state < len(completions):
+                return completions[state]
+            return None
+
+        readline.set_completer(complete)
+        readline.set_completer_delims("")
+        if readline.__doc__ and "libedit" in readline.__doc__:
+            readline.parse_and_bind("bind ^I rl_complete")
+        else:
+            readline.parse_and_bind("tab: complete")
+        try:
+            readline.read_history_file(history_path)
+        except OSError:
+            pass
+        readline.set_history_length(INTERACTIVE_HISTORY_LENGTH)
+
+    print_interactive_help()
+    while True:
+        try:
+            line = input(INTERACTIVE_PROMPT).strip()
+        except EOFError:
+            print()
+            break
+        except KeyboardInterrupt:
+            print()
+            continue
+        if not line:
+            continue
+
+        command = line.split()
+        if not line.startswith(":"):
+            print_interactive_verb(line, layers, normalized_index, lemmas_trie, output_format)
+
+        elif command[0] == ":columns":
+            if len(command) == 2 and command[1] in ("1", "2", "4"):
+                parameters["Display columns"] = int(command[1])
+            else:
+                logging.error(_("Expecting 1, 2 or 4 columns"))
+
+        elif command[0] == ":color":
+            if len(command) == 1:
+                parameters["Color display"] = not parameters["Color display"]
+            elif command[1] in ("on", "off"):
+                parameters["Color display"] = command[1] == "on"
+            else:
+                logging.error(_("Expecting on or off"))
+
+        elif command[0] == ":format":
+            if len(command) == 2 and command[1].lower() in OUTPUT_FORMATS:
+                output_format = command[1].lower()
+                parameters["ABU output"], parameters["DELA output"] = OUTPUT_FORMATS[output_format]
+            else:
+                logging.error(_("Expecting one of") + ": %s", ", ".join(OUTPUT_FORMATS))
+
+        elif command[0] == ":dictionary":
+            # Dictionaries are only loaded the first time they are selected:
+            new_layers = select_interactive_dictionaries(command[1:], loaded_layers)
+            if new_layers:
+                layers = new_layers
+                normalized_index, lemmas_trie = index_dictionary_layers(layers)
+                lemmas = sorted(get_layers_lemmas(layers))
+                normalized_keys = sorted(normalized_index.keys())
+            for layer in layers:
+                print(layer["Type"] + "\t" + layer["Path"])
+
+        elif command[0] == ":help":
+            print_interactive_help()
+
+        elif command[0] == ":quit":
+            break
+
+        else:
+            logging.error(_("Unknown command") + ": %s", command[0])
+
+    if readline is not None:
+        try:
+            readline.write_history_file(history_path)
+        except OSError:
+            pass
+
+
 ################################################################################
 def main():
     """The program's main entry point"""
     program_name = os.path.basename(sys.argv[0])
 
+    # Shell completion runs at each Tab key, so it skips all the initializations,
+    # and even the dictionaries, when the completions file is up to date:
+    if print_cached_completions():
+        sys.exit(0)
+
     initialize_debugging(program_name)
     initialize_internationalization(program_name)
     process_environment_variables()
     arguments = process_command_line(program_name)
 
-    if not arguments:
+    if not arguments \
+    and not parameters["Lexicon path"] \
+    and not parameters["Comparison path"] \
+    and not parameters["Audit path"] \
+    and not parameters["Query"] \
+    and not parameters["Statistics"] \
+    and not parameters["Existence check"] \
+    and not parameters["Site directory"] \
+    and not parameters["Export path"] \
+    and not parameters["Coprocess"] \
+    and not parameters["Interactive"] \
+    and parameters["Completion prefix"] is None:
         logging.critical(_("conjuguer expects at least one argument"))
         display_help()
         sys.exit(1)
 
+    cells = None
+    if parameters["Cell mode"] \
+    or parameters["Cell tense"] \
+    or parameters["Cell person"] \
+    or parameters["Cell number"]:
+        cells = get_cells(
+            parameters["Cell mode"],
+            parameters["Cell tense"],
+            parameters["Cell person"],
+            parameters["Cell number"]
+        )
+        if not cells:
+            logging.critical(
+                _("No conjugation matches the --mode, --tense, --person and --number options")
+            )
+            sys.exit(1)
+
+    exit_status = 0
+    if parameters["Generated conjugations"]:
+        for argument in arguments:
+            simple_verb = generate_verb_from_model(argument)
+            if simple_verb and cells:
+                print_verb_cells(
+                    argument,
+                    cells,
+                    get_verb_cells(add_compound_tenses(simple_verb, get_auxiliary(argument)), cells)
+                )
+            elif simple_verb:
+                print_verb_conjugations(simple_verb)
+            else:
+                logging.error("%s " + _("cannot be conjugated from the models"), argument)
+                exit_status = 1
+        sys.exit(exit_status)
+
     if parameters["Dictionary type"] not in ("ABU", "DELA"):
         logging.debug(_("Unknown inflected dictionary format"))
         sys.exit(1)
 
-    verbs = load_all_verbs_from_dictionary()
+    if parameters["Statistics"]:
+        print_dictionary_statistics()
+        sys.exit(0)
 
-    exit_status = 0
-    for argument in arguments:
-        conjugations = select_verb_from_verbs(argument, verbs)
-        if conjugations:
-            verb = None
-            verb2 = None
-
-            if argument in etre_aux:
-                verb = conjuguer(argument, conjugations, "être")
-            elif argument in both_aux:
-                verb = conjuguer(argument, conjugations, "être")
-                verb2 = conjuguer(argument, conjugations, "avoir")
-            else:
-                verb = conjuguer(argument, conjugations, "avoir")
+    if parameters["Existence check"]:
+        if not check_verbs_existence(arguments):
+            sys.exit(1)
+        sys.exit(0)
+
+    # Verbs already rendered with the same dictionaries and options are just copied:
+    rendered_outputs = [None] * len(arguments)
+    if parameters["Cache directory"] \
+    and not parameters["Lexicon path"] \
+    and not parameters["Audit path"] \
+    and not parameters["Query"] \
+    and not parameters["Comparison path"] \
+    and not parameters["Site directory"] \
+    and not parameters["Export path"] \
+    and not parameters["Coprocess"] \
+    and not parameters["Interactive"] \
+    and parameters["Completion prefix"] is None:
+        rendered_outputs = [load_rendered_output(argument) for argument in arguments]
+        if arguments and None not in rendered_outputs:
+            for output in rendered_outputs:
+                write_rendered_output(output)
+            sys.exit(0)
 
-            print_verb_conjugation(verb)
-            if argument in both_aux \
-            and not parameters["ABU output"] \
-            and not parameters["DELA output"]:
-                print_verb_conjugation(verb2)
+    layers = None
+    if parameters["Merge dictionaries"] \
+    and not parameters["Lexicon path"] \
+    and not parameters["Audit path"] \
+    and not parameters["Query"] \
+    and not parameters["Site directory"] \
+    and not parameters["Export path"]:
+        # All the dictionaries of the stack are loaded at once:
+        layers = get_dictionary_layers()
+        verbs = layers[0]["Verbs"]
+    else:
+        verbs = load_all_verbs_from_dictionary()
+
+    if parameters["Lexicon path"]:
+        if not make_lexicon(parameters["Lexicon path"], verbs):
+            sys.exit(1)
+        sys.exit(0)
+
+    if parameters["Audit path"]:
+        if not audit_dictionary(parameters["Audit path"], verbs):
+            sys.exit(1)
+        sys.exit(0)
+
+    if parameters["Query"]:
+        if not print_query_results(parameters["Query"], verbs):
+            sys.exit(1)
+        sys.exit(0)
+
+    if parameters["Site directory"]:
+        if not make_site(parameters["Site directory"], verbs):
+            sys.exit(1)
+        sys.exit(0)
+
+    if parameters["Export path"]:
+        if not export_paradigms(parameters["Export path"], verbs):
+            sys.exit(1)
+        sys.exit(0)
+
+    if layers is None:
+        layers = get_dictionary_layers(verbs)
+    normalized_index = None
+    lemmas_trie = None
+
+    if parameters["Comparison path"]:
+        if not compare_dictionaries(parameters["Comparison path"], layers):
+            sys.exit(1)
+        sys.exit(0)
+
+    if parameters["Completion prefix"] is not None:
+        # The completions file is only written for the default dictionaries and options:
+        pathname = None
+        if get_completion_argument() is not None:
+            pathname = get_completions_path(get_cache_directory())
+        print_completions(parameters["Completion prefix"], make_completions(layers, pathname))
+        sys.exit(0)
+
+    if parameters["Coprocess"]:
+        run_coprocess(layers)
+        sys.exit(0)
+
+    if parameters["Interactive"]:
+        run_interactive(layers)
+        sys.exit(0)
+
+    # The outputs of the verbs whose processing logged warnings or errors are not cached,
+    # as these messages wouldn't be repeated when copying them:
+    warnings_counter = WarningsCounter()
+    if parameters["Cache directory"]:
+        logging.getLogger().addHandler(warnings_counter)
+    for argument, rendered_output in zip(arguments, rendered_outputs):
+        if rendered_output is not None:
+            write_rendered_output(rendered_output)
+            continue
+
+        cache_key = argument
+        warnings_count = warnings_counter.count
+        conjugations, layer = select_verb_from_layers(argument, layers)
+        if not conjugations:
+            if normalized_index is None:
+                # All the dictionaries have been loaded when searching the verb,
+                # and their normalized indexes are cached with their verbs indexes:
+                normalized_index = get_layers_normalized_index(layers)
+            candidates = resolve_verb(argument, normalized_index)
+            if len(candidates) == 1:
+                logging.debug("%s " + _("resolved as") + " %s", argument, candidates[0])
+                argument = candidates[0]
+                conjugations, layer = select_verb_from_layers(argument, layers)
+            elif len(candidates) > 1:
+                logging.error(
+                    "%s " + _("is ambiguous between") + " %s", argument, ", ".join(candidates)
+                )
+                exit_status = 1
+                continue
+
+        if conjugations and parameters["Cache directory"]:
+            output = render_output(
+                print_dictionary_verb, argument, conjugations, layer, layer is not layers[0], cells
+            )
+            sys.stdout.write(output)
+            if warnings_counter.count == warnings_count:
+                save_rendered_output(cache_key, output.encode(sys.stdout.encoding or "utf-8"))
+
+        elif conjugations:
+            print_dictionary_verb(argument, conjugations, layer, layer is not layers[0], cells)
 
         else:
             logging.error("%s " + _("is not in the dictionary used"), argument)
-            pattern, group, model = analyze_verb(argument)
+            if lemmas_trie is None:
+                lemmas_trie = make_lemmas_trie(get_layers_lemmas(layers))
+            suggestions = suggest_verbs(argument, lemmas_trie)
+            if suggestions:
+                print(_("Did you mean") + " " + ", ".join(suggestions) + " ?")
+
+            _pattern, group, model = analyze_verb(argument)
             print(
                 _("If it really exists, it would be")
                 + " "
@@ -1129,6 +4716,24 @@ def main():
                 + " "
                 + model
             )
+
+            # Conjugations are only generated on request, and not for probable typos,
+            # nor as if they were dictionary lines:
+            simple_verb = None
+            if parameters["Guessed conjugations"] \
+            and not suggestions \
+            and not parameters["ABU output"] \
+            and not parameters["DELA output"]:
+                simple_verb = generate_verb_from_model(argument)
+            if simple_verb and cells:
+                print_verb_cells(
+                    argument,
+                    cells,
+                    get_verb_cells(add_compound_tenses(simple_verb, get_auxiliary(argument)), cells)
+                )
+            elif simple_verb:
+                print()
+                print_verb_conjugations(simple_verb)
             exit_status = 1
 
     sys.exit(exit_status)
@@ -0,0 +1,1479 @@
+#!/usr/bin/env python
+""" conjuguer - conjugaison des verbes francais
+License: 3-clause BSD (see https://opensource.org/licenses/BSD-3-Clause)
+Author: Hubert Tournier
+"""
+
+# Conjugation models endings, used to conjugate verbs without a dictionary.
+# They were extracted from the DELA dictionary conjugations of the models verbs.
+#
+# The "Template" matches the end of the infinitive of the verbs conjugated
+# like the model, and is replaced by the endings of each inflection.
+# In both, "?" stands for the consonants varying from a verb to another
+# (for example "d" in "céder" and "br" in "célébrer").
+#
+# Inflections use the DELA codes:
+#   P, I, J, F, C, S, T: 1s, 2s, 3s, 1p, 2p, 3p persons
+#   Y: 2s, 1p, 2p persons
+#   G: participe présent
+#   K: participe passé ms, fs, mp, fp
+# None stands for an inflection that doesn't exist for defective verbs.
+models = {
+    "absoudre": {
+        "Template": "soudre",
+        "P": ["sous", "sous", "sout", "solvons", "solvez", "solvent"],
+        "I": ["solvais", "solvais", "solvait", "solvions", "solviez", "solvaient"],
+        "J": ["solus", "solus", "solut", "solûmes", "solûtes", "solurent"],
+        "F": ["soudrai", "soudras", "soudra", "soudrons", "soudrez", "soudront"],
+        "C": ["soudrais", "soudrais", "soudrait", "soudrions", "soudriez", "soudraient"],
+        "S": ["solve", "solves", "solve", "solvions", "solviez", "solvent"],
+        "T": ["solusse", "solusses", "solût", "solussions", "solussiez", "solussent"],
+        "Y": ["sous", "solvons", "solvez"],
+        "G": ["solvant"],
+        "K": ["sous", "soute", "sous", "soutes"],
+    },
+    "accroire": {
+        "Template": "accroire",
+        "P": [None, None, None, None, None, None],
+        "I": [None, None, None, None, None, None],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": [None, None, None, None],
+    },
+    "acquérir": {
+        "Template": "érir",
+        "P": ["iers", "iers", "iert", "érons", "érez", "ièrent"],
+        "I": ["érais", "érais", "érait", "érions", "ériez", "éraient"],
+        "J": ["is", "is", "it", "îmes", "îtes", "irent"],
+        "F": ["errai", "erras", "erra", "errons", "errez", "erront"],
+        "C": ["errais", "errais", "errait", "errions", "erriez", "erraient"],
+        "S": ["ière", "ières", "ière", "érions", "ériez", "ièrent"],
+        "T": ["isse", "isses", "ît", "issions", "issiez", "issent"],
+        "Y": ["iers", "érons", "érez"],
+        "G": ["érant"],
+        "K": ["is", "ise", "is", "ises"],
+    },
+    "aimer": {
+        "Template": "er",
+        "P": ["e", "es", "e", "ons", "ez", "ent"],
+        "I": ["ais", "ais", "ait", "ions", "iez", "aient"],
+        "J": ["ai", "as", "a", "âmes", "âtes", "èrent"],
+        "F": ["erai", "eras", "era", "erons", "erez", "eront"],
+        "C": ["erais", "erais", "erait", "erions", "eriez", "eraient"],
+        "S": ["e", "es", "e", "ions", "iez", "ent"],
+        "T": ["asse", "asses", "ât", "assions", "assiez", "assent"],
+        "Y": ["e", "ons", "ez"],
+        "G": ["ant"],
+        "K": ["é", "ée", "és", "ées"],
+    },
+    "aller": {
+        "Template": "aller",
+        "P": ["vais", "vas", "va", "allons", "allez", "vont"],
+        "I": ["allais", "allais", "allait", "allions", "alliez", "allaient"],
+        "J": ["allai", "allas", "alla", "allâmes", "allâtes", "allèrent"],
+        "F": ["irai", "iras", "ira", "irons", "irez", "iront"],
+        "C": ["irais", "irais", "irait", "irions", "iriez", "iraient"],
+        "S": ["aille", "ailles", "aille", "allions", "alliez", "aillent"],
+        "T": ["allasse", "allasses", "allât", "allassions", "allassiez", "allassent"],
+        "Y": ["va", "allons", "allez"],
+        "G": ["allant"],
+        "K": ["allé", "allée", "allés", "allées"],
+    },
+    "apparoir": {
+        "Template": "apparoir",
+        "P": [None, None, None, None, None, None],
+        "I": [None, None, None, None, None, None],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": [None, None, None, None],
+    },
+    "apprécier": {
+        "Template": "ier",
+        "P": ["ie", "ies", "ie", "ions", "iez", "ient"],
+        "I": ["iais", "iais", "iait", "iions", "iiez", "iaient"],
+        "J": ["iai", "ias", "ia", "iâmes", "iâtes", "ièrent"],
+        "F": ["ierai", "ieras", "iera", "ierons", "ierez", "ieront"],
+        "C": ["ierais", "ierais", "ierait", "ierions", "ieriez", "ieraient"],
+        "S": ["ie", "ies", "ie", "iions", "iiez", "ient"],
+        "T": ["iasse", "iasses", "iât", "iassions", "iassiez", "iassent"],
+        "Y": ["ie", "ions", "iez"],
+        "G": ["iant"],
+        "K": ["ié", "iée", "iés", "iées"],
+    },
+    "ardre": {
+        "Template": "ardre",
+        "P": [None, None, None, None, None, None],
+        "I": ["ardais", "ardais", "ardait", "ardions", "ardiez", "ardaient"],
+        "J": ["ardai", "ardas", "arda", "ardâmes", "ardâtes", "ardèrent"],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": [None, None, None, None],
+    },
+    "assaillir": {
+        "Template": "aillir",
+        "P": ["aille", "ailles", "aille", "aillons", "aillez", "aillent"],
+        "I": ["aillais", "aillais", "aillait", "aillions", "ailliez", "aillaient"],
+        "J": ["aillis", "aillis", "aillit", "aillîmes", "aillîtes", "aillirent"],
+        "F": ["aillirai", "ailliras", "aillira", "aillirons", "aillirez", "ailliront"],
+        "C": ["aillirais", "aillirais", "aillirait", "aillirions", "ailliriez", "ailliraient"],
+        "S": ["aille", "ailles", "aille", "aillions", "ailliez", "aillent"],
+        "T": ["aillisse", "aillisses", "aillît", "aillissions", "aillissiez", "aillissent"],
+        "Y": ["aille", "aillons", "aillez"],
+        "G": ["aillant"],
+        "K": ["ailli", "aillie", "aillis", "aillies"],
+    },
+    "assavoir": {
+        "Template": "assavoir",
+        "P": [None, None, None, None, None, None],
+        "I": [None, None, None, None, None, None],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": [None, None, None, None],
+    },
+    "asseoir": {
+        "Template": "asseoir",
+        "P": ["assois", "assois", "assoit", "assoyons", "assoyez", "assoient"],
+        "I": ["assoyais", "assoyais", "assoyait", "assoyions", "assoyiez", "assoyaient"],
+        "J": ["assis", "assis", "assit", "assîmes", "assîtes", "assirent"],
+        "F": ["assoirai", "assoiras", "assoira", "assoirons", "assoirez", "assoiront"],
+        "C": ["assoirais", "assoirais", "assoirait", "assoirions", "assoiriez", "assoiraient"],
+        "S": ["assoie", "assoies", "assoie", "assoyions", "assoyiez", "assoient"],
+        "T": ["assisse", "assisses", "assît", "assissions", "assissiez", "assissent"],
+        "Y": ["assieds", "asseyons", "asseyez"],
+        "G": ["assoyant"],
+        "K": ["assis", "assise", "assis", "assises"],
+    },
+    "assiéger": {
+        "Template": "éger",
+        "P": ["ège", "èges", "ège", "égeons", "égez", "ègent"],
+        "I": ["égeais", "égeais", "égeait", "égions", "égiez", "égeaient"],
+        "J": ["égeai", "égeas", "égea", "égeâmes", "égeâtes", "égèrent"],
+        "F": ["égerai", "égeras", "égera", "égerons", "égerez", "égeront"],
+        "C": ["égerais", "égerais", "égerait", "égerions", "égeriez", "égeraient"],
+        "S": ["ège", "èges", "ège", "égions", "égiez", "ègent"],
+        "T": ["égeasse", "égeasses", "égeât", "égeassions", "égeassiez", "égeassent"],
+        "Y": ["ège", "égeons", "égez"],
+        "G": ["égeant"],
+        "K": ["égé", "égée", "égés", "égées"],
+    },
+    "avoir": {
+        "Template": "avoir",
+        "P": ["ai", "as", "a", "avons", "avez", "ont"],
+        "I": ["avais", "avais", "avait", "avions", "aviez", "avaient"],
+        "J": ["eus", "eus", "eut", "eûmes", "eûtes", "eurent"],
+        "F": ["aurai", "auras", "aura", "aurons", "aurez", "auront"],
+        "C": ["aurais", "aurais", "aurait", "aurions", "auriez", "auraient"],
+        "S": ["aie", "aies", "ait", "ayons", "ayez", "aient"],
+        "T": ["eusse", "eusses", "eût", "eussions", "eussiez", "eussent"],
+        "Y": ["aie", "ayons", "ayez"],
+        "G": ["ayant"],
+        "K": ["eu", "eue", "eus", "eues"],
+    },
+    "battre": {
+        "Template": "ttre",
+        "P": ["ts", "ts", "t", "ttons", "ttez", "ttent"],
+        "I": ["ttais", "ttais", "ttait", "ttions", "ttiez", "ttaient"],
+        "J": ["ttis", "ttis", "ttit", "ttîmes", "ttîtes", "ttirent"],
+        "F": ["ttrai", "ttras", "ttra", "ttrons", "ttrez", "ttront"],
+        "C": ["ttrais", "ttrais", "ttrait", "ttrions", "ttriez", "ttraient"],
+        "S": ["tte", "ttes", "tte", "ttions", "ttiez", "ttent"],
+        "T": ["ttisse", "ttisses", "ttît", "ttissions", "ttissiez", "ttissent"],
+        "Y": ["ts", "ttons", "ttez"],
+        "G": ["ttant"],
+        "K": ["ttu", "ttue", "ttus", "ttues"],
+    },
+    "bienvenir": {
+        "Template": "bienvenir",
+        "P": [None, None, None, None, None, None],
+        "I": [None, None, None, None, None, None],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": [None, None, None, None],
+    },
+    "boire": {
+        "Template": "boire",
+        "P": ["bois", "bois", "boit", "buvons", "buvez", "boivent"],
+        "I": ["buvais", "buvais", "buvait", "buvions", "buviez", "buvaient"],
+        "J": ["bus", "bus", "but", "bûmes", "bûtes", "burent"],
+        "F": ["boirai", "boiras", "boira", "boirons", "boirez", "boiront"],
+        "C": ["boirais", "boirais", "boirait", "boirions", "boiriez", "boiraient"],
+        "S": ["boive", "boives", "boive", "buvions", "buviez", "boivent"],
+        "T": ["busse", "busses", "bût", "bussions", "bussiez", "bussent"],
+        "Y": ["bois", "buvons", "buvez"],
+        "G": ["buvant"],
+        "K": ["bu", "bue", "bus", "bues"],
+    },
+    "bouillir": {
+        "Template": "bouillir",
+        "P": ["bous", "bous", "bout", "bouillons", "bouillez", "bouillent"],
+        "I": ["bouillais", "bouillais", "bouillait", "bouillions", "bouilliez", "bouillaient"],
+        "J": ["bouillis", "bouillis", "bouillit", "bouillîmes", "bouillîtes", "bouillirent"],
+        "F": ["bouillirai", "bouilliras", "bouillira", "bouillirons", "bouillirez", "bouilliront"],
+        "C": [
+            "bouillirais",
+            "bouillirais",
+            "bouillirait",
+            "bouillirions",
+            "bouilliriez",
+            "bouilliraient",
+        ],
+        "S": ["bouille", "bouilles", "bouille", "bouillions", "bouilliez", "bouillent"],
+        "T": [
+            "bouillisse",
+            "bouillisses",
+            "bouillît",
+            "bouillissions",
+            "bouillissiez",
+            "bouillissent",
+        ],
+        "Y": ["bous", "bouillons", "bouillez"],
+        "G": ["bouillant"],
+        "K": ["bouilli", "bouillie", "bouillis", "bouillies"],
+    },
+    "broyer": {
+        "Template": "yer",
+        "P": ["ie", "ies", "ie", "yons", "yez", "ient"],
+        "I": ["yais", "yais", "yait", "yions", "yiez", "yaient"],
+        "J": ["yai", "yas", "ya", "yâmes", "yâtes", "yèrent"],
+        "F": ["ierai", "ieras", "iera", "ierons", "ierez", "ieront"],
+        "C": ["ierais", "ierais", "ierait", "ierions", "ieriez", "ieraient"],
+        "S": ["ie", "ies", "ie", "yions", "yiez", "ient"],
+        "T": ["yasse", "yasses", "yât", "yassions", "yassiez", "yassent"],
+        "Y": ["ie", "yons", "yez"],
+        "G": ["yant"],
+        "K": ["yé", "yée", "yés", "yées"],
+    },
+    "chaloir": {
+        "Template": "chaloir",
+        "P": [None, None, "chaut", None, None, None],
+        "I": [None, None, None, None, None, None],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": [None, None, None, None],
+    },
+    "choir": {
+        "Template": "choir",
+        "P": ["chois", "chois", "choit", None, None, "choient"],
+        "I": [None, None, None, None, None, None],
+        "J": ["chus", "chus", "chut", "chûmes", "chûtes", "churent"],
+        "F": ["choirai", "choiras", "choira", "choirons", "choirez", "choiront"],
+        "C": ["choirais", "choirais", "choirait", "choirions", "choiriez", "choiraient"],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, "chût", None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": ["chu", "chue", "chus", "chues"],
+    },
+    "clore": {
+        "Template": "clore",
+        "P": ["clos", "clos", "clôt", "closons", "closez", "closent"],
+        "I": [None, None, None, None, None, None],
+        "J": [None, None, None, None, None, None],
+        "F": ["clorai", "cloras", "clora", "clorons", "clorez", "cloront"],
+        "C": ["clorais", "clorais", "clorait", "clorions", "cloriez", "cloraient"],
+        "S": ["close", "closes", "close", "closions", "closiez", "closent"],
+        "T": [None, None, None, None, None, None],
+        "Y": ["clos", None, None],
+        "G": ["closant"],
+        "K": ["clos", "close", "clos", "closes"],
+    },
+    "comparoir": {
+        "Template": "comparoir",
+        "P": [None, None, None, None, None, None],
+        "I": [None, None, None, None, None, None],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": [None, None, None, None],
+    },
+    "conclure": {
+        "Template": "clure",
+        "P": ["clus", "clus", "clut", "cluons", "cluez", "cluent"],
+        "I": ["cluais", "cluais", "cluait", "cluions", "cluiez", "cluaient"],
+        "J": ["clus", "clus", "clut", "clûmes", "clûtes", "clurent"],
+        "F": ["clurai", "cluras", "clura", "clurons", "clurez", "cluront"],
+        "C": ["clurais", "clurais", "clurait", "clurions", "cluriez", "cluraient"],
+        "S": ["clue", "clues", "clue", "cluions", "cluiez", "cluent"],
+        "T": ["clusse", "clusses", "clût", "clussions", "clussiez", "clussent"],
+        "Y": ["clus", "cluons", "cluez"],
+        "G": ["cluant"],
+        "K": ["clu", "clue", "clus", "clues"],
+    },
+    "confire": {
+        "Template": "ire",
+        "P": ["is", "is", "it", "isons", "isez", "isent"],
+        "I": ["isais", "isais", "isait", "isions", "isiez", "isaient"],
+        "J": ["is", "is", "it", "îmes", "îtes", "irent"],
+        "F": ["irai", "iras", "ira", "irons", "irez", "iront"],
+        "C": ["irais", "irais", "irait", "irions", "iriez", "iraient"],
+        "S": ["ise", "ises", "ise", "isions", "isiez", "isent"],
+        "T": ["isse", "isses", "ît", "issions", "issiez", "issent"],
+        "Y": ["is", "isons", "isez"],
+        "G": ["isant"],
+        "K": ["it", "ite", "its", "ites"],
+    },
+    "connaître": {
+        "Template": "aître",
+        "P": ["ais", "ais", "aît", "aissons", "aissez", "aissent"],
+        "I": ["aissais", "aissais", "aissait", "aissions", "aissiez", "aissaient"],
+        "J": ["us", "us", "ut", "ûmes", "ûtes", "urent"],
+        "F": ["aîtrai", "aîtras", "aîtra", "aîtrons", "aîtrez", "aîtront"],
+        "C": ["aîtrais", "aîtrais", "aîtrait", "aîtrions", "aîtriez", "aîtraient"],
+        "S": ["aisse", "aisses", "aisse", "aissions", "aissiez", "aissent"],
+        "T": ["usse", "usses", "ût", "ussions", "ussiez", "ussent"],
+        "Y": ["ais", "aissons", "aissez"],
+        "G": ["aissant"],
+        "K": ["u", "ue", "us", "ues"],
+    },
+    "coudre": {
+        "Template": "coudre",
+        "P": ["couds", "couds", "coud", "cousons", "cousez", "cousent"],
+        "I": ["cousais", "cousais", "cousait", "cousions", "cousiez", "cousaient"],
+        "J": ["cousis", "cousis", "cousit", "cousîmes", "cousîtes", "cousirent"],
+        "F": ["coudrai", "coudras", "coudra", "coudrons", "coudrez", "coudront"],
+        "C": ["coudrais", "coudrais", "coudrait", "coudrions", "coudriez", "coudraient"],
+        "S": ["couse", "couses", "couse", "cousions", "cousiez", "cousent"],
+        "T": ["cousisse", "cousisses", "cousît", "cousissions", "cousissiez", "cousissent"],
+        "Y": ["couds", "cousons", "cousez"],
+        "G": ["cousant"],
+        "K": ["cousu", "cousue", "cousus", "cousues"],
+    },
+    "courir": {
+        "Template": "courir",
+        "P": ["cours", "cours", "court", "courons", "courez", "courent"],
+        "I": ["courais", "courais", "courait", "courions", "couriez", "couraient"],
+        "J": ["courus", "courus", "courut", "courûmes", "courûtes", "coururent"],
+        "F": ["courrai", "courras", "courra", "courrons", "courrez", "courront"],
+        "C": ["courrais", "courrais", "courrait", "courrions", "courriez", "courraient"],
+        "S": ["coure", "coures", "coure", "courions", "couriez", "courent"],
+        "T": ["courusse", "courusses", "courût", "courussions", "courussiez", "courussent"],
+        "Y": ["cours", "courons", "courez"],
+        "G": ["courant"],
+        "K": ["couru", "courue", "courus", "courues"],
+    },
+    "couvrir": {
+        "Template": "rir",
+        "P": ["re", "res", "re", "rons", "rez", "rent"],
+        "I": ["rais", "rais", "rait", "rions", "riez", "raient"],
+        "J": ["ris", "ris", "rit", "rîmes", "rîtes", "rirent"],
+        "F": ["rirai", "riras", "rira", "rirons", "rirez", "riront"],
+        "C": ["rirais", "rirais", "rirait", "ririons", "ririez", "riraient"],
+        "S": ["re", "res", "re", "rions", "riez", "rent"],
+        "T": ["risse", "risses", "rît", "rissions", "rissiez", "rissent"],
+        "Y": ["re", "rons", "rez"],
+        "G": ["rant"],
+        "K": ["ert", "erte", "erts", "ertes"],
+    },
+    "craindre": {
+        "Template": "aindre",
+        "P": ["ains", "ains", "aint", "aignons", "aignez", "aignent"],
+        "I": ["aignais", "aignais", "aignait", "aignions", "aigniez", "aignaient"],
+        "J": ["aignis", "aignis", "aignit", "aignîmes", "aignîtes", "aignirent"],
+        "F": ["aindrai", "aindras", "aindra", "aindrons", "aindrez", "aindront"],
+        "C": ["aindrais", "aindrais", "aindrait", "aindrions", "aindriez", "aindraient"],
+        "S": ["aigne", "aignes", "aigne", "aignions", "aigniez", "aignent"],
+        "T": ["aignisse", "aignisses", "aignît", "aignissions", "aignissiez", "aignissent"],
+        "Y": ["ains", "aignons", "aignez"],
+        "G": ["aignant"],
+        "K": ["aint", "ainte", "aints", "aintes"],
+    },
+    "croire": {
+        "Template": "croire",
+        "P": ["crois", "crois", "croit", "croyons", "croyez", "croient"],
+        "I": ["croyais", "croyais", "croyait", "croyions", "croyiez", "croyaient"],
+        "J": ["crus", "crus", "crut", "crûmes", "crûtes", "crurent"],
+        "F": ["croirai", "croiras", "croira", "croirons", "croirez", "croiront"],
+        "C": ["croirais", "croirais", "croirait", "croirions", "croiriez", "croiraient"],
+        "S": ["croie", "croies", "croie", "croyions", "croyiez", "croient"],
+        "T": ["crusse", "crusses", "crût", "crussions", "crussiez", "crussent"],
+        "Y": ["crois", "croyons", "croyez"],
+        "G": ["croyant"],
+        "K": ["cru", "crue", "crus", "crues"],
+    },
+    "croître": {
+        "Template": "oître",
+        "P": ["oîs", "oîs", "oît", "oissons", "oissez", "oissent"],
+        "I": ["oissais", "oissais", "oissait", "oissions", "oissiez", "oissaient"],
+        "J": ["ûs", "ûs", "ût", "ûmes", "ûtes", "ûrent"],
+        "F": ["oîtrai", "oîtras", "oîtra", "oîtrons", "oîtrez", "oîtront"],
+        "C": ["oîtrais", "oîtrais", "oîtrait", "oîtrions", "oîtriez", "oîtraient"],
+        "S": ["oisse", "oisses", "oisse", "oissions", "oissiez", "oissent"],
+        "T": ["ûsse", "ûsses", "ût", "ûssions", "ûssiez", "ûssent"],
+        "Y": ["oîs", "oissons", "oissez"],
+        "G": ["oissant"],
+        "K": ["û", None, None, None],
+    },
+    "créer": {
+        "Template": "éer",
+        "P": ["ée", "ées", "ée", "éons", "éez", "éent"],
+        "I": ["éais", "éais", "éait", "éions", "éiez", "éaient"],
+        "J": ["éai", "éas", "éa", "éâmes", "éâtes", "éèrent"],
+        "F": ["éerai", "éeras", "éera", "éerons", "éerez", "éeront"],
+        "C": ["éerais", "éerais", "éerait", "éerions", "éeriez", "éeraient"],
+        "S": ["ée", "ées", "ée", "éions", "éiez", "éent"],
+        "T": ["éasse", "éasses", "éât", "éassions", "éassiez", "éassent"],
+        "Y": ["ée", "éons", "éez"],
+        "G": ["éant"],
+        "K": ["éé", "éée", "éés", "éées"],
+    },
+    "cueillir": {
+        "Template": "cueillir",
+        "P": ["cueille", "cueilles", "cueille", "cueillons", "cueillez", "cueillent"],
+        "I": ["cueillais", "cueillais", "cueillait", "cueillions", "cueilliez", "cueillaient"],
+        "J": ["cueillis", "cueillis", "cueillit", "cueillîmes", "cueillîtes", "cueillirent"],
+        "F": ["cueillerai", "cueilleras", "cueillera", "cueillerons", "cueillerez", "cueilleront"],
+        "C": [
+            "cueillerais",
+            "cueillerais",
+            "cueillerait",
+            "cueillerions",
+            "cueilleriez",
+            "cueilleraient",
+        ],
+        "S": ["cueille", "cueilles", "cueille", "cueillions", "cueilliez", "cueillent"],
+        "T": [
+            "cueillisse",
+            "cueillisses",
+            "cueillît",
+            "cueillissions",
+            "cueillissiez",
+            "cueillissent",
+        ],
+        "Y": ["cueille", "cueillons", "cueillez"],
+        "G": ["cueillant"],
+        "K": ["cueilli", "cueillie", "cueillis", "cueillies"],
+    },
+    "cuire": {
+        "Template": "uire",
+        "P": ["uis", "uis", "uit", "uisons", "uisez", "uisent"],
+        "I": ["uisais", "uisais", "uisait", "uisions", "uisiez", "uisaient"],
+        "J": ["uisis", "uisis", "uisit", "uisîmes", "uisîtes", "uisirent"],
+        "F": ["uirai", "uiras", "uira", "uirons", "uirez", "uiront"],
+        "C": ["uirais", "uirais", "uirait", "uirions", "uiriez", "uiraient"],
+        "S": ["uise", "uises", "uise", "uisions", "uisiez", "uisent"],
+        "T": ["uisisse", "uisisses", "uisît", "uisissions", "uisissiez", "uisissent"],
+        "Y": ["uis", "uisons", "uisez"],
+        "G": ["uisant"],
+        "K": ["uit", "uite", "uits", "uites"],
+    },
+    "céder": {
+        "Template": "é?er",
+        "P": ["è?e", "è?es", "è?e", "é?ons", "é?ez", "è?ent"],
+        "I": ["é?ais", "é?ais", "é?ait", "é?ions", "é?iez", "é?aient"],
+        "J": ["é?ai", "é?as", "é?a", "é?âmes", "é?âtes", "é?èrent"],
+        "F": ["é?erai", "é?eras", "é?era", "é?erons", "é?erez", "é?eront"],
+        "C": ["é?erais", "é?erais", "é?erait", "é?erions", "é?eriez", "é?eraient"],
+        "S": ["è?e", "è?es", "è?e", "é?ions", "é?iez", "è?ent"],
+        "T": ["é?asse", "é?asses", "é?ât", "é?assions", "é?assiez", "é?assent"],
+        "Y": ["è?e", "é?ons", "é?ez"],
+        "G": ["é?ant"],
+        "K": ["é?é", "é?ée", "é?és", "é?ées"],
+    },
+    "devoir": {
+        "Template": "devoir",
+        "P": ["dois", "dois", "doit", "devons", "devez", "doivent"],
+        "I": ["devais", "devais", "devait", "devions", "deviez", "devaient"],
+        "J": ["dus", "dus", "dut", "dûmes", "dûtes", "durent"],
+        "F": ["devrai", "devras", "devra", "devrons", "devrez", "devront"],
+        "C": ["devrais", "devrais", "devrait", "devrions", "devriez", "devraient"],
+        "S": ["doive", "doives", "doive", "devions", "deviez", "doivent"],
+        "T": ["dusse", "dusses", "dût", "dussions", "dussiez", "dussent"],
+        "Y": ["dois", "devons", "devez"],
+        "G": ["devant"],
+        "K": ["dû", "due", "dus", "dues"],
+    },
+    "dire": {
+        "Template": "dire",
+        "P": ["dis", "dis", "dit", "disons", "dites", "disent"],
+        "I": ["disais", "disais", "disait", "disions", "disiez", "disaient"],
+        "J": ["dis", "dis", "dit", "dîmes", "dîtes", "dirent"],
+        "F": ["dirai", "diras", "dira", "dirons", "direz", "diront"],
+        "C": ["dirais", "dirais", "dirait", "dirions", "diriez", "diraient"],
+        "S": ["dise", "dises", "dise", "disions", "disiez", "disent"],
+        "T": ["disse", "disses", "dît", "dissions", "dissiez", "dissent"],
+        "Y": ["dis", "disons", "dites"],
+        "G": ["disant"],
+        "K": ["dit", "dite", "dits", "dites"],
+    },
+    "dormir": {
+        "Template": "dormir",
+        "P": ["dors", "dors", "dort", "dormons", "dormez", "dorment"],
+        "I": ["dormais", "dormais", "dormait", "dormions", "dormiez", "dormaient"],
+        "J": ["dormis", "dormis", "dormit", "dormîmes", "dormîtes", "dormirent"],
+        "F": ["dormirai", "dormiras", "dormira", "dormirons", "dormirez", "dormiront"],
+        "C": ["dormirais", "dormirais", "dormirait", "dormirions", "dormiriez", "dormiraient"],
+        "S": ["dorme", "dormes", "dorme", "dormions", "dormiez", "dorment"],
+        "T": ["dormisse", "dormisses", "dormît", "dormissions", "dormissiez", "dormissent"],
+        "Y": ["dors", "dormons", "dormez"],
+        "G": ["dormant"],
+        "K": ["dormi", "dormie", "dormis", "dormies"],
+    },
+    "déchoir": {
+        "Template": "déchoir",
+        "P": ["déchois", "déchois", "déchoit", "déchoyons", "déchoyez", "déchoient"],
+        "I": [None, None, None, None, None, None],
+        "J": ["déchus", "déchus", "déchut", "déchûmes", "déchûtes", "déchurent"],
+        "F": ["déchoirai", "déchoiras", "déchoira", "déchoirons", "déchoirez", "déchoiront"],
+        "C": [
+            "déchoirais",
+            "déchoirais",
+            "déchoirait",
+            "déchoirions",
+            "déchoiriez",
+            "déchoiraient",
+        ],
+        "S": ["déchoie", "déchoies", "déchoie", "déchoyions", "déchoyiez", "déchoient"],
+        "T": ["déchusse", "déchusses", "déchût", "déchussions", "déchussiez", "déchussent"],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": ["déchu", "déchue", "déchus", "déchues"],
+    },
+    "endêver": {
+        "Template": "endêver",
+        "P": ["endêve", "endêves", "endêve", "endêvons", "endêvez", "endêvent"],
+        "I": ["endêvais", "endêvais", "endêvait", "endêvions", "endêviez", "endêvaient"],
+        "J": ["endêvai", "endêvas", "endêva", "endêvâmes", "endêvâtes", "endêvèrent"],
+        "F": ["endêverai", "endêveras", "endêvera", "endêverons", "endêverez", "endêveront"],
+        "C": [
+            "endêverais",
+            "endêverais",
+            "endêverait",
+            "endêverions",
+            "endêveriez",
+            "endêveraient",
+        ],
+        "S": ["endêve", "endêves", "endêve", "endêvions", "endêviez", "endêvent"],
+        "T": ["endêvasse", "endêvasses", "endêvât", "endêvassions", "endêvassiez", "endêvassent"],
+        "Y": ["endêve", "endêvons", "endêvez"],
+        "G": ["endêvant"],
+        "K": ["endêvé", "endêvée", "endêvés", "endêvées"],
+    },
+    "enquerre": {
+        "Template": "enquerre",
+        "P": [None, None, None, None, None, None],
+        "I": [None, None, None, None, None, None],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": [None, None, None, None],
+    },
+    "envoyer": {
+        "Template": "envoyer",
+        "P": ["envoie", "envoies", "envoie", "envoyons", "envoyez", "envoient"],
+        "I": ["envoyais", "envoyais", "envoyait", "envoyions", "envoyiez", "envoyaient"],
+        "J": ["envoyai", "envoyas", "envoya", "envoyâmes", "envoyâtes", "envoyèrent"],
+        "F": ["enverrai", "enverras", "enverra", "enverrons", "enverrez", "enverront"],
+        "C": ["enverrais", "enverrais", "enverrait", "enverrions", "enverriez", "enverraient"],
+        "S": ["envoie", "envoies", "envoie", "envoyions", "envoyiez", "envoient"],
+        "T": ["envoyasse", "envoyasses", "envoyât", "envoyassions", "envoyassiez", "envoyassent"],
+        "Y": ["envoie", "envoyons", "envoyez"],
+        "G": ["envoyant"],
+        "K": ["envoyé", "envoyée", "envoyés", "envoyées"],
+    },
+    "faillir": {
+        "Template": "faillir",
+        "P": ["faux", "faux", "faut", "faillons", "faillissez", "faillissent"],
+        "I": [
+            "faillissais",
+            "faillissais",
+            "faillissait",
+            "faillissions",
+            "faillissiez",
+            "faillissaient",
+        ],
+        "J": ["faillis", "faillis", "faillit", "faillîmes", "faillîtes", "faillirent"],
+        "F": ["faudrai", "faudras", "faudra", "faudrons", "faudrez", "faudront"],
+        "C": ["faudrais", "faudrais", "faudrait", "faudrions", "faudriez", "faudraient"],
+        "S": [
+            "faillisse",
+            "faillisses",
+            "faillisse",
+            "faillissions",
+            "faillissiez",
+            "faillissent",
+        ],
+        "T": ["faillisse", "faillisses", "faillît", "faillissions", "faillissiez", "faillissent"],
+        "Y": [None, None, None],
+        "G": ["faillissant"],
+        "K": ["failli", None, None, None],
+    },
+    "faire": {
+        "Template": "faire",
+        "P": ["fais", "fais", "fait", "faisons", "faites", "font"],
+        "I": ["faisais", "faisais", "faisait", "faisions", "faisiez", "faisaient"],
+        "J": ["fis", "fis", "fit", "fîmes", "fîtes", "firent"],
+        "F": ["ferai", "feras", "fera", "ferons", "ferez", "feront"],
+        "C": ["ferais", "ferais", "ferait", "ferions", "feriez", "feraient"],
+        "S": ["fasse", "fasses", "fasse", "fassions", "fassiez", "fassent"],
+        "T": ["fisse", "fisses", "fît", "fissions", "fissiez", "fissent"],
+        "Y": ["fais", "faisons", "faites"],
+        "G": ["faisant"],
+        "K": ["fait", "faite", "faits", "faites"],
+    },
+    "falloir": {
+        "Template": "falloir",
+        "P": [None, None, "faut", None, None, None],
+        "I": [None, None, "fallait", None, None, None],
+        "J": [None, None, "fallut", None, None, None],
+        "F": [None, None, "faudra", None, None, None],
+        "C": [None, None, "faudrait", None, None, None],
+        "S": [None, None, "faille", None, None, None],
+        "T": [None, None, "fallût", None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": ["fallu", None, None, None],
+    },
+    "finir": {
+        "Template": "ir",
+        "P": ["is", "is", "it", "issons", "issez", "issent"],
+        "I": ["issais", "issais", "issait", "issions", "issiez", "issaient"],
+        "J": ["is", "is", "it", "îmes", "îtes", "irent"],
+        "F": ["irai", "iras", "ira", "irons", "irez", "iront"],
+        "C": ["irais", "irais", "irait", "irions", "iriez", "iraient"],
+        "S": ["isse", "isses", "isse", "issions", "issiez", "issent"],
+        "T": ["isse", "isses", "ît", "issions", "issiez", "issent"],
+        "Y": ["is", "issons", "issez"],
+        "G": ["issant"],
+        "K": ["i", "ie", "is", "ies"],
+    },
+    "forclore": {
+        "Template": "forclore",
+        "P": [None, None, None, None, None, None],
+        "I": [None, None, None, None, None, None],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": ["forclos", "forclose", "forclos", "forcloses"],
+    },
+    "fuir": {
+        "Template": "fuir",
+        "P": ["fuis", "fuis", "fuit", "fuyons", "fuyez", "fuient"],
+        "I": ["fuyais", "fuyais", "fuyait", "fuyions", "fuyiez", "fuyaient"],
+        "J": ["fuis", "fuis", "fuit", "fuîmes", "fuîtes", "fuirent"],
+        "F": ["fuirai", "fuiras", "fuira", "fuirons", "fuirez", "fuiront"],
+        "C": ["fuirais", "fuirais", "fuirait", "fuirions", "fuiriez", "fuiraient"],
+        "S": ["fuie", "fuies", "fuie", "fuyions", "fuyiez", "fuient"],
+        "T": ["fuisse", "fuisses", "fuît", "fuissions", "fuissiez", "fuissent"],
+        "Y": ["fuis", "fuyons", "fuyez"],
+        "G": ["fuyant"],
+        "K": ["fui", None, None, None],
+    },
+    "férir": {
+        "Template": "férir",
+        "P": [None, None, None, None, None, None],
+        "I": [None, None, None, None, None, None],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": [None, None, None, None],
+    },
+    "gésir": {
+        "Template": "gésir",
+        "P": ["gis", "gis", "gît", "gisons", "gisez", "gisent"],
+        "I": ["gisais", "gisais", "gisait", "gisions", "gisiez", "gisaient"],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": ["gisant"],
+        "K": [None, None, None, None],
+    },
+    "haïr": {
+        "Template": "haïr",
+        "P": ["hais", "hais", "hait", "haïssons", "haïssez", "haïssent"],
+        "I": ["haïssais", "haïssais", "haïssait", "haïssions", "haïssiez", "haïssaient"],
+        "J": ["haïs", "haïs", "haït", "haïmes", "haïtes", "haïrent"],
+        "F": ["haïrai", "haïras", "haïra", "haïrons", "haïrez", "haïront"],
+        "C": ["haïrais", "haïrais", "haïrait", "haïrions", "haïriez", "haïraient"],
+        "S": ["haïsse", "haïsses", "haïsse", "haïssions", "haïssiez", "haïssent"],
+        "T": ["haïsse", "haïsses", "haït", "haïssions", "haïssiez", "haïssent"],
+        "Y": ["hais", "haïssons", "haïssez"],
+        "G": ["haïssant"],
+        "K": ["haï", "haïe", "haïs", "haïes"],
+    },
+    "huir": {
+        "Template": "huir",
+        "P": ["huis", "huis", "huit", "huissons", "huissez", "huissent"],
+        "I": ["huissais", "huissais", "huissait", "huissions", "huissiez", "huissaient"],
+        "J": ["huis", "huis", "huit", "huîmes", "huîtes", "huirent"],
+        "F": ["huirai", "huiras", "huira", "huirons", "huirez", "huiront"],
+        "C": ["huirais", "huirais", "huirait", "huirions", "huiriez", "huiraient"],
+        "S": ["huisse", "huisses", "huisse", "huissions", "huissiez", "huissent"],
+        "T": ["huisse", "huisses", "huît", "huissions", "huissiez", "huissent"],
+        "Y": ["huis", "huissons", "huissez"],
+        "G": ["huissant"],
+        "K": ["hui", None, None, None],
+    },
+    "issir": {
+        "Template": "issir",
+        "P": [None, None, None, None, None, None],
+        "I": [None, None, None, None, None, None],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": [None, None, None, None],
+    },
+    "jeter": {
+        "Template": "e?er",
+        "P": ["e??e", "e??es", "e??e", "e?ons", "e?ez", "e??ent"],
+        "I": ["e?ais", "e?ais", "e?ait", "e?ions", "e?iez", "e?aient"],
+        "J": ["e?ai", "e?as", "e?a", "e?âmes", "e?âtes", "e?èrent"],
+        "F": ["e??erai", "e??eras", "e??era", "e??erons", "e??erez", "e??eront"],
+        "C": ["e??erais", "e??erais", "e??erait", "e??erions", "e??eriez", "e??eraient"],
+        "S": ["e??e", "e??es", "e??e", "e?ions", "e?iez", "e??ent"],
+        "T": ["e?asse", "e?asses", "e?ât", "e?assions", "e?assiez", "e?assent"],
+        "Y": ["e??e", "e?ons", "e?ez"],
+        "G": ["e?ant"],
+        "K": ["e?é", "e?ée", "e?és", "e?ées"],
+    },
+    "joindre": {
+        "Template": "oindre",
+        "P": ["oins", "oins", "oint", "oignons", "oignez", "oignent"],
+        "I": ["oignais", "oignais", "oignait", "oignions", "oigniez", "oignaient"],
+        "J": ["oignis", "oignis", "oignit", "oignîmes", "oignîtes", "oignirent"],
+        "F": ["oindrai", "oindras", "oindra", "oindrons", "oindrez", "oindront"],
+        "C": ["oindrais", "oindrais", "oindrait", "oindrions", "oindriez", "oindraient"],
+        "S": ["oigne", "oignes", "oigne", "oignions", "oigniez", "oignent"],
+        "T": ["oignisse", "oignisses", "oignît", "oignissions", "oignissiez", "oignissent"],
+        "Y": ["oins", "oignons", "oignez"],
+        "G": ["oignant"],
+        "K": ["oint", "ointe", "oints", "ointes"],
+    },
+    "lire": {
+        "Template": "lire",
+        "P": ["lis", "lis", "lit", "lisons", "lisez", "lisent"],
+        "I": ["lisais", "lisais", "lisait", "lisions", "lisiez", "lisaient"],
+        "J": ["lus", "lus", "lut", "lûmes", "lûtes", "lurent"],
+        "F": ["lirai", "liras", "lira", "lirons", "lirez", "liront"],
+        "C": ["lirais", "lirais", "lirait", "lirions", "liriez", "liraient"],
+        "S": ["lise", "lises", "lise", "lisions", "lisiez", "lisent"],
+        "T": ["lusse", "lusses", "lût", "lussions", "lussiez", "lussent"],
+        "Y": ["lis", "lisons", "lisez"],
+        "G": ["lisant"],
+        "K": ["lu", "lue", "lus", "lues"],
+    },
+    "malfaire": {
+        "Template": "malfaire",
+        "P": [None, None, None, None, None, None],
+        "I": [None, None, None, None, None, None],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": [None, None, None, None],
+    },
+    "manger": {
+        "Template": "ger",
+        "P": ["ge", "ges", "ge", "geons", "gez", "gent"],
+        "I": ["geais", "geais", "geait", "gions", "giez", "geaient"],
+        "J": ["geai", "geas", "gea", "geâmes", "geâtes", "gèrent"],
+        "F": ["gerai", "geras", "gera", "gerons", "gerez", "geront"],
+        "C": ["gerais", "gerais", "gerait", "gerions", "geriez", "geraient"],
+        "S": ["ge", "ges", "ge", "gions", "giez", "gent"],
+        "T": ["geasse", "geasses", "geât", "geassions", "geassiez", "geassent"],
+        "Y": ["ge", "geons", "gez"],
+        "G": ["geant"],
+        "K": ["gé", "gée", "gés", "gées"],
+    },
+    "messeoir": {
+        "Template": "messeoir",
+        "P": [None, None, None, None, None, None],
+        "I": [None, None, None, None, None, None],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": ["messéant"],
+        "K": [None, None, None, None],
+    },
+    "mettre": {
+        "Template": "mettre",
+        "P": ["mets", "mets", "met", "mettons", "mettez", "mettent"],
+        "I": ["mettais", "mettais", "mettait", "mettions", "mettiez", "mettaient"],
+        "J": ["mis", "mis", "mit", "mîmes", "mîtes", "mirent"],
+        "F": ["mettrai", "mettras", "mettra", "mettrons", "mettrez", "mettront"],
+        "C": ["mettrais", "mettrais", "mettrait", "mettrions", "mettriez", "mettraient"],
+        "S": ["mette", "mettes", "mette", "mettions", "mettiez", "mettent"],
+        "T": ["misse", "misses", "mît", "missions", "missiez", "missent"],
+        "Y": ["mets", "mettons", "mettez"],
+        "G": ["mettant"],
+        "K": ["mis", "mise", "mis", "mises"],
+    },
+    "modeler": {
+        "Template": "e?er",
+        "P": ["è?e", "è?es", "è?e", "e?ons", "e?ez", "è?ent"],
+        "I": ["e?ais", "e?ais", "e?ait", "e?ions", "e?iez", "e?aient"],
+        "J": ["e?ai", "e?as", "e?a", "e?âmes", "e?âtes", "e?èrent"],
+        "F": ["è?erai", "è?eras", "è?era", "è?erons", "è?erez", "è?eront"],
+        "C": ["è?erais", "è?erais", "è?erait", "è?erions", "è?eriez", "è?eraient"],
+        "S": ["è?e", "è?es", "è?e", "e?ions", "e?iez", "è?ent"],
+        "T": ["e?asse", "e?asses", "e?ât", "e?assions", "e?assiez", "e?assent"],
+        "Y": ["è?e", "e?ons", "e?ez"],
+        "G": ["e?ant"],
+        "K": ["e?é", "e?ée", "e?és", "e?ées"],
+    },
+    "moudre": {
+        "Template": "moudre",
+        "P": ["mouds", "mouds", "moud", "moulons", "moulez", "moulent"],
+        "I": ["moulais", "moulais", "moulait", "moulions", "mouliez", "moulaient"],
+        "J": ["moulus", "moulus", "moulut", "moulûmes", "moulûtes", "moulurent"],
+        "F": ["moudrai", "moudras", "moudra", "moudrons", "moudrez", "moudront"],
+        "C": ["moudrais", "moudrais", "moudrait", "moudrions", "moudriez", "moudraient"],
+        "S": ["moule", "moules", "moule", "moulions", "mouliez", "moulent"],
+        "T": ["moulusse", "moulusses", "moulût", "moulussions", "moulussiez", "moulussent"],
+        "Y": ["mouds", "moulons", "moulez"],
+        "G": ["moulant"],
+        "K": ["moulu", "moulue", "moulus", "moulues"],
+    },
+    "mourir": {
+        "Template": "mourir",
+        "P": ["meurs", "meurs", "meurt", "mourons", "mourez", "meurent"],
+        "I": ["mourais", "mourais", "mourait", "mourions", "mouriez", "mouraient"],
+        "J": ["mourus", "mourus", "mourut", "mourûmes", "mourûtes", "moururent"],
+        "F": ["mourrai", "mourras", "mourra", "mourrons", "mourrez", "mourront"],
+        "C": ["mourrais", "mourrais", "mourrait", "mourrions", "mourriez", "mourraient"],
+        "S": ["meure", "meures", "meure", "mourions", "mouriez", "meurent"],
+        "T": ["mourusse", "mourusses", "mourût", "mourussions", "mourussiez", "mourussent"],
+        "Y": ["meurs", "mourons", "mourez"],
+        "G": ["mourant"],
+        "K": ["mort", "morte", "morts", "mortes"],
+    },
+    "mouvoir": {
+        "Template": "mouvoir",
+        "P": ["meus", "meus", "meut", "mouvons", "mouvez", "meuvent"],
+        "I": ["mouvais", "mouvais", "mouvait", "mouvions", "mouviez", "mouvaient"],
+        "J": ["mus", "mus", "mut", "mûmes", "mûtes", "murent"],
+        "F": ["mouvrai", "mouvras", "mouvra", "mouvrons", "mouvrez", "mouvront"],
+        "C": ["mouvrais", "mouvrais", "mouvrait", "mouvrions", "mouvriez", "mouvraient"],
+        "S": ["meuve", "meuves", "meuve", "mouvions", "mouviez", "meuvent"],
+        "T": ["musse", "musses", "mût", "mussions", "mussiez", "mussent"],
+        "Y": ["meus", "mouvons", "mouvez"],
+        "G": ["mouvant"],
+        "K": ["mû", "mue", "mus", "mues"],
+    },
+    "naître": {
+        "Template": "naître",
+        "P": ["nais", "nais", "naît", "naissons", "naissez", "naissent"],
+        "I": ["naissais", "naissais", "naissait", "naissions", "naissiez", "naissaient"],
+        "J": ["naquis", "naquis", "naquit", "naquîmes", "naquîtes", "naquirent"],
+        "F": ["naîtrai", "naîtras", "naîtra", "naîtrons", "naîtrez", "naîtront"],
+        "C": ["naîtrais", "naîtrais", "naîtrait", "naîtrions", "naîtriez", "naîtraient"],
+        "S": ["naisse", "naisses", "naisse", "naissions", "naissiez", "naissent"],
+        "T": ["naquisse", "naquisses", "naquît", "naquissions", "naquissiez", "naquissent"],
+        "Y": ["nais", "naissons", "naissez"],
+        "G": ["naissant"],
+        "K": ["né", "née", "nés", "nées"],
+    },
+    "occire": {
+        "Template": "occire",
+        "P": ["occis", "occis", "occit", None, None, None],
+        "I": [None, None, None, None, None, None],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": ["occis", "occise", "occis", "occises"],
+    },
+    "ouïr": {
+        "Template": "ouïr",
+        "P": ["ouïs", "ouïs", "ouït", "oyons", "oyez", "ouïssent"],
+        "I": ["oyais", "oyais", "oyait", "oyions", "oyiez", "oyaient"],
+        "J": ["ouïs", "ouïs", "ouït", "ouïmes", "ouïtes", "ouïrent"],
+        "F": ["ouïrai", "ouïras", "ouïra", "ouïrons", "ouïrez", "ouïront"],
+        "C": ["ouïrais", "ouïrais", "ouïrait", "ouïrions", "ouïriez", "ouïraient"],
+        "S": ["ouïsse", "ouïsses", "ouïsse", "oyions", "oyiez", "ouïssent"],
+        "T": ["ouïsse", "ouïsses", "ouït", "ouïssions", "ouïssiez", "ouïssent"],
+        "Y": ["ouïs", "oyons", "oyez"],
+        "G": ["oyant"],
+        "K": ["ouï", "ouïe", "ouïs", "ouïes"],
+    },
+    "payer": {
+        "Template": "ayer",
+        "P": ["aye", "ayes", "aye", "ayons", "ayez", "ayent"],
+        "I": ["ayais", "ayais", "ayait", "ayions", "ayiez", "ayaient"],
+        "J": ["ayai", "ayas", "aya", "ayâmes", "ayâtes", "ayèrent"],
+        "F": ["ayerai", "ayeras", "ayera", "ayerons", "ayerez", "ayeront"],
+        "C": ["ayerais", "ayerais", "ayerait", "ayerions", "ayeriez", "ayeraient"],
+        "S": ["aye", "ayes", "aye", "ayions", "ayiez", "ayent"],
+        "T": ["ayasse", "ayasses", "ayât", "ayassions", "ayassiez", "ayassent"],
+        "Y": ["aye", "ayons", "ayez"],
+        "G": ["ayant"],
+        "K": ["ayé", "ayée", "ayés", "ayées"],
+    },
+    "paître": {
+        "Template": "paître",
+        "P": ["pais", "pais", "paît", "paissons", "paissez", "paissent"],
+        "I": ["paissais", "paissais", "paissait", "paissions", "paissiez", "paissaient"],
+        "J": [None, None, None, None, None, None],
+        "F": ["paîtrai", "paîtras", "paîtra", "paîtrons", "paîtrez", "paîtront"],
+        "C": ["paîtrais", "paîtrais", "paîtrait", "paîtrions", "paîtriez", "paîtraient"],
+        "S": ["paisse", "paisses", "paisse", "paissions", "paissiez", "paissent"],
+        "T": [None, None, None, None, None, None],
+        "Y": ["pais", "paissons", "paissez"],
+        "G": ["paissant"],
+        "K": ["pu", None, None, None],
+    },
+    "peindre": {
+        "Template": "eindre",
+        "P": ["eins", "eins", "eint", "eignons", "eignez", "eignent"],
+        "I": ["eignais", "eignais", "eignait", "eignions", "eigniez", "eignaient"],
+        "J": ["eignis", "eignis", "eignit", "eignîmes", "eignîtes", "eignirent"],
+        "F": ["eindrai", "eindras", "eindra", "eindrons", "eindrez", "eindront"],
+        "C": ["eindrais", "eindrais", "eindrait", "eindrions", "eindriez", "eindraient"],
+        "S": ["eigne", "eignes", "eigne", "eignions", "eigniez", "eignent"],
+        "T": ["eignisse", "eignisses", "eignît", "eignissions", "eignissiez", "eignissent"],
+        "Y": ["eins", "eignons", "eignez"],
+        "G": ["eignant"],
+        "K": ["eint", "einte", "eints", "eintes"],
+    },
+    "peser": {
+        "Template": "e?er",
+        "P": ["è?e", "è?es", "è?e", "e?ons", "e?ez", "è?ent"],
+        "I": ["e?ais", "e?ais", "e?ait", "e?ions", "e?iez", "e?aient"],
+        "J": ["e?ai", "e?as", "e?a", "e?âmes", "e?âtes", "e?èrent"],
+        "F": ["è?erai", "è?eras", "è?era", "è?erons", "è?erez", "è?eront"],
+        "C": ["è?erais", "è?erais", "è?erait", "è?erions", "è?eriez", "è?eraient"],
+        "S": ["è?e", "è?es", "è?e", "e?ions", "e?iez", "è?ent"],
+        "T": ["e?asse", "e?asses", "e?ât", "e?assions", "e?assiez", "e?assent"],
+        "Y": ["è?e", "e?ons", "e?ez"],
+        "G": ["e?ant"],
+        "K": ["e?é", "e?ée", "e?és", "e?ées"],
+    },
+    "placer": {
+        "Template": "cer",
+        "P": ["ce", "ces", "ce", "çons", "cez", "cent"],
+        "I": ["çais", "çais", "çait", "cions", "ciez", "çaient"],
+        "J": ["çai", "ças", "ça", "çâmes", "çâtes", "cèrent"],
+        "F": ["cerai", "ceras", "cera", "cerons", "cerez", "ceront"],
+        "C": ["cerais", "cerais", "cerait", "cerions", "ceriez", "ceraient"],
+        "S": ["ce", "ces", "ce", "cions", "ciez", "cent"],
+        "T": ["çasse", "çasses", "çât", "çassions", "çassiez", "çassent"],
+        "Y": ["ce", "çons", "cez"],
+        "G": ["çant"],
+        "K": ["cé", "cée", "cés", "cées"],
+    },
+    "plaire": {
+        "Template": "aire",
+        "P": ["ais", "ais", "aît", "aisons", "aisez", "aisent"],
+        "I": ["aisais", "aisais", "aisait", "aisions", "aisiez", "aisaient"],
+        "J": ["us", "us", "ut", "ûmes", "ûtes", "urent"],
+        "F": ["airai", "airas", "aira", "airons", "airez", "airont"],
+        "C": ["airais", "airais", "airait", "airions", "airiez", "airaient"],
+        "S": ["aise", "aises", "aise", "aisions", "aisiez", "aisent"],
+        "T": ["usse", "usses", "ût", "ussions", "ussiez", "ussent"],
+        "Y": ["ais", "aisons", "aisez"],
+        "G": ["aisant"],
+        "K": ["u", "ue", "us", "ues"],
+    },
+    "pleuvoir": {
+        "Template": "pleuvoir",
+        "P": [None, None, "pleut", None, None, "pleuvent"],
+        "I": [None, None, "pleuvait", None, None, "pleuvaient"],
+        "J": [None, None, "plut", None, None, "plurent"],
+        "F": [None, None, "pleuvra", None, None, "pleuvront"],
+        "C": [None, None, "pleuvrait", None, None, "pleuvraient"],
+        "S": [None, None, "pleuve", None, None, "pleuvent"],
+        "T": [None, None, "plût", None, None, "plussent"],
+        "Y": [None, None, None],
+        "G": ["pleuvant"],
+        "K": ["plu", None, None, None],
+    },
+    "pourvoir": {
+        "Template": "pourvoir",
+        "P": ["pourvois", "pourvois", "pourvoit", "pourvoyons", "pourvoyez", "pourvoient"],
+        "I": [
+            "pourvoyais",
+            "pourvoyais",
+            "pourvoyait",
+            "pourvoyions",
+            "pourvoyiez",
+            "pourvoyaient",
+        ],
+        "J": ["pourvus", "pourvus", "pourvut", "pourvûmes", "pourvûtes", "pourvurent"],
+        "F": ["pourvoirai", "pourvoiras", "pourvoira", "pourvoirons", "pourvoirez", "pourvoiront"],
+        "C": [
+            "pourvoirais",
+            "pourvoirais",
+            "pourvoirait",
+            "pourvoirions",
+            "pourvoiriez",
+            "pourvoiraient",
+        ],
+        "S": ["pourvoie", "pourvoies", "pourvoie", "pourvoyions", "pourvoyiez", "pourvoient"],
+        "T": ["pourvusse", "pourvusses", "pourvût", "pourvussions", "pourvussiez", "pourvussent"],
+        "Y": ["pourvois", "pourvoyons", "pourvoyez"],
+        "G": ["pourvoyant"],
+        "K": ["pourvu", "pourvue", "pourvus", "pourvues"],
+    },
+    "pouvoir": {
+        "Template": "pouvoir",
+        "P": ["puis", "peux", "peut", "pouvons", "pouvez", "peuvent"],
+        "I": ["pouvais", "pouvais", "pouvait", "pouvions", "pouviez", "pouvaient"],
+        "J": ["pus", "pus", "put", "pûmes", "pûtes", "purent"],
+        "F": ["pourrai", "pourras", "pourra", "pourrons", "pourrez", "pourront"],
+        "C": ["pourrais", "pourrais", "pourrait", "pourrions", "pourriez", "pourraient"],
+        "S": ["puisse", "puisses", "puisse", "puissions", "puissiez", "puissent"],
+        "T": ["pusse", "pusses", "pût", "pussions", "pussiez", "pussent"],
+        "Y": [None, None, None],
+        "G": ["pouvant"],
+        "K": ["pu", None, None, None],
+    },
+    "prendre": {
+        "Template": "prendre",
+        "P": ["prends", "prends", "prend", "prenons", "prenez", "prennent"],
+        "I": ["prenais", "prenais", "prenait", "prenions", "preniez", "prenaient"],
+        "J": ["pris", "pris", "prit", "prîmes", "prîtes", "prirent"],
+        "F": ["prendrai", "prendras", "prendra", "prendrons", "prendrez", "prendront"],
+        "C": ["prendrais", "prendrais", "prendrait", "prendrions", "prendriez", "prendraient"],
+        "S": ["prenne", "prennes", "prenne", "prenions", "preniez", "prennent"],
+        "T": ["prisse", "prisses", "prît", "prissions", "prissiez", "prissent"],
+        "Y": ["prends", "prenons", "prenez"],
+        "G": ["prenant"],
+        "K": ["pris", "prise", "pris", "prises"],
+    },
+    "rassir": {
+        "Template": "rassir",
+        "P": ["rassis", "rassis", "rassit", "rassissons", "rassissez", "rassissent"],
+        "I": [
+            "rassissais",
+            "rassissais",
+            "rassissait",
+            "rassissions",
+            "rassissiez",
+            "rassissaient",
+        ],
+        "J": ["rassis", "rassis", "rassit", "rassîmes", "rassîtes", "rassirent"],
+        "F": ["rassirai", "rassiras", "rassira", "rassirons", "rassirez", "rassiront"],
+        "C": ["rassirais", "rassirais", "rassirait", "rassirions", "rassiriez", "rassiraient"],
+        "S": ["rassisse", "rassisses", "rassisse", "rassissions", "rassissiez", "rassissent"],
+        "T": ["rassisse", "rassisses", "rassît", "rassissions", "rassissiez", "rassissent"],
+        "Y": ["rassis", "rassissons", "rassissez"],
+        "G": ["rassissant"],
+        "K": ["rassi", "rassie", "rassis", "rassies"],
+    },
+    "ravoir": {
+        "Template": "ravoir",
+        "P": [None, None, None, None, None, None],
+        "I": [None, None, None, None, None, None],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": [None, None, None, None],
+    },
+    "recevoir": {
+        "Template": "cevoir",
+        "P": ["çois", "çois", "çoit", "cevons", "cevez", "çoivent"],
+        "I": ["cevais", "cevais", "cevait", "cevions", "ceviez", "cevaient"],
+        "J": ["çus", "çus", "çut", "çûmes", "çûtes", "çurent"],
+        "F": ["cevrai", "cevras", "cevra", "cevrons", "cevrez", "cevront"],
+        "C": ["cevrais", "cevrais", "cevrait", "cevrions", "cevriez", "cevraient"],
+        "S": ["çoive", "çoives", "çoive", "cevions", "ceviez", "çoivent"],
+        "T": ["çusse", "çusses", "çût", "çussions", "çussiez", "çussent"],
+        "Y": ["çois", "cevons", "cevez"],
+        "G": ["cevant"],
+        "K": ["çu", "çue", "çus", "çues"],
+    },
+    "reclure": {
+        "Template": "reclure",
+        "P": [None, None, None, None, None, None],
+        "I": [None, None, None, None, None, None],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": ["reclus", "recluse", "reclus", "recluses"],
+    },
+    "rendre": {
+        "Template": "re",
+        "P": ["s", "s", "", "ons", "ez", "ent"],
+        "I": ["ais", "ais", "ait", "ions", "iez", "aient"],
+        "J": ["is", "is", "it", "îmes", "îtes", "irent"],
+        "F": ["rai", "ras", "ra", "rons", "rez", "ront"],
+        "C": ["rais", "rais", "rait", "rions", "riez", "raient"],
+        "S": ["e", "es", "e", "ions", "iez", "ent"],
+        "T": ["isse", "isses", "ît", "issions", "issiez", "issent"],
+        "Y": ["s", "ons", "ez"],
+        "G": ["ant"],
+        "K": ["u", "ue", "us", "ues"],
+    },
+    "repaître": {
+        "Template": "repaître",
+        "P": ["repais", "repais", "repaît", "repaissons", "repaissez", "repaissent"],
+        "I": [
+            "repaissais",
+            "repaissais",
+            "repaissait",
+            "repaissions",
+            "repaissiez",
+            "repaissaient",
+        ],
+        "J": ["repus", "repus", "reput", "repûmes", "repûtes", "repurent"],
+        "F": ["repaîtrai", "repaîtras", "repaîtra", "repaîtrons", "repaîtrez", "repaîtront"],
+        "C": [
+            "repaîtrais",
+            "repaîtrais",
+            "repaîtrait",
+            "repaîtrions",
+            "repaîtriez",
+            "repaîtraient",
+        ],
+        "S": ["repaisse", "repaisses", "repaisse", "repaissions", "repaissiez", "repaissent"],
+        "T": ["repusse", "repusses", "repût", "repussions", "repussiez", "repussent"],
+        "Y": ["repais", "repaissons", "repaissez"],
+        "G": ["repaissant"],
+        "K": ["repu", "repue", "repus", "repues"],
+    },
+    "rire": {
+        "Template": "rire",
+        "P": ["ris", "ris", "rit", "rions", "riez", "rient"],
+        "I": ["riais", "riais", "riait", "riions", "riiez", "riaient"],
+        "J": ["ris", "ris", "rit", "rîmes", "rîtes", "rirent"],
+        "F": ["rirai", "riras", "rira", "rirons", "rirez", "riront"],
+        "C": ["rirais", "rirais", "rirait", "ririons", "ririez", "riraient"],
+        "S": ["rie", "ries", "rie", "riions", "riiez", "rient"],
+        "T": ["risse", "risses", "rît", "rissions", "rissiez", "rissent"],
+        "Y": ["ris", "rions", "riez"],
+        "G": ["riant"],
+        "K": ["ri", None, None, None],
+    },
+    "savoir": {
+        "Template": "savoir",
+        "P": ["sais", "sais", "sait", "savons", "savez", "savent"],
+        "I": ["savais", "savais", "savait", "savions", "saviez", "savaient"],
+        "J": ["sus", "sus", "sut", "sûmes", "sûtes", "surent"],
+        "F": ["saurai", "sauras", "saura", "saurons", "saurez", "sauront"],
+        "C": ["saurais", "saurais", "saurait", "saurions", "sauriez", "sauraient"],
+        "S": ["sache", "saches", "sache", "sachions", "sachiez", "sachent"],
+        "T": ["susse", "susses", "sût", "sussions", "sussiez", "sussent"],
+        "Y": ["sache", "sachons", "sachez"],
+        "G": ["sachant"],
+        "K": ["su", "sue", "sus", "sues"],
+    },
+    "sentir": {
+        "Template": "tir",
+        "P": ["s", "s", "t", "tons", "tez", "tent"],
+        "I": ["tais", "tais", "tait", "tions", "tiez", "taient"],
+        "J": ["tis", "tis", "tit", "tîmes", "tîtes", "tirent"],
+        "F": ["tirai", "tiras", "tira", "tirons", "tirez", "tiront"],
+        "C": ["tirais", "tirais", "tirait", "tirions", "tiriez", "tiraient"],
+        "S": ["te", "tes", "te", "tions", "tiez", "tent"],
+        "T": ["tisse", "tisses", "tît", "tissions", "tissiez", "tissent"],
+        "Y": ["s", "tons", "tez"],
+        "G": ["tant"],
+        "K": ["ti", "tie", "tis", "ties"],
+    },
+    "seoir": {
+        "Template": "seoir",
+        "P": [None, None, "sied", None, None, "siéent"],
+        "I": [None, None, "seyait", None, None, "seyaient"],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, "siéra", None, None, "siéront"],
+        "C": [None, None, "siérait", None, None, "siéraient"],
+        "S": [None, None, "siée", None, None, "siéent"],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": ["seyant"],
+        "K": [None, None, None, None],
+    },
+    "servir": {
+        "Template": "servir",
+        "P": ["sers", "sers", "sert", "servons", "servez", "servent"],
+        "I": ["servais", "servais", "servait", "servions", "serviez", "servaient"],
+        "J": ["servis", "servis", "servit", "servîmes", "servîtes", "servirent"],
+        "F": ["servirai", "serviras", "servira", "servirons", "servirez", "serviront"],
+        "C": ["servirais", "servirais", "servirait", "servirions", "serviriez", "serviraient"],
+        "S": ["serve", "serves", "serve", "servions", "serviez", "servent"],
+        "T": ["servisse", "servisses", "servît", "servissions", "servissiez", "servissent"],
+        "Y": ["sers", "servons", "servez"],
+        "G": ["servant"],
+        "K": ["servi", "servie", "servis", "servies"],
+    },
+    "sourdre": {
+        "Template": "sourdre",
+        "P": [None, None, "sourd", None, None, "sourdent"],
+        "I": [None, None, "sourdait", None, None, "sourdaient"],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": [None, None, None, None],
+    },
+    "stupéfaire": {
+        "Template": "stupéfaire",
+        "P": [None, None, "stupéfait", None, None, None],
+        "I": [None, None, "stupéfaisait", None, None, None],
+        "J": [None, None, "stupéfit", None, None, None],
+        "F": [None, None, "stupéfera", None, None, None],
+        "C": [None, None, "stupéferait", None, None, None],
+        "S": [None, None, "stupéfasse", None, None, None],
+        "T": [None, None, "stupéfît", None, None, None],
+        "Y": [None, None, None],
+        "G": ["stupéfaisant"],
+        "K": ["stupéfait", None, None, None],
+    },
+    "suivre": {
+        "Template": "suivre",
+        "P": ["suis", "suis", "suit", "suivons", "suivez", "suivent"],
+        "I": ["suivais", "suivais", "suivait", "suivions", "suiviez", "suivaient"],
+        "J": ["suivis", "suivis", "suivit", "suivîmes", "suivîtes", "suivirent"],
+        "F": ["suivrai", "suivras", "suivra", "suivrons", "suivrez", "suivront"],
+        "C": ["suivrais", "suivrais", "suivrait", "suivrions", "suivriez", "suivraient"],
+        "S": ["suive", "suives", "suive", "suivions", "suiviez", "suivent"],
+        "T": ["suivisse", "suivisses", "suivît", "suivissions", "suivissiez", "suivissent"],
+        "Y": ["suis", "suivons", "suivez"],
+        "G": ["suivant"],
+        "K": ["suivi", "suivie", "suivis", "suivies"],
+    },
+    "surseoir": {
+        "Template": "surseoir",
+        "P": ["sursois", "sursois", "sursoit", "sursoyons", "sursoyez", "sursoient"],
+        "I": ["sursoyais", "sursoyais", "sursoyait", "sursoyions", "sursoyiez", "sursoyaient"],
+        "J": ["sursis", "sursis", "sursit", "sursîmes", "sursîtes", "sursirent"],
+        "F": ["surseoirai", "surseoiras", "surseoira", "surseoirons", "surseoirez", "surseoiront"],
+        "C": [
+            "surseoirais",
+            "surseoirais",
+            "surseoirait",
+            "surseoirions",
+            "surseoiriez",
+            "surseoiraient",
+        ],
+        "S": ["sursoie", "sursoies", "sursoie", "sursoyions", "sursoyiez", "sursoient"],
+        "T": ["sursisse", "sursisses", "sursît", "sursissions", "sursissiez", "sursissent"],
+        "Y": ["sursois", "sursoyons", "sursoyez"],
+        "G": ["sursoyant"],
+        "K": ["sursis", None, None, None],
+    },
+    "tenir": {
+        "Template": "enir",
+        "P": ["iens", "iens", "ient", "enons", "enez", "iennent"],
+        "I": ["enais", "enais", "enait", "enions", "eniez", "enaient"],
+        "J": ["ins", "ins", "int", "înmes", "întes", "inrent"],
+        "F": ["iendrai", "iendras", "iendra", "iendrons", "iendrez", "iendront"],
+        "C": ["iendrais", "iendrais", "iendrait", "iendrions", "iendriez", "iendraient"],
+        "S": ["ienne", "iennes", "ienne", "enions", "eniez", "iennent"],
+        "T": ["insse", "insses", "înt", "inssions", "inssiez", "inssent"],
+        "Y": ["iens", "enons", "enez"],
+        "G": ["enant"],
+        "K": ["enu", "enue", "enus", "enues"],
+    },
+    "tistre": {
+        "Template": "tistre",
+        "P": [None, None, None, None, None, None],
+        "I": [None, None, None, None, None, None],
+        "J": [None, None, None, None, None, None],
+        "F": [None, None, None, None, None, None],
+        "C": [None, None, None, None, None, None],
+        "S": [None, None, None, None, None, None],
+        "T": [None, None, None, None, None, None],
+        "Y": [None, None, None],
+        "G": [None],
+        "K": [None, None, None, None],
+    },
+    "traire": {
+        "Template": "raire",
+        "P": ["rais", "rais", "rait", "rayons", "rayez", "raient"],
+        "I": ["rayais", "rayais", "rayait", "rayions", "rayiez", "rayaient"],
+        "J": [None, None, None, None, None, None],
+        "F": ["rairai", "rairas", "raira", "rairons", "rairez", "rairont"],
+        "C": ["rairais", "rairais", "rairait", "rairions", "rairiez", "rairaient"],
+        "S": ["raie", "raies", "raie", "rayions", "rayiez", "raient"],
+        "T": [None, None, None, None, None, None],
+        "Y": ["rais", "rayons", "rayez"],
+        "G": ["rayant"],
+        "K": ["rait", "raite", "raits", "raites"],
+    },
+    "vaincre": {
+        "Template": "vaincre",
+        "P": ["vaincs", "vaincs", "vainc", "vainquons", "vainquez", "vainquent"],
+        "I": ["vainquais", "vainquais", "vainquait", "vainquions", "vainquiez", "vainquaient"],
+        "J": ["vainquis", "vainquis", "vainquit", "vainquîmes", "vainquîtes", "vainquirent"],
+        "F": ["vaincrai", "vaincras", "vaincra", "vaincrons", "vaincrez", "vaincront"],
+        "C": ["vaincrais", "vaincrais", "vaincrait", "vaincrions", "vaincriez", "vaincraient"],
+        "S": ["vainque", "vainques", "vainque", "vainquions", "vainquiez", "vainquent"],
+        "T": [
+            "vainquisse",
+            "vainquisses",
+            "vainquît",
+            "vainquissions",
+            "vainquissiez",
+            "vainquissent",
+        ],
+        "Y": ["vaincs", "vainquons", "vainquez"],
+        "G": ["vainquant"],
+        "K": ["vaincu", "vaincue", "vaincus", "vaincues"],
+    },
+    "valoir": {
+        "Template": "valoir",
+        "P": ["vaux", "vaux", "vaut", "valons", "valez", "valent"],
+        "I": ["valais", "valais", "valait", "valions", "valiez", "valaient"],
+        "J": ["valus", "valus", "valut", "valûmes", "valûtes", "valurent"],
+        "F": ["vaudrai", "vaudras", "vaudra", "vaudrons", "vaudrez", "vaudront"],
+        "C": ["vaudrais", "vaudrais", "vaudrait", "vaudrions", "vaudriez", "vaudraient"],
+        "S": ["vaille", "vailles", "vaille", "valions", "valiez", "vaillent"],
+        "T": ["valusse", "valusses", "valût", "valussions", "valussiez", "valussent"],
+        "Y": ["vaux", "valons", "valez"],
+        "G": ["valant"],
+        "K": ["valu", "value", "valus", "values"],
+    },
+    "vivre": {
+        "Template": "vivre",
+        "P": ["vis", "vis", "vit", "vivons", "vivez", "vivent"],
+        "I": ["vivais", "vivais", "vivait", "vivions", "viviez", "vivaient"],
+        "J": ["vécus", "vécus", "vécut", "vécûmes", "vécûtes", "vécurent"],
+        "F": ["vivrai", "vivras", "vivra", "vivrons", "vivrez", "vivront"],
+        "C": ["vivrais", "vivrais", "vivrait", "vivrions", "vivriez", "vivraient"],
+        "S": ["vive", "vives", "vive", "vivions", "viviez", "vivent"],
+        "T": ["vécusse", "vécusses", "vécût", "vécussions", "vécussiez", "vécussent"],
+        "Y": ["vis", "vivons", "vivez"],
+        "G": ["vivant"],
+        "K": ["vécu", "vécue", "vécus", "vécues"],
+    },
+    "voir": {
+        "Template": "voir",
+        "P": ["vois", "vois", "voit", "voyons", "voyez", "voient"],
+        "I": ["voyais", "voyais", "voyait", "voyions", "voyiez", "voyaient"],
+        "J": ["vis", "vis", "vit", "vîmes", "vîtes", "virent"],
+        "F": ["verrai", "verras", "verra", "verrons", "verrez", "verront"],
+        "C": ["verrais", "verrais", "verrait", "verrions", "verriez", "verraient"],
+        "S": ["voie", "voies", "voie", "voyions", "voyiez", "voient"],
+        "T": ["visse", "visses", "vît", "vissions", "vissiez", "vissent"],
+        "Y": ["vois", "voyons", "voyez"],
+        "G": ["voyant"],
+        "K": ["vu", "vue", "vus", "vues"],
+    },
+    "vouloir": {
+        "Template": "vouloir",
+        "P": ["veux", "veux", "veut", "voulons", "voulez", "veulent"],
+        "I": ["voulais", "voulais", "voulait", "voulions", "vouliez", "voulaient"],
+        "J": ["voulus", "voulus", "voulut", "voulûmes", "voulûtes", "voulurent"],
+        "F": ["voudrai", "voudras", "voudra", "voudrons", "voudrez", "voudront"],
+        "C": ["voudrais", "voudrais", "voudrait", "voudrions", "voudriez", "voudraient"],
+        "S": ["veuille", "veuilles", "veuille", "voulions", "vouliez", "veuillent"],
+        "T": ["voulusse", "voulusses", "voulût", "voulussions", "voulussiez", "voulussent"],
+        "Y": ["veux", "voulons", "voulez"],
+        "G": ["voulant"],
+        "K": ["voulu", "voulue", "voulus", "voulues"],
+    },
+    "vêtir": {
+        "Template": "vêtir",
+        "P": ["vêts", "vêts", "vêt", "vêtons", "vêtez", "vêtent"],
+        "I": ["vêtais", "vêtais", "vêtait", "vêtions", "vêtiez", "vêtaient"],
+        "J": ["vêtis", "vêtis", "vêtit", "vêtîmes", "vêtîtes", "vêtirent"],
+        "F": ["vêtirai", "vêtiras", "vêtira", "vêtirons", "vêtirez", "vêtiront"],
+        "C": ["vêtirais", "vêtirais", "vêtirait", "vêtirions", "vêtiriez", "vêtiraient"],
+        "S": ["vête", "vêtes", "vête", "vêtions", "vêtiez", "vêtent"],
+        "T": ["vêtisse", "vêtisses", "vêtît", "vêtissions", "vêtissiez", "vêtissent"],
+        "Y": ["vêts", "vêtons", "vêtez"],
+        "G": ["vêtant"],
+        "K": ["vêtu", "vêtue", "vêtus", "vêtues"],
+    },
+    "échoir": {
+        "Template": "échoir",
+        "P": [None, None, "échoit", None, None, "échoient"],
+        "I": [None, None, "échoyait", None, None, "échoyaient"],
+        "J": [None, None, "échut", None, None, "échurent"],
+        "F": [None, None, "échoira", None, None, "échoiront"],
+        "C": [None, None, "échoirait", None, None, "échoiraient"],
+        "S": [None, None, "échoie", None, None, "échoient"],
+        "T": [None, None, "échût", None, None, "échussent"],
+        "Y": [None, None, None],
+        "G": ["échéant"],
+        "K": ["échu", "échue", "échus", "échues"],
+    },
+    "écrire": {
+        "Template": "crire",
+        "P": ["cris", "cris", "crit", "crivons", "crivez", "crivent"],
+        "I": ["crivais", "crivais", "crivait", "crivions", "criviez", "crivaient"],
+        "J": ["crivis", "crivis", "crivit", "crivîmes", "crivîtes", "crivirent"],
+        "F": ["crirai", "criras", "crira", "crirons", "crirez", "criront"],
+        "C": ["crirais", "crirais", "crirait", "cririons", "cririez", "criraient"],
+        "S": ["crive", "crives", "crive", "crivions", "criviez", "crivent"],
+        "T": ["crivisse", "crivisses", "crivît", "crivissions", "crivissiez", "crivissent"],
+        "Y": ["cris", "crivons", "crivez"],
+        "G": ["crivant"],
+        "K": ["crit", "crite", "crits", "crites"],
+    },
+    "être": {
+        "Template": "être",
+        "P": ["suis", "es", "est", "sommes", "êtes", "sont"],
+        "I": ["étais", "étais", "était", "étions", "étiez", "étaient"],
+        "J": ["fus", "fus", "fut", "fûmes", "fûtes", "furent"],
+        "F": ["serai", "seras", "sera", "serons", "serez", "seront"],
+        "C": ["serais", "serais", "serait", "serions", "seriez", "seraient"],
+        "S": ["sois", "sois", "soit", "soyons", "soyez", "soient"],
+        "T": ["fusse", "fusses", "fût", "fussions", "fussiez", "fussent"],
+        "Y": ["sois", "soyons", "soyez"],
+        "G": ["étant"],
+        "K": ["été", None, None, None],
+    },
+}
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+""" conjuguer - conjugaison des verbes francais
+WSGI application returning verbs conjugations in JSON, for pre-forking servers:
+    gunicorn --preload --workers 4 conjuguer.wsgi:application
+License: 3-clause BSD (see https://opensource.org/licenses/BSD-3-Clause)
+Author: Hubert Tournier
+"""
+
+import gc
+import json
+import urllib.parse
+
+from .main import (
+    conjugate_verb,
+    get_auxiliary,
+    get_dictionary_layers,
+    index_dictionary_layers,
+    initialize_internationalization,
+    parameters,
+    process_environment_variables,
+    resolve_verb,
+    suggest_verbs,
+)
+
+
+################################################################################
+def load_dictionaries():
+    """Return the stack of dictionaries, all loaded and indexed, and their lemmas indexes"""
+    initialize_internationalization("conjuguer")
+    process_environment_variables()
+    if parameters["Dictionary type"] not in ("ABU", "DELA"):
+        # Exiting would go unnoticed in the servers importing the application:
+        raise RuntimeError(_("Unknown inflected dictionary format"))
+
+    dictionary_layers = get_dictionary_layers()
+    dictionary_normalized_index, dictionary_lemmas_trie = index_dictionary_layers(dictionary_layers)
+
+    return dictionary_layers, dictionary_normalized_index, dictionary_lemmas_trie
+
+
+# The dictionaries are loaded once, in the master process of pre-forking servers,
+# and their memory pages are shared with the workers until written to:
+layers, normalized_index, lemmas_trie = load_dictionaries()
+if hasattr(gc, "freeze"):
+    # Objects moved to the permanent generation are never scanned by the garbage collector,
+    # which would otherwise write to their headers and copy their pages in each worker:
+    gc.collect()
+    gc.freeze()
+
+
+################################################################################
+def get_verb_argument(environ):
+    """Return the verb asked for in the path or in the query string of a request"""
+    verb = urllib.parse.unquote(environ.get("PATH_INFO", "").strip("/"))
+    if not verb:
+        query = urllib.parse.parse_qs(environ.get("QUERY_STRING", ""))
+        verb = query.get("verb", [""])[0]
+
+    # WSGI servers decode the path as ISO-8859-1:
+    try:
+        verb = verb.encode("latin-1").decode("utf-8")
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        pass
+
+    return verb.strip()
+
+
+################################################################################
+def get_verb_document(verb):
+    """Return an HTTP status and a document with a verb conjugations or suggestions"""
+    conjugated_verbs, layer = conjugate_verb(verb, layers)
+    if not conjugated_verbs:
+        candidates = resolve_verb(verb, normalized_index)
+        if len(candidates) == 1:
+            verb = candidates[0]
+            conjugated_verbs, layer = conjugate_verb(verb, layers)
+        elif len(candidates) > 1:
+            return "300 Multiple Choices", {"verb": verb, "candidates": candidates}
+
+    if not conjugated_verbs:
+        return "404 Not Found", {"verb": verb, "suggestions": suggest_verbs(verb, lemmas_trie)}
+
+    auxiliaries = [get_auxiliary(verb), "avoir"]
+    return "200 OK", {
+        "verb": verb,
+        "dictionary": layer["Path"],
+        "conjugations": [
+            {"auxiliary": auxiliary, "tenses": conjugated_verb}
+            for auxiliary, conjugated_verb in zip(auxiliaries, conjugated_verbs)
+        ],
+    }
+
+
+################################################################################
+def application(environ, start_response):
+    """The WSGI application's entry point"""
+    verb = get_verb_argument(environ)
+    if verb:
+        status, document = get_verb_document(verb)
+    else:
+        status, document = "400 Bad Request", {"error": _("No verb given")}
+
+    body = json.dumps(document, ensure_ascii=False).encode("utf-8")
+    start_response(status, [
+        ("Content-Type", "application/json; charset=utf-8"),
+        ("Content-Length", str(len(body))),
+    ])
+
+    return [body]
@@ -0,0 +1,895 @@
+#!/usr/bin/env python
+""" conjuguer - conjugaison des verbes francais
+Unit tests, on small extracts of the DELA and ABU dictionaries
+License: 3-clause BSD (see https://opensource.org/licenses/BSD-3-Clause)
+Author: Hubert Tournier
+"""
+
+import bz2
+import copy
+import csv
+import gettext
+import gzip
+import importlib
+import io
+import json
+import logging
+import lzma
+import os
+import pickle
+import re
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+gettext.install("conjuguer")
+# The package exports the main() function under the name of its module:
+conjuguer = importlib.import_module("conjuguer.main")
+
+DATA_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+DELA_PATH = os.path.join(DATA_DIRECTORY, "dict-fr-AU-DELA")
+ABU_PATH = os.path.join(DATA_DIRECTORY, "dict-fr-ABU-mots_communs")
+LEMMAS = ["aller", "avoir", "finir", "monter", "naître", "être"]
+INITIAL_PARAMETERS = copy.deepcopy(conjuguer.parameters)
+
+
+################################################################################
+@pytest.fixture(autouse=True)
+def environment(tmp_path, monkeypatch):
+    """Start each test with the default parameters, the DELA extract,
+    and the default cache directory in a temporary directory"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("DICTPATH", DATA_DIRECTORY)
+    monkeypatch.delenv("CONJUGUER_DICT", raising=False)
+    monkeypatch.delenv("CONJUGUER_CACHE", raising=False)
+    conjuguer.parameters.clear()
+    conjuguer.parameters.update(copy.deepcopy(INITIAL_PARAMETERS))
+    select_dictionary(DELA_PATH, "DELA")
+
+
+################################################################################
+def select_dictionary(pathname, dictionary_type):
+    """Make a dictionary the default one"""
+    conjuguer.parameters["Dictionary path"] = pathname
+    conjuguer.parameters["Dictionary type"] = dictionary_type
+    conjuguer.parameters["Dictionaries"] = [pathname]
+
+
+################################################################################
+def run_main(monkeypatch, capsys, *arguments):
+    """Run the command line program as a new process would, and return its exit status and output"""
+    conjuguer.parameters.clear()
+    conjuguer.parameters.update(copy.deepcopy(INITIAL_PARAMETERS))
+    monkeypatch.setattr(sys, "argv", ["conjuguer"] + list(arguments))
+    with pytest.raises(SystemExit) as exit_info:
+        conjuguer.main()
+    # The debug messages disabled by the program are needed by the other tests:
+    logging.disable(logging.NOTSET)
+
+    return exit_info.value.code, capsys.readouterr().out
+
+
+################################################################################
+def assert_same_verbs(verbs, expected_verbs):
+    """Check two dictionary verbs stores have the same lines and lemmas"""
+    verbs = conjuguer.get_verbs_index(verbs)
+    expected_verbs = conjuguer.get_verbs_index(expected_verbs)
+    assert list(verbs) == list(expected_verbs)
+    assert verbs.lemmas == expected_verbs.lemmas
+    for lemma in expected_verbs.lemmas:
+        assert verbs.get_lemma_lines(lemma) == expected_verbs.get_lemma_lines(lemma)
+
+
+################################################################################
+def test_compound_tenses_split():
+    """The conjugations with both auxiliaries share the simple tenses parsed once"""
+    verbs = conjuguer.load_all_verbs_from_dictionary()
+    conjugations = conjuguer.select_verb_from_verbs("monter", verbs)
+    simple_verb = conjuguer.fill_verb_from_dictionary_data("monter", conjugations)
+    unchanged_simple_verb = copy.deepcopy(simple_verb)
+
+    etre_verb = conjuguer.add_compound_tenses(simple_verb, "être")
+    avoir_verb = conjuguer.add_compound_tenses(simple_verb, "avoir")
+    assert simple_verb == unchanged_simple_verb
+    assert etre_verb["Indicatif"]["Présent"] is simple_verb["Indicatif"]["Présent"]
+    assert avoir_verb["Indicatif"]["Présent"] is simple_verb["Indicatif"]["Présent"]
+    assert etre_verb["Indicatif"]["Passé composé"]["s"]["1"] == "suis monté"
+    assert etre_verb["Indicatif"]["Passé composé"]["p"]["1"] == "sommes montés"
+    assert avoir_verb["Indicatif"]["Passé composé"]["p"]["1"] == "avons monté"
+    assert etre_verb["Infinitif"]["Passé"] == "être monté"
+    assert avoir_verb["Infinitif"]["Passé"] == "avoir monté"
+
+    # Parsing the lines again for each auxiliary gives the same conjugations:
+    assert conjuguer.get_conjugated_verbs("monter", conjugations) == [etre_verb, avoir_verb]
+    assert conjuguer.conjuguer("monter", conjugations, "avoir") == avoir_verb
+
+
+################################################################################
+def test_verbs_generation(monkeypatch, capsys):
+    """Verbs are conjugated from their model as in the dictionary,
+    and those missing from the dictionaries only on request, if no other verb is near"""
+    verbs = conjuguer.load_all_verbs_from_dictionary()
+    for lemma in LEMMAS:
+        if lemma not in ("avoir", "être"):
+            conjugations = conjuguer.select_verb_from_verbs(lemma, verbs)
+            assert conjuguer.generate_verb_from_model(lemma) \
+                == conjuguer.fill_verb_from_dictionary_data(lemma, conjugations)
+
+    status, output = run_main(monkeypatch, capsys, "-n", "zorglubifier")
+    assert status == 1
+    assert "conjugated like" in output
+    assert "Conjugation tables" not in output
+
+    status, output = run_main(monkeypatch, capsys, "-n", "--guess", "zorglubifier")
+    assert status == 1
+    assert "Conjugation tables for zorglubifier" in output
+    assert "zorglubifie" in output
+
+    # Neither for probable typos, nor as dictionary lines:
+    status, output = run_main(monkeypatch, capsys, "-n", "--guess", "aler")
+    assert "Did you mean aller ?" in output
+    assert "Conjugation tables" not in output
+    status, output = run_main(monkeypatch, capsys, "-D", "--guess", "zorglubifier")
+    assert "zorglubifie," not in output
+
+    status, output = run_main(monkeypatch, capsys, "-n", "-g", "zorglubifier", "finir")
+    assert status == 0
+    assert "Conjugation tables for zorglubifier" in output
+    assert "Conjugation tables for finir" in output
+
+
+################################################################################
+def test_lexicon_round_trip(tmp_path):
+    """A lexicon regenerates the dictionary lines it was built from"""
+    verbs = conjuguer.load_all_verbs_from_dictionary()
+    lexicon = conjuguer.build_lexicon(verbs)
+    pathname = str(tmp_path / "lexicon")
+    conjuguer.save_lexicon(lexicon, pathname)
+    assert conjuguer.is_lexicon(pathname)
+    assert conjuguer.load_lexicon(pathname) == lexicon
+    assert conjuguer.check_lexicon(conjuguer.load_lexicon(pathname), verbs) == []
+
+    lexicon_verbs = conjuguer.load_all_verbs_from_dictionary(pathname)
+    assert lexicon_verbs.lemmas == sorted(LEMMAS)
+    for lemma in LEMMAS:
+        assert conjuguer.fill_verb_from_dictionary_data(
+            lemma, conjuguer.select_verb_from_verbs(lemma, lexicon_verbs)
+        ) == conjuguer.fill_verb_from_dictionary_data(
+            lemma, conjuguer.select_verb_from_verbs(lemma, verbs)
+        )
+
+    # A lexicon is not compressed again:
+    select_dictionary(pathname, "DELA")
+    assert not conjuguer.make_lexicon(str(tmp_path / "other-lexicon"), lexicon_verbs)
+
+
+################################################################################
+def test_dictionaries_stack(tmp_path):
+    """Verbs missing from the first dictionary are searched in the next ones, loaded when needed"""
+    pathname = str(tmp_path / "dict-fr-AU-DELA")
+    with open(DELA_PATH, encoding="utf-8") as file:
+        lines = [line for line in file if not line.startswith("all") and ",aller." not in line]
+    with open(pathname, "w", encoding="utf-8") as file:
+        file.writelines(lines)
+    select_dictionary(pathname, "DELA")
+    conjuguer.parameters["Dictionaries"] = [pathname, ABU_PATH]
+
+    layers = conjuguer.get_dictionary_layers()
+    assert layers[1]["Verbs"] is None
+    assert conjuguer.select_verb_from_layers("finir", layers)[1] is layers[0]
+    assert layers[1]["Verbs"] is None
+    conjugated_verbs, layer = conjuguer.conjugate_verb("aller", layers)
+    assert layer is layers[1]
+    assert layer["Type"] == "ABU"
+    assert conjugated_verbs[0]["Indicatif"]["Passé composé"]["s"]["1"] == "suis allé"
+    assert conjuguer.conjugate_verb("xyzzer", layers) == ([], None)
+
+    # The whole stack is loaded at once when merging:
+    conjuguer.parameters["Merge dictionaries"] = True
+    layers = conjuguer.get_dictionary_layers()
+    assert [layer["Type"] for layer in layers] == ["DELA", "ABU"]
+    assert conjuguer.get_layers_lemmas(layers) == set(LEMMAS)
+
+    # The verbs matching no pattern have no model:
+    assert conjuguer.analyze_verb("finir") == ("ir", "2nd group", "finir")
+    assert conjuguer.analyze_verb("zzz") == ("", "unknown group", "")
+
+
+################################################################################
+def test_dictionaries_comparison(tmp_path, capsys):
+    """The DELA and ABU dictionaries differences are reported cell by cell, and lemma by lemma"""
+    pathname = str(tmp_path / "dict-fr-AU-DELA")
+    with open(DELA_PATH, encoding="utf-8") as file:
+        lines = [line for line in file if "naître" not in line and not line.startswith("finira,")]
+    with open(pathname, "w", encoding="utf-8") as file:
+        file.writelines(lines)
+    select_dictionary(pathname, "DELA")
+    conjuguer.parameters["Dictionaries"] = [pathname, ABU_PATH]
+
+    # Both types of dictionaries are needed:
+    report = str(tmp_path / "comparison.tsv")
+    assert not conjuguer.compare_dictionaries(report, conjuguer.get_dictionary_layers()[:1])
+
+    assert conjuguer.compare_dictionaries(report, conjuguer.get_dictionary_layers())
+    with open(report, encoding="utf-8") as file:
+        header = file.readline()
+        rows = [line.rstrip("\n").split("\t") for line in file]
+    assert header == conjuguer.COMPARISON_HEADER + "\t" + pathname + "\t" + ABU_PATH + "\n"
+    assert ["DIFFERENT", "avoir", "P3s", "a", "a,a-t-il"] in rows
+    assert ["MISSING_IN_DELA", "finir", "F3s", "", "finira"] in rows
+    assert ["ONLY_IN_ABU", "naître", "", "", ""] in rows
+    assert all(row[1] != "aller" for row in rows)
+    assert "Lemmas only in ABU: 1" in capsys.readouterr().out
+
+
+################################################################################
+def test_dictionary_audit(tmp_path, capsys):
+    """The dictionary verbs forms are checked against those of their model"""
+    pathname = str(tmp_path / "dict-fr-AU-DELA")
+    with open(DELA_PATH, encoding="utf-8") as file:
+        lines = [
+            line.replace("finira,", "finiera,") for line in file if not line.startswith("finîmes,")
+        ]
+    with open(pathname, "w", encoding="utf-8") as file:
+        file.writelines(lines)
+    select_dictionary(pathname, "DELA")
+
+    report = str(tmp_path / "audit.tsv")
+    assert conjuguer.audit_dictionary(report, conjuguer.load_all_verbs_from_dictionary())
+    with open(report, encoding="utf-8") as file:
+        header = file.readline()
+        rows = [line.rstrip("\n").split("\t") for line in file]
+    assert header == conjuguer.AUDIT_HEADER + "\t" + pathname + "\n"
+    assert ["DIFFERENT", "finir", "finir", "F3s", "finira", "finiera"] in rows
+    assert ["MISSING", "finir", "finir", "J1p", "finîmes", ""] in rows
+    assert ["MODEL", "finir", "1", "0", "0.0"] in rows
+    assert ["MODEL", "naître", "1", "1", "100.0"] in rows
+    assert [row for row in rows if row[0] != "MODEL" and row[2] != "finir"] == []
+    assert "Verbs following their model: 5/6 83.3%" in capsys.readouterr().out
+
+
+################################################################################
+@pytest.mark.parametrize("extension, compressor", [(".gz", gzip), (".bz2", bz2), (".xz", lzma)])
+def test_compressed_dictionaries(tmp_path, extension, compressor):
+    """Compressed dictionaries are recognized and loaded as the plain ones"""
+    pathname = str(tmp_path / ("dict-fr-AU-DELA" + extension))
+    with open(DELA_PATH, "rb") as file, compressor.open(pathname, "wb") as compressed_file:
+        compressed_file.write(file.read())
+    assert conjuguer.get_dictionary_compression(pathname)
+    assert conjuguer.detect_dictionary_type(pathname) == "DELA"
+    assert_same_verbs(
+        conjuguer.load_all_verbs_from_dictionary(pathname, "DELA"),
+        conjuguer.load_all_verbs_from_dictionary(DELA_PATH, "DELA")
+    )
+
+
+################################################################################
+def test_block_reindexing(tmp_path, monkeypatch, caplog):
+    """An index updated from the cached blocks is the same as a new one"""
+    # Smaller blocks, so that the extract is split in several of them:
+    monkeypatch.setattr(conjuguer, "INDEX_BLOCK_SIZE", 512)
+    monkeypatch.setattr(conjuguer, "INDEX_BLOCK_BOUNDARY_MASK", 0x3)
+    pathname = str(tmp_path / "dict-fr-AU-DELA")
+    shutil.copyfile(DELA_PATH, pathname)
+    select_dictionary(pathname, "DELA")
+    plain_verbs = conjuguer.load_all_verbs_from_dictionary()
+
+    conjuguer.parameters["Cache directory"] = str(tmp_path / "index")
+    assert_same_verbs(conjuguer.load_all_verbs_from_dictionary(), plain_verbs)
+
+    # An edit near the end of the dictionary only changes the blocks around it:
+    with open(pathname, encoding="utf-8") as file:
+        lines = file.readlines()
+    del lines[-20]
+    lines.insert(-10, "maisonnette,.N+z1:fs\n")
+    with open(pathname, "w", encoding="utf-8") as file:
+        file.writelines(lines)
+    caplog.set_level(logging.DEBUG)
+    verbs = conjuguer.load_all_verbs_from_dictionary()
+    parsed_blocks = [
+        re.search(r"(\d+)/(\d+)", message).groups()
+        for message in caplog.messages
+        if message.startswith("load_verbs_index() parsed blocks")
+    ]
+    assert len(parsed_blocks) == 1
+    assert 0 < int(parsed_blocks[0][0]) < int(parsed_blocks[0][1])
+
+    conjuguer.parameters["Cache directory"] = ""
+    assert_same_verbs(verbs, conjuguer.load_all_verbs_from_dictionary())
+
+
+################################################################################
+def test_suggestions():
+    """Misspelled verbs get the nearest lemmas as suggestions, ignoring case and accents"""
+    lemmas = conjuguer.get_lemmas(conjuguer.load_all_verbs_from_dictionary(), "DELA")
+    lemmas_trie = conjuguer.make_lemmas_trie(lemmas)
+    assert conjuguer.suggest_verbs("aler", lemmas_trie)[0] == "aller"
+    assert "finir" in conjuguer.suggest_verbs("Finnir", lemmas_trie)
+    assert conjuguer.suggest_verbs("naitre", lemmas_trie) == ["naître"]
+    assert conjuguer.suggest_verbs("xyzzyxyzzy", lemmas_trie) == []
+    assert conjuguer.suggest_verbs("aler", lemmas) == conjuguer.suggest_verbs("aler", lemmas_trie)
+    assert len(conjuguer.suggest_verbs("etre", lemmas_trie, max_distance=5, max_results=2)) == 2
+
+
+################################################################################
+def test_attributes_queries(tmp_path, capsys):
+    """Queries combine the attributes bitmaps, kept in the default cache directory"""
+    verbs = conjuguer.load_all_verbs_from_dictionary()
+    attributes_index = conjuguer.build_attributes_index(verbs, "DELA")
+    assert attributes_index["Lemmas"] == sorted(LEMMAS)
+    for query, lemmas in (
+        ("group=3", ["aller", "naître"]),
+        ("group=3 and auxiliary=avoir", []),
+        ("not (group=1 or group=2)", ["aller", "avoir", "naître", "être"]),
+        ("model=finir or model=aimer", ["finir", "monter"]),
+        ("unknown=attribute", []),
+    ):
+        bitmap = conjuguer.evaluate_query(query, attributes_index)
+        assert list(conjuguer.get_bitmap_lemmas(bitmap, attributes_index["Lemmas"])) == lemmas
+    assert conjuguer.evaluate_query("(group=3", attributes_index) is None
+    assert conjuguer.evaluate_query("group=3 and", attributes_index) is None
+
+    assert conjuguer.print_query_results("group=3 and auxiliary=être", verbs)
+    assert capsys.readouterr().out == "aller\nnaître\n"
+    assert not conjuguer.print_query_results("group=3 or", verbs)
+    cached_index = conjuguer.load_attributes_index(verbs)
+    assert cached_index["Path"] == DELA_PATH
+    assert cached_index["Bitmaps"] == attributes_index["Bitmaps"]
+    assert os.listdir(str(tmp_path / "cache" / "conjuguer"))
+
+    conjuguer.parameters["Color display"] = False
+    conjuguer.parameters["Query tables"] = True
+    assert conjuguer.print_query_results("model=naître", verbs)
+    assert "Conjugation tables for naître" in capsys.readouterr().out
+
+
+################################################################################
+@pytest.mark.parametrize("pathname, dictionary_type, forms", [
+    (DELA_PATH, "DELA", 241), (ABU_PATH, "ABU", 247)
+])
+def test_dictionary_statistics(capsys, pathname, dictionary_type, forms):
+    """The dictionary statistics count the lemmas and forms read in a single pass"""
+    select_dictionary(pathname, dictionary_type)
+    conjuguer.print_dictionary_statistics()
+    output = capsys.readouterr().out.splitlines()
+    assert output[0] == "Lemmas: %d" % len(LEMMAS)
+    assert output[1] == "Forms: %d" % forms
+    assert output[output.index("Lemmas per group:") + 1].split() == ["auxiliary", "2"]
+    assert output[output.index("Lemmas per auxiliary:") + 3].split() == ["avoir,", "être", "2"]
+    if dictionary_type == "DELA":
+        assert "    avoir .V+z1 (44), .V (1)" in output
+
+
+################################################################################
+def test_normalization_and_resolution(tmp_path, monkeypatch, capsys):
+    """Verbs are found whatever their case and accents, through a normalized index built once"""
+    assert conjuguer.normalize_verb("Être") == "etre"
+    assert conjuguer.normalize_verb("NAÎTRE") == "naitre"
+    assert conjuguer.normalize_verb("naître") == "naitre"
+
+    verbs = conjuguer.load_all_verbs_from_dictionary()
+    normalized_index = conjuguer.get_verbs_normalized_index(verbs)
+    assert conjuguer.get_verbs_normalized_index(verbs) is normalized_index
+    assert conjuguer.resolve_verb("ETRE", normalized_index) == ["être"]
+    assert conjuguer.resolve_verb("naitre", normalized_index) == ["naître"]
+    assert conjuguer.resolve_verb("xyzzer", normalized_index) == []
+
+    # The normalized index is cached with the verbs index:
+    conjuguer.parameters["Cache directory"] = str(tmp_path / "index")
+    conjuguer.load_all_verbs_from_dictionary()
+    cached_verbs = conjuguer.load_all_verbs_from_dictionary()
+    assert cached_verbs.normalized_index == normalized_index
+
+    # The normalized indexes of the stacked dictionaries are merged:
+    conjuguer.parameters["Dictionaries"] = [DELA_PATH, ABU_PATH]
+    conjuguer.parameters["Merge dictionaries"] = True
+    layers = conjuguer.get_dictionary_layers()
+    assert conjuguer.get_layers_normalized_index(layers) == normalized_index
+
+    status, output = run_main(monkeypatch, capsys, "-n", "--mode", "Infinitif", "NAITRE")
+    assert status == 0
+    assert "naître" in output
+
+
+################################################################################
+def test_dictionary_types():
+    """The extracts are recognized, and only their verbs lines are kept"""
+    assert conjuguer.detect_dictionary_type(DELA_PATH) == "DELA"
+    assert conjuguer.detect_dictionary_type(ABU_PATH) == "ABU"
+    for pathname, dictionary_type in ((DELA_PATH, "DELA"), (ABU_PATH, "ABU")):
+        verbs = conjuguer.load_all_verbs_from_dictionary(pathname, dictionary_type)
+        assert sorted(conjuguer.get_lemmas(verbs, dictionary_type)) == sorted(LEMMAS)
+        assert not [line for line in verbs if "maison" in line]
+
+        # The lines filtered as bytes are the verbs lines found once decoded:
+        with open(pathname, "rb") as file:
+            chunk = file.read()
+        decoded_lines = [
+            conjuguer.get_verb_line(line, dictionary_type)
+            for line in chunk.decode("utf-8").splitlines()
+        ]
+        assert conjuguer.filter_verb_lines(chunk, dictionary_type) \
+            == [line for line in decoded_lines if line is not None]
+
+
+################################################################################
+def test_parallel_loading(tmp_path):
+    """Dictionaries indexed by parallel processes are the same as when loaded at once"""
+    plain_verbs = conjuguer.load_all_verbs_from_dictionary()
+    conjuguer.parameters["Parallel jobs"] = 2
+    assert_same_verbs(conjuguer.load_all_verbs_from_dictionary(), plain_verbs)
+
+    # Compressed dictionaries are split in chunks rather than byte ranges:
+    pathname = str(tmp_path / "dict-fr-AU-DELA.gz")
+    with open(DELA_PATH, "rb") as file, gzip.open(pathname, "wb") as compressed_file:
+        compressed_file.write(file.read())
+    assert_same_verbs(conjuguer.load_all_verbs_from_dictionary(pathname, "DELA"), plain_verbs)
+
+
+################################################################################
+def test_verb_lines_store():
+    """The verbs lines are stored in a single string, and found by lemma with or without index"""
+    with open(DELA_PATH, encoding="utf-8") as file:
+        lines = [line.strip() for line in file if ".V" in line]
+    verbs = conjuguer.VerbLines("DELA", lines[:100])
+    verbs.extend(lines[100:])
+    assert len(verbs) == len(lines)
+    assert list(verbs) == lines
+    assert verbs[0] == lines[0]
+    assert verbs[-1] == lines[-1]
+    with pytest.raises(IndexError):
+        _line = verbs[len(lines)]
+    assert verbs.find_lines("\nfinir,") == ["finir,.V+z1:W"]
+    assert verbs.find_lines(",naître.V+z1:W") == []
+
+    # The lines found without the lemmas table are the same as with it:
+    unindexed_lines = {lemma: verbs.get_lemma_lines(lemma) for lemma in LEMMAS}
+    assert verbs.lemmas is None
+    verbs.index_lemmas()
+    assert verbs.lemmas == sorted(LEMMAS)
+    for lemma in LEMMAS:
+        assert verbs.get_lemma_lines(lemma) == unindexed_lines[lemma]
+        assert verbs.get_lemma_lines(lemma) == [
+            line for line in lines if conjuguer.parse_verb_line(line, "DELA")[1] == lemma
+        ]
+    assert verbs.get_lemma_lines("xyzzer") == []
+
+    # Stores are pickled in the index caches:
+    assert_same_verbs(pickle.loads(pickle.dumps(verbs)), verbs)
+
+
+################################################################################
+def test_inflection_packing_round_trip():
+    """Packed inflections are unpacked into the same cells, whatever the dictionary type"""
+    for tense in range(1, len(conjuguer.PACKED_TENSES)):
+        mode, tense_name = conjuguer.PACKED_TENSES[tense]
+        for person in conjuguer.PACKED_PERSONS:
+            for number in conjuguer.PACKED_NUMBERS:
+                for gender in conjuguer.PACKED_GENDERS:
+                    packed = conjuguer.pack_inflection(tense, person, number, gender)
+                    assert conjuguer.unpack_inflection(packed) \
+                        == (mode, tense_name, person, number, gender)
+
+    # The DELA and ABU codes of a same cell are packed in the same integer:
+    simple_verb = conjuguer.generate_verb_from_model("finir")
+    dela_inflections = conjuguer.get_verb_inflections(simple_verb, "DELA")
+    abu_inflections = conjuguer.get_verb_inflections(simple_verb, "ABU")
+    assert len(dela_inflections) == len(abu_inflections) == 51
+    for dela_inflection, abu_inflection in zip(dela_inflections, abu_inflections):
+        if dela_inflection[1] != "W":
+            assert conjuguer.pack_dela_inflection(dela_inflection[1]) \
+                == conjuguer.pack_abu_inflection(abu_inflection[1]) != 0
+
+
+################################################################################
+@pytest.mark.parametrize("pathname, dictionary_type", [(DELA_PATH, "DELA"), (ABU_PATH, "ABU")])
+def test_verb_lines_packing_round_trip(pathname, dictionary_type):
+    """The verbs filled from packed lines give back the forms of these lines"""
+    select_dictionary(pathname, dictionary_type)
+    verbs = conjuguer.load_all_verbs_from_dictionary()
+    for lemma in LEMMAS:
+        conjugations = conjuguer.select_verb_from_verbs(lemma, verbs)
+        simple_verb = conjuguer.fill_verb_from_packed_data(
+            lemma, conjuguer.pack_verb_lines(conjugations, dictionary_type)
+        )
+        inflections = set(conjuguer.get_verb_inflections(simple_verb, dictionary_type))
+
+        lines_inflections = set()
+        for line in verbs.get_lemma_lines(lemma):
+            form, _lemma, _key, line_inflections = conjuguer.parse_verb_line(line, dictionary_type)
+            lines_inflections |= {(form, inflection) for inflection in line_inflections}
+
+        # A cell keeps one of the variant forms of the lines:
+        assert inflections <= lines_inflections
+        cells = {inflection for _form, inflection in inflections}
+        assert {inflection for _form, inflection in lines_inflections if inflection in cells} \
+            == cells
+        assert simple_verb["Participe"]["Passé"]["s"]["m"]
+
+
+################################################################################
+def test_present_participle_compound_forms():
+    """The ABU gendered present participles don't change the compound forms number"""
+    lines = [
+        "rentrer\trentrer\tVer:Inf",
+        "rentrant\trentrer\tVer:PPre",
+        "rentrant\trentrer\tVer:PPre+Mas+SG",
+        "rentrante\trentrer\tVer:PPre+Fem+SG",
+        "rentrantes\trentrer\tVer:PPre+Fem+PL",
+        "rentrants\trentrer\tVer:PPre+Mas+PL",
+        "rentré\trentrer\tVer:PPas",
+        "rentré\trentrer\tVer:PPas+Mas+SG",
+        "rentrée\trentrer\tVer:PPas+Fem+SG",
+        "rentrées\trentrer\tVer:PPas+Fem+PL",
+        "rentrés\trentrer\tVer:PPas+Mas+PL",
+    ]
+    conjugated_verbs = conjuguer.get_conjugated_verbs("rentrer", lines, "ABU")
+    assert len(conjugated_verbs) == 1
+    assert conjugated_verbs[0]["Participe"]["Passé"]["a"] == "étant rentré"
+    assert conjugated_verbs[0]["Gérondif"]["Passé"] == "étant rentré"
+    assert conjugated_verbs[0]["Participe"]["Passé"]["p"]["m"] == "rentrés"
+
+
+################################################################################
+def test_missing_past_participle_warning(caplog):
+    """A verb without past participle is reported once, whatever its auxiliaries"""
+    verbs = conjuguer.load_all_verbs_from_dictionary()
+    conjugations = [
+        line for line in conjuguer.select_verb_from_verbs("monter", verbs) if ":K" not in line
+    ]
+    conjugated_verbs = conjuguer.get_conjugated_verbs("monter", conjugations)
+    assert len(conjugated_verbs) == 2
+    assert [
+        message for message in caplog.messages if message.startswith("Infinitif passé not found")
+    ] == ["Infinitif passé not found for monter"]
+
+
+################################################################################
+def test_bloom_filter_has_no_false_negatives(tmp_path, monkeypatch):
+    """The lemmas of a Bloom filter are found in it, and its hits confirmed without the dictionary"""
+    lemmas = ["verbe%d" % i for i in range(5000)] + LEMMAS
+    bloom_filter = {"Bits": conjuguer.build_bloom_filter(lemmas)}
+    assert all(conjuguer.bloom_filter_contains(bloom_filter, lemma) for lemma in lemmas)
+
+    # The filter of the dictionary is kept in the default cache directory, with its lemmas:
+    conjuguer.load_bloom_filter()
+    assert len(os.listdir(str(tmp_path / "cache" / "conjuguer"))) == 2
+    bloom_filter = conjuguer.load_bloom_filter()
+    assert "Lemmas" not in bloom_filter
+    monkeypatch.setattr(conjuguer, "load_all_verbs_from_dictionary", None)
+    assert all(conjuguer.verb_exists(lemma, bloom_filter) for lemma in LEMMAS)
+    assert bloom_filter["Lemmas"] == set(LEMMAS)
+    assert not conjuguer.verb_exists("xyzzer", bloom_filter)
+    assert not conjuguer.verb_exists("Aller", bloom_filter)
+
+
+################################################################################
+def test_point_queries(tmp_path):
+    """Single cells are conjugated without the whole tables, with each auxiliary of the verb"""
+    assert conjuguer.get_cells("Indicatif", "Présent", "1", "s") \
+        == [("Indicatif", "Présent", "s", "1")]
+    assert len(conjuguer.get_cells("Indicatif", "Présent")) == 6
+    assert conjuguer.get_cells("Participe", "Passé", "f") \
+        == [("Participe", "Passé", "s", "f"), ("Participe", "Passé", "p", "f")]
+    assert conjuguer.get_cells("Infinitif") == [("Infinitif", "Présent"), ("Infinitif", "Passé")]
+    assert conjuguer.get_cells("Indicatif", "Futur") == []
+
+    # The forms are those of the full conjugation tables:
+    verbs = conjuguer.load_all_verbs_from_dictionary()
+    for lemma in LEMMAS:
+        conjugations = conjuguer.select_verb_from_verbs(lemma, verbs)
+        conjugated_verb = conjuguer.get_conjugated_verbs(lemma, conjugations)[0]
+        cells = conjuguer.get_cells()
+        assert conjuguer.get_cells_forms(lemma, conjugations, cells) \
+            == conjuguer.get_verb_cells(conjugated_verb, cells)
+
+    assert conjuguer.conjugate_cell("monter", "Indicatif", "Passé composé", "1", "s", verbs) \
+        == ["suis monté", "ai monté"]
+    assert conjuguer.conjugate_cell("finir", "Indicatif", "Présent", "1", "p", verbs) \
+        == ["finissons", "finissons"]
+    assert conjuguer.conjugate_cell(
+        "monter", "Participe", "Passé", verbs=verbs, auxiliary="avoir"
+    ) == ["monté"]
+    assert conjuguer.conjugate_cell("xyzzer", "Indicatif", "Présent", verbs=verbs) == []
+    assert conjuguer.conjugate_cell("aller", "Indicatif", "Futur", verbs=verbs) == []
+
+    # Without verbs, they're searched in the dictionaries stack:
+    pathname = str(tmp_path / "dict-fr-AU-DELA")
+    with open(DELA_PATH, encoding="utf-8") as file:
+        lines = [line for line in file if not line.startswith("all") and ",aller." not in line]
+    with open(pathname, "w", encoding="utf-8") as file:
+        file.writelines(lines)
+    select_dictionary(pathname, "DELA")
+    conjuguer.parameters["Dictionaries"] = [pathname, ABU_PATH]
+    assert conjuguer.conjugate_cell("aller", "Subjonctif", "Passé", "3", "p") \
+        == ["soient allés"]
+    assert conjuguer.conjugate_cell("avoir", "Indicatif", "Présent", "3", "s") == ["a"]
+
+
+################################################################################
+def test_rendered_output_cache(tmp_path, monkeypatch, capsys):
+    """Rendered outputs are cached, and the least recently used are evicted"""
+    # The cached output is the same as the rendered one, but not for verbs with warnings:
+    cache = str(tmp_path / "cache")
+    status, output = run_main(monkeypatch, capsys, "-n", "--cache", cache, "finir", "xyzzer")
+    assert status == 1
+    assert len(os.listdir(os.path.join(cache, "render"))) == 1
+    assert run_main(monkeypatch, capsys, "-n", "--cache", cache, "finir", "xyzzer") \
+        == (status, output)
+    assert len(os.listdir(os.path.join(cache, "render"))) == 1
+
+    conjuguer.parameters["Cache directory"] = str(tmp_path / "index")
+    assert conjuguer.load_rendered_output("aller") is None
+    monkeypatch.setattr(conjuguer, "RENDER_CACHE_MAX_SIZE", 330)
+    for i, lemma in enumerate(["aller", "finir", "monter"]):
+        conjuguer.save_rendered_output(lemma, lemma.encode("utf-8") * 20)
+        os.utime(conjuguer.get_render_cache_path(lemma), (1000000 + i, 1000000 + i))
+    assert conjuguer.load_rendered_output("aller") == b"aller" * 20
+
+    # Reading aller made finir the least recently used one:
+    conjuguer.save_rendered_output("naître", "naître".encode("utf-8") * 20)
+    assert conjuguer.load_rendered_output("finir") is None
+    assert conjuguer.load_rendered_output("monter") is None
+    assert conjuguer.load_rendered_output("aller") == b"aller" * 20
+    assert conjuguer.load_rendered_output("naître") == "naître".encode("utf-8") * 20
+
+
+################################################################################
+def test_site_incremental_update(tmp_path, capsys):
+    """Only the site pages whose source changed are written again"""
+    pathname = str(tmp_path / "dict-fr-AU-DELA")
+    shutil.copyfile(DELA_PATH, pathname)
+    select_dictionary(pathname, "DELA")
+    directory = str(tmp_path / "site")
+    assert conjuguer.make_site(directory, conjuguer.load_all_verbs_from_dictionary())
+    assert capsys.readouterr().out == "Pages written: 19/19\n"
+    assert os.path.isfile(os.path.join(directory, "verb-naître.html"))
+    assert conjuguer.make_site(directory, conjuguer.load_all_verbs_from_dictionary())
+    assert capsys.readouterr().out == "Pages written: 0/19\n"
+
+    # Removed pages are written again:
+    os.remove(os.path.join(directory, "verb-aller.html"))
+    assert conjuguer.make_site(directory, conjuguer.load_all_verbs_from_dictionary())
+    assert capsys.readouterr().out == "Pages written: 1/19\n"
+
+    # Changed verbs pages are written again, and those of the verbs removed deleted:
+    with open(pathname, encoding="utf-8") as file:
+        lines = [line.replace("finira,", "finiera,") for line in file if "naître" not in line]
+    with open(pathname, "w", encoding="utf-8") as file:
+        file.writelines(lines)
+    assert conjuguer.make_site(directory, conjuguer.load_all_verbs_from_dictionary())
+    assert capsys.readouterr().out == "Pages written: 2/16\n"
+    with open(os.path.join(directory, "verb-finir.html"), encoding="utf-8") as file:
+        assert "finiera" in file.read()
+    assert not os.path.exists(os.path.join(directory, "verb-naître.html"))
+    assert not os.path.exists(os.path.join(directory, "model-naître.html"))
+
+
+################################################################################
+@pytest.mark.parametrize("filename, delimiter", [
+    ("forms.tsv", "\t"), ("forms.csv", ","), ("forms.tsv.gz", "\t"), ("forms.csv.gz", ",")
+])
+def test_paradigms_export(tmp_path, capsys, filename, delimiter):
+    """All the verbs forms are exported one per row, in the format given by the file suffixes"""
+    pathname = str(tmp_path / filename)
+    assert conjuguer.export_paradigms(pathname, conjuguer.load_all_verbs_from_dictionary())
+    open_function = gzip.open if filename.endswith(".gz") else open
+    with open_function(pathname, "rt", encoding="utf-8", newline="") as file:
+        rows = list(csv.reader(file, delimiter=delimiter))
+    assert rows[0] == conjuguer.EXPORT_COLUMNS
+    assert capsys.readouterr().out == "Rows written: %d\n" % (len(rows) - 1)
+    assert sorted({row[0] for row in rows[1:]}) == sorted(LEMMAS)
+    assert ["finir", "être", "2", "finir", "Indicatif", "Présent", "1", "p", "", "finissons"] \
+        in rows
+    assert ["monter", "avoir", "1", "aimer", "Indicatif", "Passé composé", "1", "s", "", "ai monté"] \
+        in rows
+    assert ["monter", "être", "1", "aimer", "Participe", "Passé", "", "s", "f", "montée"] in rows
+
+    # The simple tenses are only given with the first auxiliary:
+    assert not [
+        row for row in rows if row[0] == "monter" and row[1] == "avoir" and row[5] == "Présent"
+    ]
+
+
+################################################################################
+def test_coprocess_responses():
+    """Coprocess requests are answered with conjugations, cells, suggestions or errors"""
+    conjuguer.parameters["Dictionaries"] = [DELA_PATH, ABU_PATH]
+    layers = conjuguer.get_dictionary_layers()
+    normalized_index, lemmas_trie = conjuguer.index_dictionary_layers(layers)
+
+    def respond(request):
+        # Responses are written as JSON:
+        response = conjuguer.get_coprocess_response(
+            request, layers, normalized_index, lemmas_trie
+        )
+        return json.loads(json.dumps(response, ensure_ascii=False))
+
+    response = respond({"id": 7, "verb": "ETRE", "format": "json"})
+    assert response["id"] == 7
+    assert response["verb"] == "être"
+    assert response["dictionary"] == DELA_PATH
+    assert response["conjugations"][0]["tenses"]["Indicatif"]["Présent"]["s"]["1"] == "suis"
+
+    response = respond({"verb": "finir", "format": "json", "mode": "indicatif", "tense": "présent"})
+    assert [cell["form"] for cell in response["cells"]] \
+        == ["finis", "finis", "finit", "finissons", "finissez", "finissent"]
+
+    response = respond({"verb": "aller", "columns": 1})
+    assert response["output"].startswith("Conjugation tables for aller")
+    assert "\x1b[" not in response["output"]
+    assert "\x1b[" in respond({"verb": "aller", "color": True})["output"]
+
+    response = respond({"verb": "aler"})
+    assert "error" in response
+    assert "aller" in response["suggestions"]
+    assert "error" in respond({"verb": "aller", "columns": True})
+    assert "error" in respond({"verb": "aller", "columns": 3})
+    assert "error" in respond({"verb": "aller", "format": "xml"})
+    assert "error" in respond({"verb": ""})
+    assert "error" in respond(["aller"])
+
+
+################################################################################
+def test_coprocess_protocol(monkeypatch, capsys):
+    """A JSON response line is written in UTF-8 for each request line read"""
+    requests = [
+        json.dumps(
+            {"id": 1, "verb": "naître", "format": "json", "mode": "Infinitif"}, ensure_ascii=False
+        ),
+        "",
+        "{not json",
+        json.dumps({"id": 2, "verb": "xyzzer"}),
+    ]
+    standard_input = io.TextIOWrapper(io.BytesIO("\n".join(requests).encode("utf-8") + b"\n"))
+    monkeypatch.setattr(sys, "stdin", standard_input)
+    status, output = run_main(monkeypatch, capsys, "--coprocess")
+    assert status == 0
+    responses = [json.loads(line) for line in output.splitlines()]
+    assert len(responses) == 3
+    assert responses[0]["id"] == 1
+    assert [cell["form"] for cell in responses[0]["cells"]] == ["naître", "être né"]
+    assert responses[1]["error"].startswith("Invalid JSON request")
+    assert responses[2]["id"] == 2
+    assert "error" in responses[2]
+
+
+################################################################################
+def test_wsgi_application(tmp_path, monkeypatch):
+    """The WSGI application answers with the verbs of the dictionaries found in DICTPATH"""
+    conjuguer.parameters["Dictionaries"] = []
+    sys.modules.pop("conjuguer.wsgi", None)
+    wsgi = importlib.import_module("conjuguer.wsgi")
+
+    def request(path, query=""):
+        statuses = []
+        body = b"".join(wsgi.application(
+            {"PATH_INFO": path, "QUERY_STRING": query},
+            lambda status, headers: statuses.append(status)
+        ))
+        return statuses[0], json.loads(body.decode("utf-8"))
+
+    status, document = request("/aller")
+    assert status == "200 OK"
+    assert document["dictionary"] == DELA_PATH
+    assert document["conjugations"][0]["tenses"]["Indicatif"]["Présent"]["s"]["1"] == "vais"
+
+    # WSGI servers decode the path as ISO-8859-1:
+    status, document = request("/naître".encode("utf-8").decode("latin-1"))
+    assert status == "200 OK"
+    assert document["verb"] == "naître"
+
+    status, document = request("", "verb=Etre")
+    assert status == "200 OK"
+    assert document["verb"] == "être"
+
+    status, document = request("/aler")
+    assert status == "404 Not Found"
+    assert "aller" in document["suggestions"]
+
+    status, document = request("/")
+    assert status == "400 Bad Request"
+
+    # The lack of dictionaries is reported to the server importing the application:
+    conjuguer.parameters.clear()
+    conjuguer.parameters.update(copy.deepcopy(INITIAL_PARAMETERS))
+    monkeypatch.setenv("DICTPATH", str(tmp_path))
+    sys.modules.pop("conjuguer.wsgi", None)
+    with pytest.raises(RuntimeError):
+        importlib.import_module("conjuguer.wsgi")
+
+
+################################################################################
+def test_interactive_prompt(monkeypatch, capsys, caplog):
+    """The verbs and commands typed are processed with the dictionaries loaded once"""
+    commands = ["Etre", ":columns 3", ":format dela", "aller", ":color on", ":unknown", ":quit"]
+    monkeypatch.setattr(sys, "stdin", io.StringIO("\n".join(commands) + "\n"))
+    status, output = run_main(monkeypatch, capsys, "-n", "-i")
+    assert status == 0
+    assert "Conjugation tables for être" in output
+    assert "vais,aller.V:P1s" in output
+    assert caplog.messages == ["Expecting 1, 2 or 4 columns", "Unknown command: :unknown"]
+
+
+################################################################################
+def test_shell_completion(tmp_path, monkeypatch, capsys):
+    """Check the completions file is kept in the cache directory and searched by bisection,
+    without loading the dictionaries nor the rest of the program when it's up to date"""
+    complete = importlib.import_module("conjuguer.complete")
+    pathname = str(tmp_path / "cache" / "conjuguer" / "conjuguer_completions")
+    os.mkdir(str(tmp_path / "dict"))
+    dictionary = shutil.copy(DELA_PATH, str(tmp_path / "dict"))
+    monkeypatch.setenv("DICTPATH", str(tmp_path / "dict"))
+
+    # The first completion loads the dictionaries and writes the completions file:
+    assert run_main(monkeypatch, capsys, "--complete", "a") == (0, "aller\navoir\n")
+    assert complete.get_completions_path(conjuguer.get_cache_directory()) == pathname
+    assert os.path.isfile(pathname)
+    assert not os.path.exists(str(tmp_path / ".conjuguer_completions"))
+
+    # The next ones only bisect it, matching lemmas whatever their case and accents:
+    completions = complete.load_completions(pathname)
+    assert completions == sorted(completions)
+    monkeypatch.setattr(conjuguer, "load_dictionary_layer", None)
+    assert run_main(monkeypatch, capsys, "--complete=av") == (0, "avoir\n")
+    assert run_main(monkeypatch, capsys, "--complete", "ETR") == (0, "être\n")
+    assert run_main(monkeypatch, capsys, "--complete", "nai") == (0, "naître\n")
+    assert run_main(monkeypatch, capsys, "--complete", "z") == (0, "")
+
+    # The CONJUGUER_CACHE environment variable gives the cache directory:
+    monkeypatch.setenv("CONJUGUER_CACHE", str(tmp_path / "other"))
+    monkeypatch.setattr(sys, "argv", ["conjuguer", "--complete", "a"])
+    assert not complete.print_cached_completions()
+    monkeypatch.delenv("CONJUGUER_CACHE")
+    assert complete.print_cached_completions()
+    assert capsys.readouterr().out == "aller\navoir\n"
+
+    # The completions file is out of date when a dictionary changes:
+    os.utime(dictionary, (0, 0))
+    assert complete.load_completions(pathname) is None
+
+    # The completions of the interactive mode use the sorted lemmas and normalized keys:
+    normalized_index = {conjuguer.normalize_verb(lemma): [lemma] for lemma in LEMMAS}
+    normalized_keys = sorted(normalized_index)
+    assert conjuguer.get_completions("a", LEMMAS) == ["aller", "avoir"]
+    assert conjuguer.get_completions("ê", LEMMAS, normalized_keys, normalized_index) == ["être"]
+    assert conjuguer.get_completions("et", LEMMAS, normalized_keys, normalized_index) == ["être"]
+    assert conjuguer.get_completions("x", LEMMAS, normalized_keys, normalized_index) == []
+
+
+################################################################################
+def test_shell_completion_imports(tmp_path):
+    """Check an up to date completions file is used without importing the rest of the program"""
+    source_directory = os.path.join(os.path.dirname(DATA_DIRECTORY), os.pardir, "src")
+    environment = dict(os.environ)
+    environment.update({
+        "PYTHONPATH": os.path.abspath(source_directory),
+        "HOME": str(tmp_path),
+        "XDG_CACHE_HOME": str(tmp_path / "cache"),
+        "DICTPATH": DATA_DIRECTORY,
+    })
+    environment.pop("CONJUGUER_DICT", None)
+    environment.pop("CONJUGUER_CACHE", None)
+    script = "import sys; import conjuguer; print(sorted(sys.modules)); conjuguer.main()"
+
+    modules = []
+    for _ in range(2):
+        process = subprocess.run(
+            [sys.executable, "-c", script, "--complete", "av"],
+            env=environment,
+            stdout=subprocess.PIPE,
+            check=False,
+        )
+        assert process.returncode == 0
+        output = process.stdout.decode("utf-8").splitlines()
+        assert output[1:] == ["avoir"]
+        modules.append(output[0])
+
+    # The first completion writes the completions file, used by the second one:
+    assert os.path.isfile(str(tmp_path / "cache" / "conjuguer" / "conjuguer_completions"))
+    assert "'conjuguer.main'" not in modules[1]
+    assert "'colorama'" not in modules[1]
+    assert "'multiprocessing'" not in modules[1]